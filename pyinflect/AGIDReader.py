@@ -1,4 +1,5 @@
 import re
+from   .CompactStore import CompactStore
 
 
 class AGIDReader(object):
@@ -19,21 +20,27 @@ class AGIDReader(object):
     #   adjective or adverbs: <-er form> <-est form>
     #   nouns: <plural>
     #   see readme for special cases for be and wit
-    def save(self, fn):
+    def save(self, fn, compact=False):
         ''' Save the parsed data in .csv format
 
         Args:
             fn (str): The output filename (ie.. "pyinflect/infl.csv")
+            compact (bool): If True, save in the compact format used by CompactStore
         '''
         if not fn.endswith('.csv'):
             fn += '.csv'
+        # for verbs with 3 fields, always write 4 fields,
+        #   even if optional <past part> isn't there
+        for (word, pos), forms in self.data.items():
+            if pos=='V' and len(forms)==3:
+                forms.insert(1, ('<>',))
+        if compact:
+            entries = [(word, pos, forms) for (word, pos), forms in sorted(self.data.items())]
+            CompactStore.writeFile(fn, entries)
+            return
         with open(fn, 'w') as f:
             for (word, pos), forms in sorted(self.data.items()):
                 f.write('%s,%s,' % (word, pos))
-                # for verbs with 3 fields, always write 4 fields,
-                #   even if optional <past part> isn't there
-                if pos=='V' and len(forms)==3:
-                    forms.insert(1, ('<>',))
                 for i, form in enumerate(forms):
                     # Convert the "form" tuple to a string separated with /
                     string = '/'.join(form)
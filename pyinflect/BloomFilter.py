@@ -0,0 +1,74 @@
+import hashlib
+import math
+import struct
+
+
+class BloomFilter(object):
+    ''' Compact probabilistic set membership filter
+
+    A "not in" answer is always correct while an "in" answer may be a false positive at roughly
+    the error_rate used to create it.  This is used to reject lookups for words that aren't in
+    the data before doing anything more expensive (ie.. a database query).
+
+    Args:
+        num_bits (int): Size of the bit array
+        num_hashes (int): Number of hash functions (bits set) per item
+        bits (bytearray): Optional.  Existing bit array (ie.. from fromBytes)
+    '''
+    header_fmt = '<QI'
+
+    def __init__(self, num_bits, num_hashes, bits=None):
+        self.num_bits   = num_bits
+        self.num_hashes = num_hashes
+        self.bits       = bits if bits is not None else bytearray((num_bits + 7) // 8)
+
+    @classmethod
+    def fromItems(cls, items, error_rate=0.01):
+        ''' Create a filter sized for the given items and add them
+
+        Args:
+            items (list): The strings to add
+            error_rate (float): The desired false positive rate
+
+        Returns: a new BloomFilter
+        '''
+        items = list(items)
+        n = max(len(items), 1)
+        num_bits   = int(math.ceil(-n * math.log(error_rate) / (math.log(2) ** 2)))
+        num_hashes = max(1, int(round(num_bits / float(n) * math.log(2))))
+        bloom = cls(num_bits, num_hashes)
+        for item in items:
+            bloom.add(item)
+        return bloom
+
+    @classmethod
+    def fromBytes(cls, data):
+        ''' Create a filter from the output of toBytes '''
+        num_bits, num_hashes = struct.unpack_from(cls.header_fmt, data)
+        return cls(num_bits, num_hashes, bytearray(data[struct.calcsize(cls.header_fmt):]))
+
+    def toBytes(self):
+        ''' Serialize the filter to bytes '''
+        return struct.pack(self.header_fmt, self.num_bits, self.num_hashes) + bytes(self.bits)
+
+    def add(self, item):
+        ''' Add a string to the filter '''
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item):
+        bits = self.bits
+        for pos in self._positions(item):
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    #######################################################
+    ### Private Methods                                 ###
+    #######################################################
+
+    # Bit positions for the item using double hashing from a single 128 bit digest
+    def _positions(self, item):
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1, h2 = struct.unpack('<QQ', digest)
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
@@ -0,0 +1,159 @@
+import json
+import time
+import queue
+import socket
+import threading
+import http.client
+from   urllib.parse import urlparse
+
+
+class Client(object):
+    ''' Client for the inflection server (see Server.py)
+
+    Connections are kept open (HTTP keep-alive) in a pool so threads can make requests at the
+    same time without reconnecting.  Calls to getInflection from different threads are coalesced,
+    the first caller waits coalesce_delay seconds for others to join and then sends them all in
+    one batch request.
+
+    Args:
+        address (str): The server's URL (ie.. 'http://127.0.0.1:8765') or the path of its Unix
+            socket (ie.. '/tmp/pyinflect.sock' or 'unix:/tmp/pyinflect.sock')
+        pool_size (int): Optional.  The most connections to keep open
+        timeout (float): Optional.  Socket timeout in seconds
+        coalesce_delay (float): Optional.  Seconds to wait for other calls to join a batch
+        max_batch (int): Optional.  The most pairs to send in one request
+    '''
+    def __init__(self, address='http://127.0.0.1:8765', pool_size=8, timeout=10.0,
+                 coalesce_delay=0.001, max_batch=1000):
+        if address.startswith('unix:'):
+            address = address[5:]
+        if address.startswith('/'):
+            self.unix_socket, self.host, self.port = address, 'localhost', None
+        else:
+            url = urlparse(address if '://' in address else 'http://' + address)
+            self.unix_socket, self.host, self.port = None, url.hostname, url.port or 80
+        self.timeout        = timeout
+        self.coalesce_delay = coalesce_delay
+        self.max_batch      = max_batch
+        self.pool = queue.LifoQueue(pool_size)
+        self.lock = threading.Lock()
+        self.pending = {}    # (inflect_oov, fuzzy) -> list of [lemma, tag, event, result, error]
+
+    def getInflections(self, requests, inflect_oov=False, fuzzy=False):
+        ''' Get the inflections for a batch of (lemma, tag) pairs
+
+        Args:
+            requests (iterable): (lemma, tag) pairs
+            inflect_oov (bool): If True, the server uses the inflection rules for unknown words
+            fuzzy (bool): If True and a lemma isn't in the data, the closest lemma is used
+
+        Returns: a list with a tuple of the forms (or None) for each pair, the same as
+            Inflections.getInflections
+        '''
+        requests = [list(r) for r in requests]
+        results = []
+        for i in range(0, len(requests), self.max_batch):
+            data = self.request('POST', '/inflect', {'requests':requests[i:i+self.max_batch],
+                                                     'inflect_oov':inflect_oov, 'fuzzy':fuzzy})
+            results.extend(tuple(r) if r else None for r in data['results'])
+        return results
+
+    def getInflection(self, lemma, tag, inflect_oov=False, fuzzy=False):
+        ''' Get the inflections for a lemma and tag.  Calls from other threads are batched.
+
+        Returns: a tuple of the forms or None, the same as Inflections.getInflection
+        '''
+        item = [lemma, tag, threading.Event(), None, None]
+        key = (inflect_oov, fuzzy)
+        with self.lock:
+            batch = self.pending.setdefault(key, [])
+            batch.append(item)
+            leader = len(batch) == 1
+        if not leader:
+            item[2].wait()
+        else:
+            if self.coalesce_delay:
+                time.sleep(self.coalesce_delay)
+            with self.lock:
+                batch = self.pending.pop(key)
+            try:
+                results = self.getInflections([(x[0], x[1]) for x in batch], inflect_oov, fuzzy)
+                for x, result in zip(batch, results):
+                    x[3] = result
+            except Exception as e:  # pass the error to all the callers
+                for x in batch:
+                    x[4] = e
+            finally:
+                for x in batch:
+                    x[2].set()
+        if item[4] is not None:
+            raise item[4]
+        return item[3]
+
+    def health(self):
+        ''' Get the server status.  Returns a dictionary with the status and pyinflect version. '''
+        return self.request('GET', '/health')
+
+    def request(self, method, path, data=None):
+        ''' Send a request on a pooled connection and return the decoded JSON response
+
+        Raises: IOError if the server returns an error
+        '''
+        body = json.dumps(data).encode('utf-8') if data is not None else None
+        headers = {'Content-Type':'application/json'} if body is not None else {}
+        # A kept-alive connection may have been closed by the server, so retry once
+        for attempt in range(2):
+            conn = self._getConnection()
+            try:
+                conn.request(method, path, body, headers)
+                response = conn.getresponse()
+                content = response.read()
+            except (http.client.HTTPException, OSError):
+                conn.close()
+                if attempt:
+                    raise
+                continue
+            self._releaseConnection(conn)
+            if response.status != 200:
+                raise IOError('Inflection server error %d: %s' % (response.status,
+                              content.decode('utf-8', 'replace')))
+            return json.loads(content)
+
+    def close(self):
+        ''' Close the pooled connections '''
+        while True:
+            try:
+                self.pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+    #######################################################
+    ### Private Methods                                 ###
+    #######################################################
+
+    def _getConnection(self):
+        try:
+            return self.pool.get_nowait()
+        except queue.Empty:
+            pass
+        if self.unix_socket:
+            return UnixHTTPConnection(self.unix_socket, self.timeout)
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def _releaseConnection(self, conn):
+        try:
+            self.pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    ''' HTTP connection over a Unix socket '''
+    def __init__(self, path, timeout=10.0):
+        http.client.HTTPConnection.__init__(self, 'localhost', timeout=timeout)
+        self.socket_path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
@@ -0,0 +1,186 @@
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+from . import Paradigms
+
+
+class CompactStore(Mapping):
+    ''' Low-memory inflection store that creates forms from paradigm codes as needed
+
+    This class is a drop-in replacement for the dictionary normally created by
+    Inflections._loadInflections.  The compact data file has the same lines as infl.csv, except
+    that entries the inflection rules can reproduce are stored as a paradigm code (see
+    Paradigms.py), ie.. "aah,V,=R", and the other forms are stored as the number of characters
+    to strip from the end of the lemma followed by the suffix to append, ie.. "aardwolf,N,1ves".
+    Only the raw string for each lemma is held in memory and it's converted to the dictionary of
+    treebank tags and forms when the lemma is looked up.  Use "create" to generate the file from
+    infl.csv or AGIDReader.save(fn, compact=True) to create it from the raw AGID data.
+
+    Args:
+        fn (str): filename of the compact data file
+        pos_types (set): Optional.  Only load entries for these pos_types ('V', 'A' and/or 'N')
+    '''
+    header = '#pyinflect-compact 2'
+    # Version 1 files stored the irregular forms in full and are still readable
+    header_prefix = '#pyinflect-compact'
+    # Shared table of decoded "strip/suffix" strings.  There are only a few hundred distinct
+    # ones in the data so each is only parsed once.
+    suffix_table = {}
+
+    def __init__(self, fn, pos_types=None):
+        # Import here to avoid a circular import.  Inflections imports this module.
+        from .Inflections import Inflections
+        self.fn = fn
+        self.entries = self._load(fn, pos_types)
+        self.loadInflLine = Inflections._loadInflLineToDict  # resolved once for get()
+
+    @classmethod
+    def create(cls, out_fn, infl_fn):
+        ''' Create the compact data file from infl.csv
+
+        Args:
+            out_fn (str): The output filename
+            infl_fn (str): filename of the AGID simplified CSV file (infl.csv)
+        '''
+        with open(infl_fn) as f:
+            rows = [line.strip().split(',') for line in f]
+        entries = [(x[0], x[1], [tuple(f.split('/')) for f in x[2:]]) for x in rows]
+        cls.writeFile(out_fn, entries)
+
+    @classmethod
+    def writeFile(cls, fn, entries):
+        ''' Write a compact file from a list of AGID entries
+
+        Args:
+            fn (str): The output filename
+            entries (list): A list of (lemma, pos_type, forms) where forms is a list of tuples,
+                in the infl.csv order
+        '''
+        with open(fn, 'w') as f:
+            f.write(cls.header + '\n')
+            for lemma, pos_type, forms in entries:
+                f.write(cls.encodeEntry(lemma, pos_type, forms) + '\n')
+
+    @classmethod
+    def isCompactFile(cls, fn):
+        ''' Return True if the file is in the compact format '''
+        with open(fn) as f:
+            return f.readline().startswith(cls.header_prefix)
+
+    @classmethod
+    def encodeEntry(cls, lemma, pos_type, forms):
+        ''' Convert an entry to a line of the compact file (without the newline)
+
+        Args:
+            lemma (str): The lemma
+            pos_type (str): 'V', 'A' or 'N'
+            forms (list): The forms as a list of tuples, in the infl.csv order
+        '''
+        code = Paradigms.classify(lemma, pos_type, forms)
+        if code is not None:
+            return '%s,%s,=%s' % (lemma, pos_type, code)
+        string = ','.join('/'.join(cls.encodeForm(lemma, s) for s in f) for f in forms)
+        return '%s,%s,%s' % (lemma, pos_type, string)
+
+    @classmethod
+    def decodeEntry(cls, lemma, pos_type, string):
+        ''' Convert the data part of a compact line to the list of forms
+
+        Args:
+            lemma (str): The lemma
+            pos_type (str): 'V', 'A' or 'N'
+            string (str): The part of the line after the pos_type
+
+        Returns: the forms as a list of tuples, in the infl.csv order
+        '''
+        if string.startswith('='):
+            return Paradigms.expand(lemma, pos_type, string[1:])
+        return [tuple(cls.decodeForm(lemma, s) for s in f.split('/')) for f in string.split(',')]
+
+    @staticmethod
+    def encodeForm(lemma, form):
+        ''' Encode a form as the number of characters to strip from the lemma plus a suffix
+
+        Args:
+            lemma (str): The lemma
+            form (str): The inflected form (forms never contain digits)
+
+        Returns: the encoded string, ie.. ("aardwolf", "aardwolves") -> "1ves"
+        '''
+        if form == '<>':
+            return form
+        common = 0
+        max_common = min(len(lemma), len(form))
+        while common < max_common and lemma[common] == form[common]:
+            common += 1
+        return '%d%s' % (len(lemma) - common, form[common:])
+
+    @classmethod
+    def decodeForm(cls, lemma, string):
+        ''' Decode a form from encodeForm.  Strings not starting with a digit are returned as is.
+
+        Args:
+            lemma (str): The lemma
+            string (str): The encoded form
+
+        Returns: the inflected form
+        '''
+        if not string or not string[0].isdigit():
+            return string
+        entry = cls.suffix_table.get(string)
+        if entry is None:
+            i = 1
+            while i < len(string) and string[i].isdigit():
+                i += 1
+            entry = cls.suffix_table[string] = (int(string[:i]), string[i:])
+        strip, suffix = entry
+        return (lemma[:-strip] if strip else lemma) + suffix
+
+    def get(self, lemma, default=None):
+        entry = self.entries.get(lemma)
+        if entry is None:
+            return default
+        data = {}
+        for part in entry.split('|'):
+            pos_type, string = part.split(',', 1)
+            forms = self.decodeEntry(lemma, pos_type, string)
+            data = self.loadInflLine(data, lemma, pos_type, forms)
+        return data[lemma]
+
+    def __getitem__(self, lemma):
+        forms = self.get(lemma)
+        if forms is None:
+            raise KeyError(lemma)
+        return forms
+
+    def __contains__(self, lemma):
+        return lemma in self.entries
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __len__(self):
+        return len(self.entries)
+
+    #######################################################
+    ### Private Methods                                 ###
+    #######################################################
+
+    # Load the file into a dictionary of lemma to its raw "pos,data" string(s).  Lemmas
+    # with more than one pos_type have the strings joined with |
+    @classmethod
+    def _load(cls, fn, pos_types=None):
+        entries = {}
+        with open(fn) as f:
+            if not f.readline().startswith(cls.header_prefix):
+                raise ValueError('Not a compact inflection file: %s' % fn)
+            for line in f:
+                lemma, rest = line.strip().split(',', 1)
+                if pos_types and rest[0] not in pos_types:
+                    continue
+                if lemma in entries:
+                    entries[lemma] += '|' + rest
+                else:
+                    entries[lemma] = rest
+        return entries
@@ -0,0 +1,213 @@
+import sys
+import json
+import time
+import argparse
+from   collections import Counter
+# Make this usable outside of Spacy
+try:
+    import spacy
+except ImportError:
+    pass
+
+
+class CorpusHarness(object):
+    ''' Class for measuring inflection accuracy and speed on a text corpus
+
+    The text is tagged and lemmatized with spaCy and every noun, verb, adjective and adverb is
+    re-inflected from its lemma with its own tag.  The result should be the original word.  The
+    report has the accuracy, the rate of None returns, a count of each error category, the most
+    common errors, tokens/sec and the time spent in each stage, so runs can be compared between
+    releases or engine backends (ie.. infl.csv vs infl.db).
+
+    Error categories are...
+        none_unknown : None returned because the lemma isn't in the data
+        none_tag     : None returned because the lemma doesn't have the tag
+        alt_form     : The word is one of the other forms for the tag (ie.. travelled vs traveled)
+        case         : The word only differs in capitalization
+        wrong_form   : Any other difference
+
+    Args:
+        engine (Inflections): Optional.  The inflection engine.  Default is pyinflect's.
+        inflect_oov (bool): Optional.  If True, the inflection rules are used for unknown lemmas.
+        max_examples (int): Optional.  The number of most common errors to include in the report.
+    '''
+    def __init__(self, engine=None, inflect_oov=False, max_examples=20):
+        if engine is None:
+            from . import InflectionEngine     # import here to avoid a circular import
+            engine = InflectionEngine()
+        self.engine       = engine
+        self.inflect_oov  = inflect_oov
+        self.max_examples = max_examples
+        self.reset()
+
+    def reset(self):
+        ''' Clear the counts and timing '''
+        self.counts   = Counter()     # totals: tokens, checked, correct, ...
+        self.errors   = Counter()     # error category counts
+        self.tag_errors = Counter()
+        self.examples = Counter()     # (category, text, lemma, tag, inflection)
+        self.times    = Counter()     # seconds in each stage
+
+    @staticmethod
+    def isChecked(tag):
+        ''' Return True if tokens with this tag are re-inflected '''
+        return tag[:1] in ('N', 'V', 'J', 'R') and tag != 'RP'
+
+    def checkToken(self, text, lemma, tag):
+        ''' Re-inflect a word from its lemma and tag and categorize the result
+
+        The lemma gets the word's capitalization, the same as the spaCy "inflect" extension.
+
+        Args:
+            text (str): The original word
+            lemma (str): The word's lemma
+            tag (str): The word's Penn Treebank tag
+
+        Returns: a tuple of (category, inflection) where category is 'correct' or one of the
+            error categories.  The inflection is None if it wasn't found.
+        '''
+        engine = self.engine
+        lemma  = engine._applyCapsStyle(lemma, engine._getCapsStyle(text))
+        forms  = engine.getInflection(lemma, tag, self.inflect_oov)
+        if not forms:
+            if engine.isKnownLemma(lemma) or self.inflect_oov:
+                return 'none_tag', None
+            return 'none_unknown', None
+        infl = forms[0]
+        if infl == text or ignoreWord(text):
+            return 'correct', infl
+        if text in forms:
+            return 'alt_form', infl
+        if infl.lower() == text.lower():
+            return 'case', infl
+        return 'wrong_form', infl
+
+    def addToken(self, text, lemma, tag):
+        ''' Check a word and add the result to the counts.  Returns the category. '''
+        self.counts['tokens'] += 1
+        if not self.isChecked(tag):
+            return None
+        self.counts['checked'] += 1
+        category, infl = self.checkToken(text, lemma, tag)
+        if category == 'correct':
+            self.counts['correct'] += 1
+        else:
+            self.errors[category] += 1
+            self.tag_errors[tag] += 1
+            self.examples[(category, text, lemma, tag, infl)] += 1
+        return category
+
+    def run(self, texts, nlp, n_process=1, batch_size=256):
+        ''' Process a corpus and add the results to the counts
+
+        Args:
+            texts (iterable): The corpus as an iterable of strings (ie.. paragraphs).  This can
+                be a generator so the corpus doesn't need to fit in memory.
+            nlp (spacy.Language): The loaded spaCy model
+            n_process (int): Optional.  The number of processes for nlp.pipe
+            batch_size (int): Optional.  The batch size for nlp.pipe
+
+        Returns: the report from "report"
+        '''
+        st = time.time()
+        docs = iter(nlp.pipe(texts, n_process=n_process, batch_size=batch_size))
+        while True:
+            parse_st = time.time()
+            doc = next(docs, None)
+            infl_st = time.time()
+            self.times['parse'] += infl_st - parse_st
+            if doc is None:
+                break
+            self.counts['docs'] += 1
+            for token in doc:
+                self.addToken(token.text, token.lemma_, token.tag_)
+            self.times['inflect'] += time.time() - infl_st
+        self.times['total'] += time.time() - st
+        return self.report()
+
+    def report(self):
+        ''' Create the report as a dictionary that can be saved as JSON '''
+        checked = self.counts['checked']
+        none = self.errors['none_unknown'] + self.errors['none_tag']
+        total_time = self.times['total']
+        examples = [{'category':c, 'text':t, 'lemma':l, 'tag':g, 'inflection':i, 'count':n}
+                    for (c, t, l, g, i), n in self.examples.most_common(self.max_examples)]
+        return {'engine':{'infl_fn':self.engine.infl_fn, 'overrides_fn':self.engine.overrides_fn,
+                          'inflect_oov':self.inflect_oov},
+                'docs':self.counts['docs'],
+                'tokens':self.counts['tokens'],
+                'checked':checked,
+                'correct':self.counts['correct'],
+                'accuracy':self.counts['correct'] / checked if checked else 0.0,
+                'none_rate':none / checked if checked else 0.0,
+                'errors':dict(self.errors),
+                'errors_by_tag':dict(self.tag_errors),
+                'tokens_per_sec':self.counts['tokens'] / total_time if total_time else 0.0,
+                'inflections_per_sec':checked / self.times['inflect'] if self.times['inflect'] \
+                                      else 0.0,
+                'times':dict(self.times),
+                'examples':examples}
+
+
+# Words that can't be re-inflected from their tag alone so are always counted as correct.
+# This is also used by the scripts (see scripts/MiscUtils.py).
+def ignoreWord(word):
+    return word.lower() in ('was', 'were', 'am', 'are', "'s", "n't", "ma'am", "'ve")
+
+
+def iterParagraphs(fn, max_chars=None):
+    ''' Generate the blank line separated paragraphs of a text file, with the lines joined
+
+    Args:
+        fn (str): The text file
+        max_chars (int): Optional.  Stop after about this many characters.
+    '''
+    lines, num_chars = [], 0
+    with open(fn) as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                lines.append(line)
+                continue
+            if lines:
+                text = ' '.join(lines)
+                lines = []
+                yield text
+                num_chars += len(text)
+                if max_chars and num_chars >= max_chars:
+                    return
+    if lines:
+        yield ' '.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Measure inflection accuracy and speed on a '
+                                     'text corpus')
+    parser.add_argument('corpus', help='Text file.  Paragraphs are separated by blank lines.')
+    parser.add_argument('--model', default='en_core_web_sm', help='spaCy model to load')
+    parser.add_argument('--infl', help='Inflection data file (default: the pyinflect infl.csv)')
+    parser.add_argument('--overrides', help='Overrides file (default: the pyinflect overrides)')
+    parser.add_argument('--oov', action='store_true', help='Use the rules for unknown lemmas')
+    parser.add_argument('--max-chars', type=int, help='Only process about this many characters')
+    parser.add_argument('--n-process', type=int, default=1, help='Processes for nlp.pipe')
+    parser.add_argument('--batch-size', type=int, default=256, help='Batch size for nlp.pipe')
+    parser.add_argument('--out', help='Save the JSON report to this file (default: print it)')
+    args = parser.parse_args(argv)
+    from . import Inflections, INFL_FN, OVERRIDES_FN   # import here to avoid a circular import
+    engine = Inflections(args.infl or INFL_FN, args.overrides or OVERRIDES_FN)
+    nlp = spacy.load(args.model)
+    harness = CorpusHarness(engine, args.oov)
+    report = harness.run(iterParagraphs(args.corpus, args.max_chars), nlp, args.n_process,
+                         args.batch_size)
+    report['corpus'] = args.corpus
+    report['model'] = args.model
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,210 @@
+import os
+import sys
+import json
+import hashlib
+import argparse
+from   .AGIDReader import AGIDReader
+from   .Inflections import Inflections
+from   .SQLiteStore import SQLiteStore
+from   .CompactStore import CompactStore
+from   .FrozenStore import FrozenStore
+from   .OOVModel import OOVModel
+from   . import FormRanking
+from   .FileUtils import fileHash
+
+
+class DataBuilder(object):
+    ''' Class for building all the runtime data files
+
+    This class runs the steps to go from the raw AGID infl.txt file to every file used at runtime.
+    Each target records a hash of its inputs in a manifest file (build_manifest.json) in the
+    output directory.  When a target's inputs haven't changed and its output file is intact,
+    the target is skipped so re-running the build is quick.  All outputs are written to a
+    temporary file first and then moved into place so a failed build never leaves a partial file.
+
+    Args:
+        out_dir (str): Directory to write the files to (ie.. "pyinflect")
+        agid_fn (str): Optional.  The AGID raw input file (infl.txt).  If not supplied, the
+            existing infl.csv in out_dir is used as the source for the other targets.
+        overrides_fn (str): Optional.  The overrides file to use.  Defaults to overrides.csv
+            in out_dir, if it exists.
+        corpus_fns (list): Optional.  Corpus files (plain text or .conllu) to count for the
+            rankings file, which orders the forms of multi-form entries by frequency.  The
+            rankings target is only built when these are supplied.
+        n_process (int): Optional.  The number of processes for counting the corpus
+    '''
+    manifest_name = 'build_manifest.json'
+
+    def __init__(self, out_dir, agid_fn=None, overrides_fn=None, corpus_fns=None, n_process=1):
+        self.out_dir  = out_dir
+        self.agid_fn  = agid_fn
+        self.corpus_fns = corpus_fns
+        self.n_process  = n_process
+        self.infl_fn  = os.path.join(out_dir, 'infl.csv')
+        if overrides_fn is None and os.path.exists(os.path.join(out_dir, 'overrides.csv')):
+            overrides_fn = os.path.join(out_dir, 'overrides.csv')
+        self.overrides_fn = overrides_fn
+        self.manifest_fn  = os.path.join(out_dir, self.manifest_name)
+        self.manifest     = self._loadManifest()
+        # List of targets in build order, as (name, output filename, function to build it)
+        # The function is called with a temporary output filename.
+        # Without the AGID file, the existing infl.csv is the source for everything else.
+        if not agid_fn and not os.path.exists(self.infl_fn):
+            raise IOError('No AGID file supplied and %s does not exist' % self.infl_fn)
+        self.targets = []
+        if agid_fn:
+            self.targets.append(('csv', self.infl_fn, self.buildCSV))
+        self.targets.append(('sqlite', os.path.join(out_dir, 'infl.db'), self.buildSQLite))
+        self.targets.append(('compact', os.path.join(out_dir, 'infl_compact.csv'),
+                             self.buildCompact))
+        self.targets.append(('oov', os.path.join(out_dir, 'oov_model.csv'), self.buildOOVModel))
+        self.targets.append(('frozen', os.path.join(out_dir, 'infl_frozen.py'), self.buildFrozen))
+        if corpus_fns:
+            self.targets.append(('rankings', os.path.join(out_dir, 'rankings.csv'),
+                                 self.buildRankings))
+
+    def build(self, targets=None, force=False, verbose=False):
+        ''' Build the targets whose inputs have changed
+
+        Args:
+            targets (list): Optional.  The names of the targets to build.  Default is all.
+            force (bool): If True, build even if the inputs are unchanged
+            verbose (bool): If True, print the status of each target
+
+        Returns: a list of (target name, status) where status is 'built' or 'skipped'
+
+        Raises: ValueError if a name isn't one of the available targets.  ie.. "csv" is only
+            available when the AGID file is supplied and "rankings" when corpus files are.
+        '''
+        if targets is not None:
+            available = [name for name, _, _ in self.targets]
+            unknown = [name for name in targets if name not in available]
+            if unknown:
+                raise ValueError('Unrecognized or unavailable target(s) = %s.  Must be one of %s'
+                                 % (', '.join(unknown), ', '.join(available)))
+        results = []
+        for name, out_fn, func in self.targets:
+            if targets is not None and name not in targets:
+                continue
+            inputs_hash = self._inputsHash(name)
+            entry = self.manifest.get(name, {})
+            if not force and entry.get('inputs') == inputs_hash and os.path.exists(out_fn) \
+                    and fileHash(out_fn) == entry.get('output'):
+                status = 'skipped'
+            else:
+                root, ext = os.path.splitext(out_fn)
+                tmp_fn = root + '.tmp' + ext
+                func(tmp_fn)
+                os.replace(tmp_fn, out_fn)
+                if name == 'frozen':
+                    FrozenStore.compile(out_fn)     # the .pyc is for the final filename
+                self.manifest[name] = {'inputs':inputs_hash, 'output':fileHash(out_fn)}
+                self._saveManifest()
+                status = 'built'
+            if verbose:
+                print('  %-8s %-8s %s' % (name, status, out_fn))
+            results.append((name, status))
+        return results
+
+    def buildCSV(self, out_fn):
+        ''' Convert the AGID infl.txt file to the simplified infl.csv format '''
+        agid = AGIDReader(self.agid_fn)
+        agid.removeProperNouns()
+        agid.save(out_fn)
+
+    def buildSQLite(self, out_fn):
+        ''' Create the SQLite database from infl.csv and the overrides '''
+        SQLiteStore.create(out_fn, self.infl_fn, self.overrides_fn).close()
+
+    def buildCompact(self, out_fn):
+        ''' Create the compact (paradigm coded) version of infl.csv '''
+        CompactStore.create(out_fn, self.infl_fn)
+
+    def buildOOVModel(self, out_fn):
+        ''' Train the model for ordering the inflections of unknown lemmas '''
+        OOVModel.train(self.infl_fn).save(out_fn)
+
+    def buildFrozen(self, out_fn):
+        ''' Create the python module of infl.csv and the overrides for fast imports '''
+        overrides = Inflections._loadOverrides(self.overrides_fn) if self.overrides_fn else {}
+        FrozenStore.create(out_fn, self.infl_fn, overrides, byte_compile=False,
+                           overrides_fn=self.overrides_fn)
+
+    def buildRankings(self, out_fn):
+        ''' Count the corpus and order the forms of multi-form entries by frequency '''
+        counts = FormRanking.countWords(self.corpus_fns, self.n_process)
+        engine = Inflections(self.infl_fn, self.overrides_fn)
+        FormRanking.save(out_fn, FormRanking.rankForms(counts, engine))
+
+    #######################################################
+    ### Private Methods                                 ###
+    #######################################################
+
+    # Hash of everything a target depends on.  Each target depends on the outputs of the
+    # previous targets so a change in infl.csv causes all later targets to be rebuilt.
+    def _inputsHash(self, name):
+        h = hashlib.sha1(name.encode('utf-8'))
+        if name == 'csv':
+            fns = [self.agid_fn]
+        elif name == 'compact':
+            fns = [self.infl_fn]
+            h.update(CompactStore.header.encode('utf-8'))   # rebuild if the format changes
+        elif name == 'oov':
+            fns = [self.infl_fn]
+            h.update(OOVModel.header.encode('utf-8'))
+        elif name == 'frozen':
+            fns = [self.infl_fn, self.overrides_fn]
+            h.update(FrozenStore.header.encode('utf-8'))
+        elif name == 'rankings':
+            fns = [self.infl_fn, self.overrides_fn] + list(self.corpus_fns)
+        else:
+            fns = [self.infl_fn, self.overrides_fn]
+        for fn in fns:
+            if fn and os.path.exists(fn):
+                h.update(fileHash(fn).encode('utf-8'))
+        return h.hexdigest()
+
+    def _loadManifest(self):
+        if not os.path.exists(self.manifest_fn):
+            return {}
+        try:
+            with open(self.manifest_fn) as f:
+                return json.load(f)
+        except ValueError:
+            return {}
+
+    def _saveManifest(self):
+        tmp_fn = self.manifest_fn + '.tmp'
+        with open(tmp_fn, 'w') as f:
+            json.dump(self.manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_fn, self.manifest_fn)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build the pyinflect runtime data files')
+    parser.add_argument('--out-dir', default=os.path.dirname(os.path.abspath(__file__)),
+                        help='Output directory (default: the pyinflect package directory)')
+    parser.add_argument('--agid', help='AGID infl.txt file.  If not supplied, the existing '
+                        'infl.csv in the output directory is used.')
+    parser.add_argument('--overrides', help='Overrides csv file (default: overrides.csv in the '
+                        'output directory)')
+    parser.add_argument('--corpus', help='Comma separated list of corpus files (text or '
+                        '.conllu) for the rankings target')
+    parser.add_argument('--n-process', type=int, default=1, help='Number of processes for '
+                        'counting the corpus')
+    parser.add_argument('--targets', help='Comma separated list of targets to build (default: all)')
+    parser.add_argument('--force', action='store_true', help='Rebuild even if the inputs are unchanged')
+    args = parser.parse_args(argv)
+    targets = args.targets.split(',') if args.targets else None
+    corpus_fns = args.corpus.split(',') if args.corpus else None
+    builder = DataBuilder(args.out_dir, args.agid, args.overrides, corpus_fns, args.n_process)
+    print('Building data in ', args.out_dir)
+    try:
+        builder.build(targets, args.force, verbose=True)
+    except ValueError as e:
+        parser.error(str(e))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,301 @@
+import sys
+import copy
+import json
+import time
+import random
+import argparse
+# Resource usage is only available on Unix
+try:
+    import resource
+except ImportError:
+    resource = None
+from   .OverlayOverrides import OverlayOverrides
+
+
+# Functions for inspecting the memory use and lookup speed of a loaded inflection engine, for
+# checking a deployed process.  report() collects everything into a dictionary and
+# formatReport() makes it readable.  "python3 -m pyinflect.Diagnostics" prints the report for
+# the default engine.
+
+# The containers that deepSize follows
+_containers = (dict, tuple, list, set, frozenset)
+
+
+def deepSize(obj, seen=None):
+    ''' Return the size of an object and everything it contains, in bytes
+
+    Args:
+        obj (object): The object to measure.  dicts, tuples, lists and sets are followed, and
+            the overrides of an overlay (OverlayOverrides).
+        seen (set): Optional.  The ids of objects that were already counted, which are skipped.
+            Pass the same set to measure several objects without counting shared parts twice.
+
+    Returns: the size in bytes
+    '''
+    seen = set() if seen is None else seen
+    size = 0
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, _containers):
+            stack.extend(obj)
+        elif isinstance(obj, OverlayOverrides):
+            stack.extend((obj.own, obj.parent))
+    return size
+
+
+def loadTimes(engine=None):
+    ''' Return the seconds for each phase of loading the engine
+
+    The phases are '_loadInflections' and '_loadOverrides' (or 'snapshot' when the data was
+    loaded from a snapshot), 'spacy' for registering the spaCy extensions and 'createOverlay',
+    'loadLexicon' or 'loadRankings' if they were used to create the engine.
+    '''
+    engine = _getEngine(engine)
+    return dict(engine.load_times)
+
+
+def dataStats(engine=None):
+    ''' Return the sizes and counts for the engine's inflection data and overrides
+
+    Returns: a dictionary with
+        'store': the type of the inflection data (dict, SQLiteStore, CompactStore or
+            FrozenStore)
+        'lemmas': the number of lemmas in the inflection data and in the overrides
+        'bytes': the deep size of the inflection data, the overrides and both together (shared
+            objects are only counted once).  The inflection data's size is None if it's not a
+            dict, since the other stores don't keep it in memory.
+        'pos_types': the number of lemmas with each pos_type
+        'tags': the number of entries for each tag
+        'tuples': counts of the form tuples.  'references' is the number of tag entries,
+            'objects' the number of distinct tuple objects, 'shared' the number of those used
+            by more than one entry and 'values' the number of distinct contents.
+    '''
+    engine = _getEngine(engine)
+    in_memory = isinstance(engine.infl_data, dict)
+    seen = set()
+    infl_bytes = deepSize(engine.infl_data, seen) if in_memory else None
+    overrides_bytes = deepSize(engine.overrides, seen)
+    pos_types, tags = {}, {}
+    refs = {}           # id -> [tuple, number of references]
+    sources = [engine.overrides] + ([engine.infl_data] if in_memory else [])
+    for data in sources:
+        for entry in data.values():
+            for pos_type in {engine.tag_pos_types.get(tag) for tag in entry}:
+                pos_types[pos_type] = pos_types.get(pos_type, 0) + 1
+            for tag, forms in entry.items():
+                tags[tag] = tags.get(tag, 0) + 1
+                ref = refs.get(id(forms))
+                if ref is None:
+                    refs[id(forms)] = [forms, 1]
+                else:
+                    ref[1] += 1
+    tuples = {'references':sum(r[1] for r in refs.values()), 'objects':len(refs),
+              'shared':sum(1 for r in refs.values() if r[1] > 1),
+              'values':len({r[0] for r in refs.values()})}
+    return {'store':type(engine.infl_data).__name__,
+            'lemmas':{'infl_data':len(engine.infl_data), 'overrides':len(engine.overrides)},
+            'bytes':{'infl_data':infl_bytes, 'overrides':overrides_bytes,
+                     'total':infl_bytes + overrides_bytes if in_memory else None},
+            'pos_types':pos_types, 'tags':tags, 'tuples':tuples}
+
+
+def cacheStats(engine=None):
+    ''' Return the occupancy of the engine's cache and of its lazily created indices
+
+    Returns: a dictionary with
+        'cache': the number of entries, max_entries and pending (unwritten) entries of the
+            attached InflectionCache, or None if there isn't one
+        'indices': the deep size in bytes of the known forms, the prefix index and the fuzzy
+            index, or None for those that haven't been created yet
+        'ud_tag_map': the number of entries in the UD feature to tag tables and max_entries
+    '''
+    engine = _getEngine(engine)
+    cache = None
+    if engine.cache is not None:
+        cache = {'entries':len(engine.cache), 'max_entries':engine.cache.max_entries,
+                 'pending':len(engine.cache.pending)}
+    indices = {}
+    for name in ('known_forms', 'prefix_index', 'fuzzy_index'):
+        index = getattr(engine, name)
+        if index is not None and not isinstance(index, _containers):
+            index = index.__dict__
+        indices[name] = deepSize(index) if index is not None else None
+    tag_map = engine.ud_tag_map
+    ud_tag_map = {'entries':len(tag_map.table) + len(tag_map.token_table),
+                  'max_entries':tag_map.max_entries}
+    return {'cache':cache, 'indices':indices, 'ud_tag_map':ud_tag_map}
+
+
+def lookupLatency(engine=None, num_lookups=10000, seed=0):
+    ''' Measure the distribution of getInflection latency on this machine
+
+    Random (lemma, tag) pairs from the data are looked up one at a time and timed, along with
+    the same number of unknown lemmas (misses).  The lookups are timed on a shallow copy of the
+    engine without its cache, which shares the data, so the latency is for the data itself, the
+    random lookups aren't stored in the cache and the engine isn't changed.
+
+    Args:
+        engine (Inflections): Optional.  The inflection engine.  Default is pyinflect's.
+        num_lookups (int): Optional.  The number of lookups to time for hits and for misses
+        seed (int): Optional.  The random seed for choosing the pairs
+
+    Returns: a dictionary with 'hit' and 'miss' dictionaries of the mean, p50, p90, p99,
+        p99.9 and max latency in microseconds
+    '''
+    engine = _getEngine(engine)
+    rand = random.Random(seed)
+    lemmas = sorted(engine.infl_data)
+    tags = sorted(engine.tag_pos_types)
+    hits, misses = [], []
+    for lemma in (rand.choice(lemmas) for _ in range(num_lookups)):
+        hits.append((lemma, rand.choice(sorted(engine.infl_data[lemma]))))
+        misses.append((lemma + 'qzx', rand.choice(tags)))
+    view = copy.copy(engine)
+    view.cache = None
+    results = {}
+    for name, pairs in (('hit', hits), ('miss', misses)):
+        times = []
+        get = view.getInflection
+        timer = time.perf_counter_ns
+        for lemma, tag in pairs:
+            st = timer()
+            get(lemma, tag)
+            times.append(timer() - st)
+        results[name] = _percentiles(times)
+    return results
+
+
+def memoryUsage():
+    ''' Return the current and peak resident memory (RSS) of this process in bytes
+
+    Either value is None if it can't be read on this platform.
+    '''
+    current, peak = None, None
+    try:
+        with open('/proc/self/statm') as f:
+            current = int(f.read().split()[1]) * resource.getpagesize()
+    except (IOError, ValueError, AttributeError):
+        pass
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        peak *= 1 if sys.platform == 'darwin' else 1024     # bytes on macOS, KB on Linux
+    return {'current':current, 'peak':peak}
+
+
+def report(engine=None, num_lookups=10000):
+    ''' Collect all the diagnostics for an engine
+
+    Args:
+        engine (Inflections): Optional.  The inflection engine.  Default is pyinflect's.
+        num_lookups (int): Optional.  The number of lookups for lookupLatency, or 0 to skip it
+
+    Returns: a dictionary with 'load_times', 'data', 'cache', 'latency_us' and 'memory'
+    '''
+    engine = _getEngine(engine)
+    return {'load_times':loadTimes(engine), 'data':dataStats(engine),
+            'cache':cacheStats(engine),
+            'latency_us':lookupLatency(engine, num_lookups) if num_lookups else None,
+            'memory':memoryUsage()}
+
+
+def formatReport(rep):
+    ''' Format a report from report() as readable text '''
+    lines = ['Load times (ms)']
+    for phase, seconds in rep['load_times'].items():
+        lines.append('  %-20s %10.1f' % (phase, 1000 * seconds))
+    data = rep['data']
+    lines.append('Data (%s)' % data['store'])
+    for name in ('infl_data', 'overrides'):
+        lines.append('  %-20s %10s lemmas %10s MB' % (name, '{:,}'.format(data['lemmas'][name]),
+                     _mb(data['bytes'][name])))
+    lines.append('  %-20s %10s        %10s MB' % ('total', '', _mb(data['bytes']['total'])))
+    lines.append('  lemmas by pos_type   ' + _counts(data['pos_types']))
+    lines.append('  entries by tag       ' + _counts(data['tags']))
+    lines.append('  form tuples          ' + _counts(data['tuples'], sort=False))
+    cache = rep['cache']
+    lines.append('Caches and indices')
+    if cache['cache'] is None:
+        lines.append('  %-20s %10s' % ('cache', 'none'))
+    else:
+        lines.append('  %-20s %10s of %s (%s pending)' % ('cache',
+                     '{:,}'.format(cache['cache']['entries']),
+                     '{:,}'.format(cache['cache']['max_entries']),
+                     '{:,}'.format(cache['cache']['pending'])))
+    for name, size in cache['indices'].items():
+        lines.append('  %-20s %10s' % (name, 'not built' if size is None else _mb(size) + ' MB'))
+    lines.append('  %-20s %10s of %s' % ('ud_tag_map', cache['ud_tag_map']['entries'],
+                                         '{:,}'.format(cache['ud_tag_map']['max_entries'])))
+    if rep['latency_us']:
+        lines.append('Lookup latency (us)')
+        lines.append('  %-8s' % '' + ''.join('%9s' % k for k in rep['latency_us']['hit']))
+        for name, stats in rep['latency_us'].items():
+            lines.append('  %-8s' % name + ''.join('%9.2f' % v for v in stats.values()))
+    memory = rep['memory']
+    lines.append('Process memory (RSS)')
+    lines.append('  %-20s %10s MB' % ('current', _mb(memory['current'])))
+    lines.append('  %-20s %10s MB' % ('peak', _mb(memory['peak'])))
+    return '\n'.join(lines)
+
+
+#######################################################
+### Private Methods                                 ###
+#######################################################
+
+
+def _getEngine(engine):
+    if engine is None:
+        from . import InflectionEngine     # import here to avoid a circular import
+        engine = InflectionEngine()
+    return engine
+
+
+# Summarize a list of nanosecond times as microseconds
+def _percentiles(times):
+    times = sorted(times)
+    def pct(p):
+        return times[min(len(times) - 1, int(len(times) * p))] / 1000
+    return {'mean':sum(times) / len(times) / 1000, 'p50':pct(0.5), 'p90':pct(0.9),
+            'p99':pct(0.99), 'p99.9':pct(0.999), 'max':times[-1] / 1000}
+
+
+def _mb(size):
+    return '-' if size is None else '%.1f' % (size / 1e6)
+
+
+def _counts(counts, sort=True):
+    items = sorted(counts.items(), key=lambda x: str(x[0])) if sort else counts.items()
+    return ' '.join('%s=%s' % (k, '{:,}'.format(v)) for k, v in items)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Report the memory use and lookup latency of '
+                                     'the pyinflect engine')
+    parser.add_argument('--infl', help='Inflection data file (default: the installed infl.csv)')
+    parser.add_argument('--overrides', help='Overrides file (default: the installed one)')
+    parser.add_argument('--lookups', type=int, default=10000, help='Number of lookups to time '
+                        '(0 to skip)')
+    parser.add_argument('--spacy', action='store_true', help='Import spaCy first so the time to '
+                        'register the extensions is included')
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    args = parser.parse_args(argv)
+    if args.spacy:
+        import spacy    # noqa: F401
+    from . import Inflections, INFL_FN, OVERRIDES_FN
+    engine = None
+    if args.infl or args.overrides or args.spacy:
+        engine = Inflections(args.infl or INFL_FN, args.overrides or OVERRIDES_FN)
+    rep = report(engine, args.lookups)
+    print(json.dumps(rep, indent=2) if args.json else formatReport(rep))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
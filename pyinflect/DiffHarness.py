@@ -0,0 +1,236 @@
+import io
+import os
+import sys
+import json
+import time
+import shutil
+import tarfile
+import argparse
+import importlib
+import subprocess
+import multiprocessing
+from   collections import Counter
+from   .FileUtils import userCacheDir
+
+
+class DiffHarness(object):
+    ''' Class for checking that two inflection engines give the same results and comparing speed
+
+    Every lemma (in all three capitalization styles) is run through getInflection for every
+    Penn Treebank tag with inflect_oov on and off, getAllInflections for every pos_type and
+    getAllInflectionsOOV for every pos_type.  The results of the reference and the candidate
+    engine are compared and each engine is timed on the same calls.  The lemmas are split into
+    shards which can be run in separate processes.
+
+    To catch changes to the lookup code as well as to the data, the reference should be created
+    from a pinned copy of the package, ie.. the last release or the git HEAD (see loadRevision),
+    rather than from the Inflections class being changed.
+
+    Engines are sent to the worker processes by pickling them, which for Inflections sends a
+    handle to its data files (see EngineHandle.py).  Things that aren't part of the handle, such
+    as an attached cache, are lost.  For these, pass a module level function that creates the
+    engine instead.  It's called in each worker.
+
+    Args:
+        reference (Inflections): The reference engine (or a function that creates it)
+        candidate (Inflections): The engine to check (or a function that creates it)
+        max_diffs (int): Optional.  The number of differences to include in the report
+    '''
+    tags = ('VB', 'VBD', 'VBG', 'VBN', 'VBP', 'VBZ', 'MD', 'JJ', 'JJR', 'JJS', 'RB', 'RBR', 'RBS',
+            'NN', 'NNS', 'NNP', 'DT')
+    pos_types = ('V', 'A', 'N')
+    caps_styles = ('lower', 'first_upper', 'all_upper')
+
+    def __init__(self, reference, candidate, max_diffs=100):
+        self.reference = reference
+        self.candidate = candidate
+        self.max_diffs = max_diffs
+
+    def run(self, lemmas=None, n_process=1, num_shards=None):
+        ''' Compare the engines
+
+        Args:
+            lemmas (list): Optional.  The lemmas to check.  Default is every lemma in the
+                reference engine's data and overrides.
+            n_process (int): Optional.  The number of processes to use
+            num_shards (int): Optional.  The number of shards to split the lemmas into.
+                Default is 4 per process.
+
+        Returns: a report dictionary with the number of calls and differences for each method,
+            the first max_diffs differences and the speed of each engine.
+        '''
+        if lemmas is None:
+            reference = _getEngine(self.reference)
+            lemmas = sorted(set(reference.infl_data) | set(reference.overrides))
+        num_shards = num_shards or 4 * n_process
+        shards = [(self.reference, self.candidate, lemmas[i::num_shards], self.max_diffs)
+                  for i in range(num_shards)]
+        st = time.time()
+        if n_process > 1:
+            pool = multiprocessing.Pool(n_process)
+            try:
+                results = pool.map(_runShard, shards)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            results = [_runShard(shard) for shard in shards]
+        return self._mergeResults(results, len(lemmas), time.time() - st)
+
+    #######################################################
+    ### Private Methods                                 ###
+    #######################################################
+
+    # Combine the shard results into the report
+    def _mergeResults(self, results, num_lemmas, wall_time):
+        calls, diff_counts, times = Counter(), Counter(), Counter()
+        diffs = []
+        for shard_calls, shard_diff_counts, shard_diffs, shard_times in results:
+            calls.update(shard_calls)
+            diff_counts.update(shard_diff_counts)
+            diffs.extend(shard_diffs)
+            times.update(shard_times)
+        speed = {}
+        for method in calls:
+            ref_time  = times[('reference', method)]
+            cand_time = times[('candidate', method)]
+            speed[method] = {'reference_per_sec':calls[method] / ref_time if ref_time else 0.0,
+                             'candidate_per_sec':calls[method] / cand_time if cand_time else 0.0,
+                             'speedup':ref_time / cand_time if cand_time else 0.0}
+        return {'lemmas':num_lemmas,
+                'calls':dict(calls),
+                'num_diffs':dict(diff_counts),
+                'equivalent':not diff_counts,
+                'diffs':diffs[:self.max_diffs],
+                'speed':speed,
+                'wall_time':wall_time}
+
+
+def loadRevision(rev='HEAD', out_dir=None, pkg_dir=None):
+    ''' Import the pyinflect package (code and data) from a git revision, as a pinned reference
+
+    The package directory at the revision is extracted with "git archive" and imported under
+    the name pyinflect_<commit hash> so it doesn't replace the package being checked.  This
+    requires pyinflect to be in a git checkout.
+
+    Args:
+        rev (str): Optional.  The revision, ie.. HEAD, a tag or a commit hash
+        out_dir (str): Optional.  The directory to extract to.  Default is "revisions" in the
+            user cache directory.  A revision that was already extracted is re-used.
+        pkg_dir (str): Optional.  The pyinflect package directory in the git checkout.  Default
+            is this package's.
+
+    Returns: the imported package.  ie.. use package.Inflections(package.INFL_FN,
+        package.OVERRIDES_FN) as the reference engine.
+    '''
+    pkg_dir = pkg_dir or os.path.dirname(os.path.abspath(__file__))
+    def git(*args, cwd=pkg_dir):
+        return subprocess.run(('git',) + args, cwd=cwd, stdout=subprocess.PIPE,
+                              stderr=subprocess.PIPE, check=True).stdout
+    try:
+        commit = git('rev-parse', '--verify', rev + '^{commit}').decode().strip()
+        top_dir = git('rev-parse', '--show-toplevel').decode().strip()
+        prefix = git('rev-parse', '--show-prefix').decode().strip()
+    except (OSError, subprocess.CalledProcessError) as e:
+        raise ValueError('Unable to find revision %s of %s in git: %s' % (rev, pkg_dir, e))
+    name = 'pyinflect_' + commit
+    out_dir = out_dir or os.path.join(userCacheDir(), 'revisions')
+    if not os.path.exists(os.path.join(out_dir, name)):
+        # Extract to a temporary directory first so a failure never leaves a partial package
+        tmp_dir = os.path.join(out_dir, name + '.tmp')
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        archive = git('archive', '--format=tar', '%s:%s' % (commit, prefix), cwd=top_dir)
+        with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+            tar.extractall(tmp_dir)
+        os.replace(tmp_dir, os.path.join(out_dir, name))
+    if out_dir not in sys.path:
+        sys.path.append(out_dir)
+    return importlib.import_module(name)
+
+
+# Return the engine for an engine or a function that creates one
+def _getEngine(engine):
+    if hasattr(engine, 'getInflection'):
+        return engine
+    return engine()
+
+
+# Generate (method name, args) for every call to test for a lemma
+def _iterCalls(lemma):
+    for style in DiffHarness.caps_styles:
+        word = lemma.upper() if style == 'all_upper' else \
+               lemma.capitalize() if style == 'first_upper' else lemma
+        for tag in DiffHarness.tags:
+            yield 'getInflection', (word, tag, False)
+            yield 'getInflection', (word, tag, True)
+        yield 'getAllInflections', (word, None)
+        for pos_type in DiffHarness.pos_types:
+            yield 'getAllInflections', (word, pos_type)
+            yield 'getAllInflectionsOOV', (word, pos_type)
+
+
+# Run the calls for the lemmas through both engines.  This is run in the worker processes.
+# Each method's calls are timed as a group so the timer doesn't add to the per-call time.
+# Returns (call counts, diff counts, diffs, times) where times is keyed by (engine, method).
+def _runShard(shard):
+    reference, candidate, lemmas, max_diffs = shard
+    engines = [('reference', _getEngine(reference)), ('candidate', _getEngine(candidate))]
+    calls = {}
+    for lemma in lemmas:
+        for method, args in _iterCalls(lemma):
+            calls.setdefault(method, []).append(args)
+    results, times = {}, Counter()
+    for name, engine in engines:
+        for method, method_calls in calls.items():
+            func = getattr(engine, method)
+            st = time.perf_counter()
+            results[(name, method)] = [func(*args) for args in method_calls]
+            times[(name, method)] += time.perf_counter() - st
+    call_counts = Counter({method:len(method_calls) for method, method_calls in calls.items()})
+    diff_counts, diffs = Counter(), []
+    for method, method_calls in calls.items():
+        for args, ref, cand in zip(method_calls, results[('reference', method)],
+                                   results[('candidate', method)]):
+            if ref != cand:
+                diff_counts[method] += 1
+                if len(diffs) < max_diffs:
+                    diffs.append({'method':method, 'args':list(args), 'reference':ref,
+                                  'candidate':cand})
+    return call_counts, diff_counts, diffs, times
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compare the results and speed of two '
+                                     'inflection engines')
+    parser.add_argument('--reference', help='Reference data file (default: the infl.csv of the '
+                        'reference revision)')
+    parser.add_argument('--reference-rev', default='HEAD', help='Git revision of pyinflect to '
+                        'use as the reference (default: HEAD).  Use "" for the installed code.')
+    parser.add_argument('--candidate', help='Candidate data file (default: the pyinflect infl.csv)')
+    parser.add_argument('--overrides', help='Overrides file for both (default: the overrides of '
+                        'each)')
+    parser.add_argument('--max-lemmas', type=int, help='Only check this many lemmas')
+    parser.add_argument('--n-process', type=int, default=multiprocessing.cpu_count(),
+                        help='Number of processes (default: all cores)')
+    parser.add_argument('--out', help='Save the JSON report to this file (default: print it)')
+    args = parser.parse_args(argv)
+    import pyinflect    # import here to avoid a circular import
+    ref_pkg = loadRevision(args.reference_rev) if args.reference_rev else pyinflect
+    reference = ref_pkg.Inflections(args.reference or ref_pkg.INFL_FN,
+                                    args.overrides or ref_pkg.OVERRIDES_FN)
+    candidate = pyinflect.Inflections(args.candidate or pyinflect.INFL_FN,
+                                      args.overrides or pyinflect.OVERRIDES_FN)
+    lemmas = sorted(set(reference.infl_data) | set(reference.overrides))
+    if args.max_lemmas:
+        lemmas = lemmas[:args.max_lemmas]
+    report = DiffHarness(reference, candidate).run(lemmas, args.n_process)
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+    return 0 if report['equivalent'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,169 @@
+import os
+import pickle
+from   .Inflections import Inflections
+from   .OOVModel import OOVModel
+from   .FileUtils import fileHash, userCacheDir
+
+
+# Functions for pickling an Inflections instance as a small handle instead of its data.
+# The handle has the data filenames, their hashes, the pyinflect version and the load options.
+# When it's unpickled (ie.. on a Dask, Spark or Ray worker) an already loaded instance with the
+# same handle is reused or the data is loaded from the local files.  When the workers don't have
+# the files, the engine can be set to include their contents (Inflections.setPickleData) which
+# are written to the local cache directory and loaded from there.  With pickle protocol 5 the
+# contents are PickleBuffers so they can be sent out-of-band without being copied.
+
+
+def makeHandle(engine):
+    ''' Create the handle identifying the data an instance was loaded with
+
+    Args:
+        engine (Inflections): The instance
+
+    Returns: a tuple of (version, infl file, overrides file, overlay files, OOV model file,
+        snapshot_dir, pos_types) where each file is (filename, hash) and overlay files are
+        (filename, hash, option).  The option is inherit_overrides for createOverlay, the
+        priority for loadLexicon or 'rankings' for loadRankings.
+
+    Raises: pickle.PicklingError if the instance has an OOV model or a lexicon that wasn't
+        loaded from a file
+    '''
+    from . import __version__   # import here to avoid a circular import
+    overrides = (_absPath(engine.overrides_fn), fileHash(engine.overrides_fn)) \
+                if engine.overrides_fn else None
+    if any(fn is None for fn, _ in engine.overlay_fns):
+        raise pickle.PicklingError('Lexicons must be loaded from a file to pickle the engine')
+    overlays = tuple((_absPath(fn), fileHash(fn), option) for fn, option in engine.overlay_fns)
+    oov_model = None
+    if engine.oov_model is not None:
+        if not engine.oov_model.fn:
+            raise pickle.PicklingError('The OOV model must be saved to a file to pickle the engine')
+        oov_model = (_absPath(engine.oov_model.fn), fileHash(engine.oov_model.fn))
+    pos_types = tuple(sorted(engine.pos_types)) if engine.pos_types else None
+    return (__version__, (_absPath(engine.infl_fn), fileHash(engine.infl_fn)), overrides, overlays,
+            oov_model, _absPath(engine.snapshot_dir), pos_types)
+
+
+def readContents(handle, protocol):
+    ''' Read the contents of the data files in a handle
+
+    Args:
+        handle (tuple): The handle from makeHandle
+        protocol (int): The pickle protocol being used
+
+    Returns: a list of the file contents, in the order of handleFiles.  For protocol 5 and higher
+        these are PickleBuffers.
+    '''
+    contents = []
+    for fn, _ in handleFiles(handle):
+        with open(fn, 'rb') as f:
+            data = f.read()
+        contents.append(pickle.PickleBuffer(data) if protocol >= 5 else data)
+    return contents
+
+
+def handleFiles(handle):
+    ''' Return a list of the (filename, hash) of all the data files in a handle '''
+    _, infl, overrides, overlays, oov_model, _, _ = handle
+    files = [infl]
+    if overrides:
+        files.append(overrides)
+    files.extend((fn, h) for fn, h, _ in overlays)
+    if oov_model:
+        files.append(oov_model)
+    return files
+
+
+def restoreEngine(handle, contents=None):
+    ''' Unpickle an Inflections instance from its handle
+
+    Args:
+        handle (tuple): The handle from makeHandle
+        contents (list): Optional.  The contents of the data files from readContents.  If given,
+            files that don't exist locally (or have changed) are written to the user cache
+            directory and loaded from there.
+
+    Returns: an Inflections instance
+
+    Raises: IOError if a data file isn't available locally and the contents weren't sent
+    '''
+    # Reuse any instance in this process loaded from the same data.  pyinflect's default engine
+    # is created when it's first used, so create it if the handle is for the default data.
+    engine = _findInstance(handle)
+    if engine is None and _isDefaultData(handle):
+        from . import InflectionEngine  # import here to avoid a circular import
+        InflectionEngine()
+        engine = _findInstance(handle)
+    if engine is not None:
+        return engine
+    from . import __version__   # import here to avoid a circular import
+    version, _, overrides, overlays, oov_model, snapshot_dir, pos_types = handle
+    if version != __version__:
+        raise IOError('Pickled pyinflect engine is version %s.  This is version %s' %
+                      (version, __version__))
+    files = handleFiles(handle)
+    if contents is None:
+        contents = [None] * len(files)
+    fns = [_localFile(fn, h, data) for (fn, h), data in zip(files, contents)]
+    infl_fn = fns.pop(0)
+    overrides_fn = fns.pop(0) if overrides else None
+    oov_model_fn = fns.pop() if oov_model else None
+    engine = Inflections(infl_fn, overrides_fn, snapshot_dir, pos_types)
+    for fn, (_, _, option) in zip(fns, overlays):
+        if option == 'rankings':
+            engine.loadRankings(fn)
+        elif isinstance(option, str):
+            engine.loadLexicon(fn, option)
+        else:
+            engine = engine.createOverlay(fn, option)
+    if oov_model_fn:
+        engine.setOOVModel(OOVModel(oov_model_fn))
+    # Keep the original handle so the engine pickles the same way on this worker
+    engine.pickle_handle = handle
+    return engine
+
+
+# Return an instance in this process with the same handle, or None
+def _findInstance(handle):
+    for engine in list(Inflections.instances):
+        try:
+            if engine.pickle_handle is None:
+                engine.pickle_handle = makeHandle(engine)
+        except (IOError, OSError):     # its data files were removed
+            continue
+        except pickle.PicklingError:    # it has data that isn't from a file
+            continue
+        if engine.pickle_handle == handle:
+            return engine
+    return None
+
+
+# Return True if the handle's inflection data is one of pyinflect's own data files
+def _isDefaultData(handle):
+    from . import INFL_FN, FROZEN_FN    # import here to avoid a circular import
+    return handle[1][0] in (_absPath(INFL_FN), _absPath(FROZEN_FN))
+
+
+# Absolute paths so the handle is the same when the working directories differ
+def _absPath(fn):
+    return os.path.abspath(fn) if fn else fn
+
+
+# Return a local filename for a data file with the given hash.  The original filename is used if
+# it exists and is unchanged, otherwise the contents are written to the user cache directory.
+def _localFile(fn, file_hash, data):
+    if os.path.exists(fn) and fileHash(fn) == file_hash:
+        return fn
+    cache_fn = os.path.join(userCacheDir(), 'data-%s%s' % (file_hash, os.path.splitext(fn)[1]))
+    if os.path.exists(cache_fn):
+        return cache_fn
+    if data is None:
+        raise IOError('pyinflect data file %s is not available.  Use setPickleData(True) to '
+                      'include the data when pickling.' % fn)
+    if not os.path.isdir(os.path.dirname(cache_fn)):
+        os.makedirs(os.path.dirname(cache_fn))
+    tmp_fn = '%s.%d.tmp' % (cache_fn, os.getpid())
+    with open(tmp_fn, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_fn, cache_fn)
+    return cache_fn
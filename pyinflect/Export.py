@@ -0,0 +1,169 @@
+import os
+import sys
+import csv
+import json
+import argparse
+from   itertools import islice
+# Parquet output is optional
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+# Functions for exporting the full paradigm table (every lemma, tag and form with the
+# overrides applied) for use in other tools.  Rows are generated lazily and written in chunks
+# so memory use doesn't depend on the size of the table.
+
+# The fields of each row
+columns = ('lemma', 'pos_type', 'tag', 'form_num', 'form', 'source')
+
+
+def iterParadigms(engine=None, pos_type=None, vocab=None):
+    ''' Generate a row for every inflected form in the data
+
+    The data is read directly, so this is much faster than calling getAllInflections for each
+    lemma.  Lemmas are in sorted order and the forms are lowercase.
+
+    Args:
+        engine (Inflections): Optional.  The inflection engine.  Default is pyinflect's.
+        pos_type (str): Optional.  Only export this pos_type, 'V', 'A' or 'N'
+        vocab (iterable): Optional.  Words to add rows for, from the inflection rules
+            (getAllInflectionsOOV), if they aren't lemmas in the data.  To keep the memory use
+            bounded, only repeats of the previous word are skipped so a word that appears more
+            than once should be de-duplicated first (ie.. with "sort -u").
+
+    Returns:
+        Generates tuples of (lemma, pos_type, tag, form_num, form, source) where source is
+        'agid' for the AGID data, 'override' for the overrides or 'oov' for the rules.
+    '''
+    if engine is None:
+        from . import InflectionEngine     # import here to avoid a circular import
+        engine = InflectionEngine()
+    tag_pos_types = {}
+    for pt in ('V', 'A', 'N'):
+        if pos_type is None or pos_type == pt:
+            tag_pos_types.update((tag, pt) for tag in engine._posTypeToTags(pt))
+    infl_data, overrides = engine.infl_data, engine.overrides
+    for lemma in sorted(set(infl_data) | set(overrides)):
+        tag_forms = dict(infl_data.get(lemma) or {})
+        tag_overrides = overrides.get(lemma) or {}
+        tag_forms.update(tag_overrides)
+        for tag, forms in tag_forms.items():
+            pt = tag_pos_types.get(tag)
+            if pt is None:
+                continue
+            source = 'override' if tag in tag_overrides else 'agid'
+            for i, form in enumerate(forms):
+                yield (lemma, pt, tag, i, form, source)
+    if vocab is None:
+        return
+    prev = None
+    for word in vocab:
+        word = word.strip().lower()
+        if not word or word == prev or engine.isKnownLemma(word):
+            continue
+        prev = word
+        for pt in ('V', 'A', 'N'):
+            if pos_type is not None and pos_type != pt:
+                continue
+            for tag, forms in engine.getAllInflectionsOOV(word, pt).items():
+                for i, form in enumerate(forms):
+                    yield (word, pt, tag, i, form, 'oov')
+
+
+def writeJSONL(fn, rows):
+    ''' Write the rows to a JSON lines file.  Returns the number of rows written. '''
+    # Format the lines directly, which is much faster than json.dumps for each row
+    encode = json.encoder.encode_basestring_ascii
+    template = '{' + ', '.join('"%s": %s' % (c, '%d' if c == 'form_num' else '%s')
+                               for c in columns) + '}\n'
+    count = 0
+    with open(fn, 'w') as f:
+        for row in rows:
+            f.write(template % tuple(x if isinstance(x, int) else encode(x) for x in row))
+            count += 1
+    return count
+
+
+def writeCSV(fn, rows):
+    ''' Write the rows to a CSV file with a header line.  Returns the number of rows written. '''
+    count = 0
+    with open(fn, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    return count
+
+
+def writeParquet(fn, rows, chunk_size=100000):
+    ''' Write the rows to a Parquet file, in row groups of chunk_size.  Requires pyarrow.
+
+    Returns the number of rows written.
+    '''
+    if pyarrow is None:
+        raise ImportError('pyarrow is required to write Parquet files')
+    schema = pyarrow.schema([('lemma', pyarrow.string()), ('pos_type', pyarrow.string()),
+                             ('tag', pyarrow.string()), ('form_num', pyarrow.int32()),
+                             ('form', pyarrow.string()), ('source', pyarrow.string())])
+    count = 0
+    rows = iter(rows)
+    with pyarrow.parquet.ParquetWriter(fn, schema) as writer:
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            arrays = [pyarrow.array(list(col), type=field.type)
+                      for col, field in zip(zip(*chunk), schema)]
+            writer.write_table(pyarrow.Table.from_arrays(arrays, schema=schema))
+            count += len(chunk)
+    return count
+
+
+# Output functions for each format
+writers = {'jsonl':writeJSONL, 'csv':writeCSV, 'parquet':writeParquet}
+
+
+def export(fn, rows, fmt=None):
+    ''' Write the rows from iterParadigms to a file
+
+    Args:
+        fn (str): The output filename
+        rows (iterable): The rows from iterParadigms
+        fmt (str): Optional.  'jsonl', 'csv' or 'parquet'.  Default is from the file extension.
+
+    Returns: the number of rows written
+    '''
+    if fmt is None:
+        fmt = os.path.splitext(fn)[1].lstrip('.').lower()
+        fmt = 'jsonl' if fmt == 'json' else fmt
+    if fmt not in writers:
+        raise ValueError('Unrecognized export format = %s.  Must be one of %s' %
+                         (fmt, ', '.join(sorted(writers))))
+    return writers[fmt](fn, rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Export the pyinflect paradigm table')
+    parser.add_argument('out', help='Output file (.jsonl, .csv or .parquet)')
+    parser.add_argument('--format', choices=sorted(writers), help='Output format (default: '
+                        'from the file extension)')
+    parser.add_argument('--pos-type', choices=['V', 'A', 'N'], help='Only export this pos_type')
+    parser.add_argument('--vocab', help='File of words, one per line, to add rule based '
+                        'inflections for if they are not in the data.  It should not contain duplicates.')
+    args = parser.parse_args(argv)
+    vocab = open(args.vocab) if args.vocab else None
+    try:
+        count = export(args.out, iterParadigms(pos_type=args.pos_type, vocab=vocab), args.format)
+    finally:
+        if vocab is not None:
+            vocab.close()
+    print('Wrote {:,} rows to {}'.format(count, args.out))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
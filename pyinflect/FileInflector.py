@@ -0,0 +1,229 @@
+import os
+import sys
+import shutil
+import argparse
+import tempfile
+import multiprocessing
+
+
+class FileInflector(object):
+    ''' Class for adding inflections to pre-tagged CoNLL-U or TSV files without spaCy
+
+    Each token's lemma is inflected with its own treebank tag (or a given tag), the same as the
+    spaCy "inflect" extension, and the result is added to the line.  For CoNLL-U it's added to
+    the MISC column as "Inflection=form", using the LEMMA and XPOS columns.  For TSV it's added
+    as a new last column, using the lemma_col and tag_col columns.  Lines are read and written
+    in batches, so memory use doesn't depend on the size of the file.  Comment lines (#), blank
+    lines, CoNLL-U multi-word tokens and empty nodes, and tokens without an inflection are
+    written unchanged (TSV tokens get an empty column).  Tokens without a lemma or a tag (empty
+    or "_") are not inflected.  An Inflection already in the MISC column, ie.. from processing
+    the file before, is replaced.
+
+    Args:
+        engine (Inflections): Optional.  The inflection engine.  Default is pyinflect's.
+        fmt (str): Optional.  'conllu' or 'tsv'
+        tag (str): Optional.  Inflect every token with this tag instead of its own
+        form_num (int): Optional.  When more than one form is associated with the tag, use this
+            index in the list.  The default is 0.
+        inflect_oov (bool): Optional.  If True, use the inflection rules for words not in the data
+        lemma_col (int): Optional.  For TSV, the column with the lemma
+        tag_col (int): Optional.  For TSV, the column with the treebank tag
+        batch_size (int): Optional.  The number of lines to process at a time
+    '''
+    formats = ('conllu', 'tsv')
+
+    def __init__(self, engine=None, fmt='conllu', tag=None, form_num=0, inflect_oov=False,
+                 lemma_col=1, tag_col=2, batch_size=10000):
+        if fmt not in self.formats:
+            raise ValueError('Unrecognized format = %s.  Must be conllu or tsv' % fmt)
+        if engine is None:
+            from . import InflectionEngine     # import here to avoid a circular import
+            engine = InflectionEngine()
+        self.engine      = engine
+        self.fmt         = fmt
+        self.tag         = tag
+        self.form_num    = form_num
+        self.inflect_oov = inflect_oov
+        self.lemma_col   = lemma_col
+        self.tag_col     = tag_col
+        self.batch_size  = batch_size
+
+    def inflectLines(self, lines):
+        ''' Add the inflections to a batch of lines.  Returns the list of new lines. '''
+        out = list(lines)
+        pairs, positions = [], []
+        for i, line in enumerate(out):
+            fields = self._tokenFields(line)
+            if fields is None:
+                continue
+            if self.fmt == 'conllu':
+                text, lemma, tag = fields[1], fields[2], fields[4]
+            else:
+                text, lemma, tag = None, fields[self.lemma_col], fields[self.tag_col]
+            if text is not None and not text.islower():
+                lemma = self.engine._applyCapsStyle(lemma, self.engine._getCapsStyle(text))
+            tag = self.tag or tag
+            tagged = bool(tag) and tag != '_' and bool(lemma) and lemma != '_'
+            if tagged:
+                pairs.append((lemma, tag))
+            positions.append((i, fields, tagged))
+        results = iter(self.engine.getInflections(pairs, self.inflect_oov))
+        form_num = self.form_num
+        for i, fields, tagged in positions:
+            forms = next(results) if tagged else None
+            if isinstance(forms, str):     # getAllInflectionsOOV's RB form is a string
+                forms = (forms,)
+            form = (forms[form_num] if form_num < len(forms) else forms[0]) if forms else None
+            if self.fmt == 'tsv':
+                fields.append(form or '')
+            elif form is None:
+                continue
+            else:
+                misc = [x for x in fields[9].split('|')
+                        if x != '_' and not x.startswith('Inflection=')]
+                fields[9] = '|'.join(misc + ['Inflection=' + form])
+            line = out[i]
+            out[i] = '\t'.join(fields) + line[len(line.rstrip('\r\n')):]   # same line ending
+        return out
+
+    def inflectFile(self, fin, fout):
+        ''' Add the inflections to a file
+
+        Args:
+            fin (file): The input file (or any iterable of lines)
+            fout (file): The output file
+
+        Returns: the number of lines processed
+        '''
+        count = 0
+        batch = []
+        for line in fin:
+            batch.append(line)
+            if len(batch) >= self.batch_size:
+                fout.writelines(self.inflectLines(batch))
+                count += len(batch)
+                batch = []
+        if batch:
+            fout.writelines(self.inflectLines(batch))
+            count += len(batch)
+        return count
+
+    def run(self, in_fn, out_fn, n_process=1, chunk_size=1<<24):
+        ''' Add the inflections to a file, optionally using several processes
+
+        For more than one process, the input is split into chunks of about chunk_size bytes
+        (at sentence breaks for CoNLL-U) which are processed separately and then joined in order.
+
+        Args:
+            in_fn (str): The input filename
+            out_fn (str): The output filename
+            n_process (int): Optional.  The number of processes to use
+            chunk_size (int): Optional.  The size of the chunks for each process, in bytes
+
+        Returns: the number of lines processed
+        '''
+        if n_process <= 1:
+            with open(in_fn, encoding='utf-8', newline='') as fin, \
+                 open(out_fn, 'w', encoding='utf-8', newline='') as fout:
+                return self.inflectFile(fin, fout)
+        tmp_dir = tempfile.mkdtemp(dir=os.path.dirname(os.path.abspath(out_fn)))
+        try:
+            chunks = [(self, in_fn, start, end, os.path.join(tmp_dir, '%06d' % i))
+                      for i, (start, end) in enumerate(self._splitFile(in_fn, chunk_size))]
+            pool = multiprocessing.Pool(n_process)
+            try:
+                counts = pool.map(_runChunk, chunks, chunksize=1)
+            finally:
+                pool.close()
+                pool.join()
+            with open(out_fn, 'wb') as fout:
+                for chunk in chunks:
+                    with open(chunk[-1], 'rb') as f:
+                        shutil.copyfileobj(f, fout)
+            return sum(counts)
+        finally:
+            shutil.rmtree(tmp_dir)
+
+    #######################################################
+    ### Private Methods                                 ###
+    #######################################################
+
+    # Split a token line into its fields, or return None for lines that aren't tokens
+    def _tokenFields(self, line):
+        line = line.rstrip('\r\n')
+        if not line or line.startswith('#'):
+            return None
+        fields = line.split('\t')
+        if self.fmt == 'conllu':
+            # Multi-word tokens (1-2) and empty nodes (1.1) don't have tags
+            if len(fields) != 10 or not fields[0].isdigit():
+                return None
+        elif len(fields) <= max(self.lemma_col, self.tag_col):
+            return None
+        return fields
+
+    # Return the (start, end) byte offsets of the chunks of a file.  Chunks end after a blank
+    # line for CoNLL-U (so sentences aren't split) or after a newline for TSV.
+    def _splitFile(self, fn, chunk_size):
+        size = os.path.getsize(fn)
+        chunks = []
+        start = 0
+        with open(fn, 'rb') as f:
+            while start < size:
+                f.seek(min(start + chunk_size, size))
+                if f.tell() < size:
+                    f.readline()    # finish the current line
+                    if self.fmt == 'conllu':
+                        while True:
+                            line = f.readline()
+                            if not line or not line.strip():
+                                break
+                end = f.tell()
+                chunks.append((start, end))
+                start = end
+        return chunks
+
+
+# Process one chunk of a file.  This is run in the worker processes.  The inflector (and its
+# engine) are pickled, which for Inflections sends a handle to its data files.
+def _runChunk(chunk):
+    inflector, in_fn, start, end, out_fn = chunk
+    with open(in_fn, 'rb') as f, open(out_fn, 'w', encoding='utf-8', newline='') as fout:
+        f.seek(start)
+        lines = (line.decode('utf-8') for line in _readLines(f, end))
+        return inflector.inflectFile(lines, fout)
+
+
+# Generate the lines of a binary file up to the end offset
+def _readLines(f, end):
+    while f.tell() < end:
+        line = f.readline()
+        if not line:
+            break
+        yield line
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Add inflections to a CoNLL-U or TSV file')
+    parser.add_argument('infile', help='Input file')
+    parser.add_argument('outfile', help='Output file')
+    parser.add_argument('--format', choices=FileInflector.formats, help='File format (default: '
+                        'conllu for .conllu files, otherwise tsv)')
+    parser.add_argument('--tag', help='Inflect every token with this tag instead of its own')
+    parser.add_argument('--form-num', type=int, default=0, help='Form to use when a tag has '
+                        'several')
+    parser.add_argument('--oov', action='store_true', help='Use the rules for unknown lemmas')
+    parser.add_argument('--lemma-col', type=int, default=1, help='TSV lemma column (from 0)')
+    parser.add_argument('--tag-col', type=int, default=2, help='TSV tag column (from 0)')
+    parser.add_argument('--n-process', type=int, default=1, help='Number of processes')
+    args = parser.parse_args(argv)
+    fmt = args.format or ('conllu' if args.infile.endswith('.conllu') else 'tsv')
+    inflector = FileInflector(None, fmt, args.tag, args.form_num, args.oov, args.lemma_col,
+                              args.tag_col)
+    count = inflector.run(args.infile, args.outfile, args.n_process)
+    print('Processed {:,} lines'.format(count))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
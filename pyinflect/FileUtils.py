@@ -0,0 +1,37 @@
+import os
+import hashlib
+
+
+# Helper functions for working with the data files
+
+
+def fileHash(fn, block_size=1<<20):
+    ''' Compute a hash of a file's contents
+
+    Used to detect when a data file (ie.. overrides.csv) has changed so that anything derived
+    from it can be invalidated.
+
+    Args:
+        fn (str): The filename to hash
+        block_size (int): The number of bytes to read at a time
+
+    Returns: The hex digest string of the sha1 hash of the file
+    '''
+    h = hashlib.sha1()
+    with open(fn, 'rb') as f:
+        while True:
+            block = f.read(block_size)
+            if not block:
+                break
+            h.update(block)
+    return h.hexdigest()
+
+
+def userCacheDir():
+    ''' Return the directory for pyinflect's per-user cache files
+
+    This is $XDG_CACHE_HOME/pyinflect, or ~/.cache/pyinflect if XDG_CACHE_HOME isn't set.
+    The directory isn't created here.
+    '''
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'pyinflect')
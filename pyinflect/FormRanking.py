@@ -0,0 +1,178 @@
+import os
+import re
+import sys
+import ast
+import argparse
+import multiprocessing
+from   collections import Counter
+
+
+# Functions for ordering the forms of entries with more than one (ie.. bear/VBN born/borne)
+# by how often they're used in a corpus.  The counts are made at build time and the entries
+# whose order changes are saved to a rankings file, in the same format as overrides.csv.
+# Inflections.loadRankings (or PYINFLECT_RANKINGS=1) puts the forms in that order when the
+# data is loaded so form_num=0 is the most frequent form, with no scoring at lookup time.
+#
+# Counts come from plain text (by word, so a form that's also used for another tag, like "beat",
+# is counted for both), from tagged CoNLL-U files or from the CorpMultiInfls.txt file written by
+# scripts/12_CreateOverridesList.py.  For the last two, the counts are by (lemma, tag, word)
+# which are used in preference to word counts.
+
+# Words in plain text
+word_re = re.compile(r"[a-z]+(?:['-][a-z]+)*")
+# Entries that aren't alternative spellings, so their order isn't changed.  The forms of "be"
+# depend on the person and MD is the present, archaic and past forms of the modal verbs.
+skip_lemmas = frozenset(['be'])
+skip_tags   = frozenset(['MD'])
+
+
+def countWords(fns, n_process=1, chunk_size=1<<24):
+    ''' Count the words in corpus files
+
+    Files are split into chunks of about chunk_size bytes which are counted in parallel.
+
+    Args:
+        fns (list): Filenames of the corpus files.  Files ending in .conllu are counted by
+            (lemma, xpos, form), other files are plain text and are counted by word.
+        n_process (int): Optional.  The number of processes to use
+        chunk_size (int): Optional.  The size of the chunks for each process, in bytes
+
+    Returns: a Counter with lowercase words or (lemma, tag, word) tuples as keys
+    '''
+    chunks = [(fn, start, end) for fn in fns for start, end in _splitFile(fn, chunk_size)]
+    counts = Counter()
+    if n_process <= 1 or len(chunks) <= 1:
+        for chunk in chunks:
+            counts.update(_countChunk(chunk))
+        return counts
+    pool = multiprocessing.Pool(n_process)
+    try:
+        for chunk_counts in pool.imap_unordered(_countChunk, chunks):
+            counts.update(chunk_counts)
+    finally:
+        pool.close()
+        pool.join()
+    return counts
+
+
+def readMultiInfls(fn):
+    ''' Read the counts from CorpMultiInfls.txt (see scripts/12_CreateOverridesList.py)
+
+    Args:
+        fn (str): The filename.  Each line is "lemma/tag -> [(word, count), ...]".
+
+    Returns: a Counter with (lemma, tag, word) keys
+    '''
+    counts = Counter()
+    with open(fn) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            key, mappings = line.split('->', 1)
+            lemma, tag = key.strip().rsplit('/', 1)
+            for word, count in ast.literal_eval(mappings.strip()):
+                counts[(lemma, tag, word)] += count
+    return counts
+
+
+def rankForms(counts, engine=None):
+    ''' Order the forms of the entries with more than one by their counts
+
+    For each lemma / tag, the (lemma, tag, word) counts are used if there are any for its forms,
+    otherwise the word counts are.  Forms with the same count keep their order.  Forms that are
+    listed more than once (ie.. cleave/VBD) are ranked once, so entries whose only change would
+    be moving a repeated form aren't included.
+
+    Args:
+        counts (dict): Counts from countWords and/or readMultiInfls
+        engine (Inflections): Optional.  The inflection engine.  Default is pyinflect's.
+
+    Returns: a dictionary of (lemma, tag) to the tuple of forms, most frequent first, for the
+        entries whose order changes
+    '''
+    if engine is None:
+        from . import InflectionEngine     # import here to avoid a circular import
+        engine = InflectionEngine()
+    rankings = {}
+    for lemma in sorted(set(engine.infl_data) | set(engine.overrides)):
+        if lemma in skip_lemmas:
+            continue
+        entry = dict(engine.infl_data.get(lemma) or {})
+        entry.update(engine.overrides.get(lemma) or {})
+        for tag, forms in entry.items():
+            forms = tuple(dict.fromkeys(forms))     # without repeats, in order
+            if len(forms) < 2 or tag in skip_tags:
+                continue
+            scores = [counts.get((lemma, tag, form), 0) for form in forms]
+            if not any(scores):
+                scores = [counts.get(form, 0) for form in forms]
+            order = sorted(range(len(forms)), key=lambda i: -scores[i])
+            if order != sorted(order):
+                rankings[(lemma, tag)] = tuple(forms[i] for i in order)
+    return rankings
+
+
+def save(fn, rankings):
+    ''' Save the rankings to a file in the format of overrides.csv (lemma,tag,form/form..) '''
+    with open(fn, 'w') as f:
+        for (lemma, tag), forms in sorted(rankings.items()):
+            f.write('%s,%s,%s\n' % (lemma, tag, '/'.join(forms)))
+
+
+#######################################################
+### Private Methods                                 ###
+#######################################################
+
+# Return the (start, end) byte offsets of the chunks of a file, split after newlines
+def _splitFile(fn, chunk_size):
+    size = os.path.getsize(fn)
+    chunks = []
+    start = 0
+    with open(fn, 'rb') as f:
+        while start < size:
+            f.seek(min(start + chunk_size, size))
+            f.readline()    # finish the current line
+            end = min(f.tell(), size)
+            chunks.append((start, end))
+            start = end
+    return chunks
+
+
+# Count the words in one chunk of a file.  This is run in the worker processes.
+def _countChunk(chunk):
+    fn, start, end = chunk
+    with open(fn, 'rb') as f:
+        f.seek(start)
+        text = f.read(end - start).decode('utf-8', 'replace').lower()
+    if not fn.endswith('.conllu'):
+        return Counter(word_re.findall(text))
+    counts = Counter()
+    for line in text.splitlines():
+        fields = line.split('\t')
+        if len(fields) == 10 and fields[0].isdigit():
+            counts[(fields[2], fields[4].upper(), fields[1])] += 1
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Create a rankings file that orders the forms '
+                                     'of multi-form entries by corpus frequency')
+    parser.add_argument('out', help='Output rankings file (ie.. rankings.csv)')
+    parser.add_argument('corpus', nargs='*', help='Corpus files, plain text or .conllu')
+    parser.add_argument('--multi-infls', help='Counts from scripts/12_CreateOverridesList.py '
+                        '(CorpMultiInfls.txt)')
+    parser.add_argument('--n-process', type=int, default=1, help='Number of processes')
+    args = parser.parse_args(argv)
+    from . import Inflections, INFL_FN, OVERRIDES_FN
+    counts = countWords(args.corpus, args.n_process)
+    if args.multi_infls:
+        counts.update(readMultiInfls(args.multi_infls))
+    # Rank the original order, not the default engine's which may already be ranked
+    rankings = rankForms(counts, Inflections(INFL_FN, OVERRIDES_FN))
+    save(args.out, rankings)
+    print('Wrote {:,} rankings to {}'.format(len(rankings), args.out))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,173 @@
+import os
+import sys
+import bisect
+import importlib
+import importlib.util
+import py_compile
+from   array import array
+from   .FileUtils import fileHash
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+
+class FrozenStore(Mapping):
+    ''' Inflection store loaded from a generated python module of the data
+
+    This class is a drop-in replacement for the dictionary normally created by
+    Inflections._loadInflections.  "create" writes infl.csv (and the overrides) to a python
+    module of a few large constants, the sorted lemmas and their infl.csv fields as strings and
+    the offsets of each lemma's fields as bytes, and compiles it.  Importing the module from
+    its cached .pyc is mostly a copy of the constants, so this loads much faster than parsing
+    the csv or a snapshot.  It can also be imported from a zipapp.  Each lemma's fields are
+    converted to the dictionary of treebank tags and forms the first time it's looked up.  The
+    module records the hashes of the files it was built from (see isCurrent).
+
+    Args:
+        fn (str): filename of the generated module (ie.. infl_frozen.py)
+        pos_types (set): Optional.  Only use entries for these pos_types ('V', 'A' and/or 'N')
+    '''
+    header = '# pyinflect-frozen 2'
+
+    def __init__(self, fn, pos_types=None):
+        # Import here to avoid a circular import.  Inflections imports this module.
+        from .Inflections import Inflections
+        self.fn = fn
+        self.pos_types = pos_types
+        self.loadInflLine = Inflections._loadInflLineToDict  # resolved once for get()
+        module = self._loadModule(fn)
+        if getattr(module, 'FORMAT', None) != self.header:
+            raise ValueError('Not a frozen inflection module, or one from another version of '
+                             'pyinflect: %s' % fn)
+        self.lemmas  = module.LEMMAS.split('\n')
+        self.entries = module.ENTRIES
+        self.offsets = array('I', module.OFFSETS)
+        if sys.byteorder == 'big':
+            self.offsets.byteswap()
+        # The overrides the module was built with and the hashes of the files used
+        self.overrides = module.OVERRIDES
+        self.infl_hash      = module.INFL_HASH
+        self.overrides_hash = module.OVERRIDES_HASH
+        self.decoded = {}   # lemma -> {tag:forms} for the lemmas looked up so far
+
+    @classmethod
+    def create(cls, out_fn, infl_fn, overrides=None, byte_compile=True, overrides_fn=None):
+        ''' Create the module from infl.csv
+
+        Args:
+            out_fn (str): The output filename (ie.. infl_frozen.py)
+            infl_fn (str): filename of the AGID simplified CSV file (infl.csv)
+            overrides (dict): Optional.  The overrides to include, from Inflections._loadOverrides
+            byte_compile (bool): Optional.  If True, also compile the module to its cached .pyc
+            overrides_fn (str): Optional.  The file the overrides were loaded from.  Its hash is
+                recorded for isCurrent.
+        '''
+        entries = {}
+        with open(infl_fn) as f:
+            for line in f:
+                lemma, rest = line.strip().split(',', 1)
+                entries.setdefault(lemma, []).append(rest)
+        lemmas = sorted(entries)
+        strings, offsets, pos = [], array('I', [0]), 0
+        for lemma in lemmas:
+            string = ';'.join(entries[lemma])
+            strings.append(string)
+            pos += len(string)
+            offsets.append(pos)
+        if sys.byteorder == 'big':    # the offsets are stored little-endian
+            offsets.byteswap()
+        with open(out_fn, 'w') as f:
+            f.write(cls.header + '\n')
+            f.write('# Generated by pyinflect.FrozenStore.create from %s.  Do not edit.\n' %
+                    os.path.basename(infl_fn))
+            f.write('FORMAT = %r\n' % cls.header)
+            f.write('LEMMAS = %r\n' % '\n'.join(lemmas))
+            f.write('ENTRIES = %r\n' % ''.join(strings))
+            f.write('OFFSETS = %r\n' % offsets.tobytes())
+            f.write('OVERRIDES = %r\n' % (overrides or {}))
+            f.write('INFL_HASH = %r\n' % fileHash(infl_fn))
+            f.write('OVERRIDES_HASH = %r\n' % (fileHash(overrides_fn) if overrides_fn else None))
+        if byte_compile:
+            cls.compile(out_fn)
+
+    @staticmethod
+    def compile(fn):
+        ''' Compile the module to its cached .pyc, for installs where that can't be written '''
+        py_compile.compile(fn, doraise=True)
+
+    def isCurrent(self, infl_fn, overrides_fn=None):
+        ''' Check that the module was built from the current data files
+
+        Args:
+            infl_fn (str): filename of the AGID simplified CSV file (infl.csv)
+            overrides_fn (str): Optional.  filename of the overrides file
+
+        Returns: False if either file exists and isn't the one the module was built from.  Files
+            that don't exist (ie.. in a zipapp with only the module) aren't checked.
+        '''
+        for fn, built_hash in ((infl_fn, self.infl_hash), (overrides_fn, self.overrides_hash)):
+            if fn and os.path.exists(fn) and fileHash(fn) != built_hash:
+                return False
+        return True
+
+    @classmethod
+    def isFrozenFile(cls, fn):
+        ''' Return True if the file is a frozen module (by its .py extension) '''
+        return fn.endswith('.py')
+
+    def get(self, lemma, default=None):
+        data = self.decoded.get(lemma)
+        if data is not None:
+            return data
+        i = bisect.bisect_left(self.lemmas, lemma)
+        if i == len(self.lemmas) or self.lemmas[i] != lemma:
+            return default
+        data = {}
+        for line in self.entries[self.offsets[i]:self.offsets[i+1]].split(';'):
+            x = line.split(',')
+            if self.pos_types and x[0] not in self.pos_types:
+                continue
+            forms = [tuple(f.split('/')) for f in x[1:]]
+            data = self.loadInflLine(data, lemma, x[0], forms)
+        if not data:
+            return default
+        self.decoded[lemma] = data = data[lemma]
+        return data
+
+    def __getitem__(self, lemma):
+        forms = self.get(lemma)
+        if forms is None:
+            raise KeyError(lemma)
+        return forms
+
+    def __contains__(self, lemma):
+        return self.get(lemma) is not None
+
+    def __iter__(self):
+        if not self.pos_types:
+            return iter(self.lemmas)
+        return (lemma for lemma in self.lemmas if lemma in self)
+
+    def __len__(self):
+        if not self.pos_types:
+            return len(self.lemmas)
+        return sum(1 for _ in self)
+
+    #######################################################
+    ### Private Methods                                 ###
+    #######################################################
+
+    # Import the module.  Modules in the pyinflect package are imported by name so this works
+    # when it's in a zipapp.  Either way the cached .pyc is used if it's up to date.
+    @staticmethod
+    def _loadModule(fn):
+        name = os.path.splitext(os.path.basename(fn))[0]
+        if os.path.dirname(os.path.abspath(fn)) == os.path.dirname(os.path.abspath(__file__)):
+            return importlib.import_module('.' + name, __package__)
+        spec = importlib.util.spec_from_file_location('_pyinflect_frozen_' + name, fn)
+        if spec is None:
+            raise IOError('Unable to load frozen inflection module %s' % fn)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
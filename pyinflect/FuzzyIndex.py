@@ -0,0 +1,143 @@
+class FuzzyIndex(object):
+    ''' Index for finding the known lemmas closest to a misspelled word
+
+    This uses the symmetric delete method (as in SymSpell).  Every string made by deleting up
+    to max_distance characters from the start of each lemma is mapped to the lemmas it came
+    from.  A word is looked up by making its own deletes, so candidates are found with dictionary
+    lookups instead of comparing against every lemma.  Candidates are then checked with the
+    edit distance, where swapping two adjacent letters (ie.. recieve -> receive) counts as 1.
+
+    Args:
+        lemmas (iterable): The known lemmas (lowercase)
+        max_distance (int): Optional.  The largest edit distance that can be found
+        prefix_len (int): Optional.  Only the first prefix_len characters are used for the
+            deletes.  This limits the size of the index for long words.
+    '''
+    def __init__(self, lemmas, max_distance=1, prefix_len=7):
+        self.max_distance = max_distance
+        self.prefix_len   = prefix_len
+        self.deletes = {}   # delete -> lemma or a tuple of lemmas
+        for lemma in lemmas:
+            self.add(lemma)
+
+    def add(self, lemma):
+        ''' Add a lemma (lowercase) to the index '''
+        for delete in self._deletes(lemma[:self.prefix_len]):
+            entry = self.deletes.get(delete)
+            if entry is None:
+                self.deletes[delete] = lemma
+            elif isinstance(entry, tuple):
+                if lemma not in entry:
+                    self.deletes[delete] = entry + (lemma,)
+            elif entry != lemma:
+                self.deletes[delete] = (entry, lemma)
+
+    def lookup(self, word, max_distance=None):
+        ''' Find the known lemmas closest to a word
+
+        Args:
+            word (str): The word to lookup (lowercase)
+            max_distance (int): Optional.  The largest edit distance to return.  This can't be
+                more than the index's max_distance.
+
+        Returns: a list of the closest lemmas and their distance, as (lemma, distance), with the
+            most likely first.  The list is empty if nothing is within max_distance.
+        '''
+        if max_distance is None or max_distance > self.max_distance:
+            max_distance = self.max_distance
+        # Search with increasing distance so that close matches are found without checking
+        # all the candidates for the larger distances.  The "level" of a delete is the number
+        # of characters deleted to make it.
+        prefix = word[:self.prefix_len]
+        word_deletes = self._deletesByLevel(prefix, max_distance)
+        for distance in range(max_distance + 1):
+            candidates = set()
+            for level in range(distance + 1):
+                for delete in word_deletes[level]:
+                    entry = self.deletes.get(delete)
+                    if entry is None:
+                        continue
+                    min_len = len(delete) + distance    # lemma prefix length for the level
+                    for lemma in (entry if isinstance(entry, tuple) else (entry,)):
+                        if min(len(lemma), self.prefix_len) <= min_len:
+                            candidates.add(lemma)
+            best = [lemma for lemma in candidates
+                    if editDistance(word, lemma, distance + 1) <= distance]
+            if best:
+                break
+        else:
+            return []
+        # Order the ties so the most likely typo is first.  Swapped letters (teh -> the) are
+        # most likely, then words with the same first letter and length.
+        letters = sorted(word)
+        best.sort(key=lambda lemma: (sorted(lemma) != letters, lemma[:1] != word[:1],
+                                     abs(len(lemma) - len(word)), lemma))
+        return [(lemma, distance) for lemma in best]
+
+    #######################################################
+    ### Private Methods                                 ###
+    #######################################################
+
+    # Return the set of strings made by deleting up to max_distance characters (including the
+    # string itself)
+    def _deletes(self, string, max_distance=None):
+        if max_distance is None:
+            max_distance = self.max_distance
+        deletes = set()
+        for level in self._deletesByLevel(string, max_distance):
+            deletes.update(level)
+        return deletes
+
+    # Return a list where item i is the set of strings made by deleting i characters
+    @staticmethod
+    def _deletesByLevel(string, max_distance):
+        levels = [{string}]
+        seen = {string}
+        for _ in range(max_distance):
+            level = set()
+            for s in levels[-1]:
+                for i in range(len(s)):
+                    d = s[:i] + s[i+1:]
+                    if d not in seen:
+                        seen.add(d)
+                        level.add(d)
+            levels.append(level)
+        return levels
+
+
+def editDistance(a, b, limit=None):
+    ''' Edit distance between two strings where an adjacent transposition counts as one edit
+
+    This is the optimal string alignment distance, ie.. the Levenshtein distance with swaps.
+
+    Args:
+        a (str): The first string
+        b (str): The second string
+        limit (int): Optional.  Only distances less than limit are needed.  Once the distance
+            can't be less, limit is returned.  This is much faster for long strings.
+
+    Returns: the number of insertions, deletions, substitutions and swaps to turn a into b
+    '''
+    if limit is None:
+        limit = max(len(a), len(b)) + 1
+    if abs(len(a) - len(b)) >= limit:
+        return limit
+    # Only the cells within limit of the diagonal can be less than limit
+    big = limit
+    prev2 = None
+    prev = [j if j < limit else big for j in range(len(b) + 1)]
+    for i in range(1, len(a) + 1):
+        cur = [big] * (len(b) + 1)
+        if i < limit:
+            cur[0] = i
+        lo, hi = max(1, i - limit + 1), min(len(b), i + limit - 1)
+        for j in range(lo, hi + 1):
+            cost = 0 if a[i-1] == b[j-1] else 1
+            d = min(prev[j] + 1, cur[j-1] + 1, prev[j-1] + cost)
+            if i > 1 and j > 1 and a[i-1] == b[j-2] and a[i-2] == b[j-1] and prev2[j-2] + 1 < d:
+                d = prev2[j-2] + 1
+            cur[j] = d
+        if min(cur) >= limit:
+            return limit
+        prev2, prev = prev, cur
+    return min(prev[-1], limit)
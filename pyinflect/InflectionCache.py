@@ -0,0 +1,214 @@
+import atexit
+import sqlite3
+import threading
+
+
+class InflectionCache(object):
+    ''' Persistent on-disk cache for inflection lookups
+
+    This class stores the results of getInflection calls in an SQLite file so that they can be
+    re-used across runs.  Entries are keyed on (lemma, tag, variant) where the variant is the
+    flags getInflection sets for the type of lookup (inflect_oov, OOV model and fuzzy).  Entries
+    are also stored with a data version string, identifying the data the values were created from,
+    and only entries for the current version are used.  Engines loaded with different data can
+    share the file without clearing each other's entries.  Inflections.setCache sets the version
+    to the engine's (see Inflections.dataVersion).
+
+    Writes are buffered in memory and committed in batches.  When the number of entries exceeds
+    max_entries the least recently used entries are removed, whatever their version.  purge
+    removes the entries for all other versions.
+
+    Args:
+        fn (str): filename of the SQLite cache file.  It will be created if it doesn't exist.
+        data_version (str): string identifying the data used to create the cached values.
+        max_entries (int): Optional.  The maximum number of entries to keep on disk.
+        batch_size (int): Optional.  Number of buffered writes that triggers a commit to disk.
+    '''
+    def __init__(self, fn, data_version, max_entries=1000000, batch_size=1000):
+        self.fn           = fn
+        self.max_entries  = max_entries
+        self.batch_size   = batch_size
+        self.pending      = {}      # (lemma, tag, variant) -> forms, not yet written to disk
+        self.touched      = set()   # keys read from disk since the last flush
+        self.lock         = threading.Lock()
+        self.conn = sqlite3.connect(fn, check_same_thread=False)
+        self._createTables()
+        self.data_version = None
+        self.version_id   = None    # the row id of data_version in the versions table
+        self._setVersion(data_version)
+        # Use an incrementing counter, rather than time, to track when an entry was last used
+        self.clock = self.conn.execute('SELECT MAX(used) FROM entries').fetchone()[0] or 0
+        atexit.register(self.close)
+
+    def lookup(self, lemma, tag, variant):
+        ''' Lookup a cached getInflection result
+
+        Args:
+            lemma (str): The lemma, as passed to getInflection
+            tag (str): Penn Treebank tag
+            variant (int): The type of lookup.  getInflection uses the flags 1 for inflect_oov,
+                2 for OOV forms ordered by the model and 4 for fuzzy.
+
+        Returns:
+            A tuple of (hit, forms) where hit is True if the key was found in the cache.
+            forms is the cached return value of getInflection (which may be None).
+        '''
+        key = (lemma, tag, int(variant))
+        with self.lock:
+            if key in self.pending:
+                return True, self.pending[key]
+            if self.conn is None:
+                return False, None
+            row = self.conn.execute('SELECT forms FROM entries WHERE version=? AND lemma=? AND '
+                                    'tag=? AND variant=?', (self.version_id,) + key).fetchone()
+            if row is None:
+                return False, None
+            self.touched.add(key)
+        return True, self._decode(row[0])
+
+    def store(self, lemma, tag, variant, forms):
+        ''' Add a getInflection result to the cache
+
+        Args:
+            lemma (str): The lemma, as passed to getInflection
+            tag (str): Penn Treebank tag
+            variant (int): The type of lookup.  getInflection uses the flags 1 for inflect_oov,
+                2 for OOV forms ordered by the model and 4 for fuzzy.
+            forms (tuple): The return value from getInflection (a tuple of forms or None)
+        '''
+        with self.lock:
+            if self.conn is None:   # closed, ie.. lookups made during exit
+                return
+            self.pending[(lemma, tag, int(variant))] = forms
+            if len(self.pending) >= self.batch_size:
+                self._flush()
+
+    def setDataVersion(self, data_version):
+        ''' Change the data version.  Entries are stored and looked up for the new version.
+
+        Args:
+            data_version (str): string identifying the data used to create the cached values.
+        '''
+        with self.lock:
+            if data_version == self.data_version:
+                return
+            self._checkOpen()
+            self._flush()       # the buffered entries are for the old version
+            self._setVersion(data_version)
+
+    def flush(self):
+        ''' Write all buffered entries to disk and evict entries above max_entries '''
+        with self.lock:
+            self._flush()
+
+    def clear(self):
+        ''' Remove all entries from the cache, for all versions '''
+        with self.lock:
+            self._checkOpen()
+            self.pending = {}
+            self.touched = set()
+            self.conn.execute('DELETE FROM entries')
+            self.conn.commit()
+
+    def purge(self):
+        ''' Remove the entries for all data versions except the current one
+
+        Entries for other versions are otherwise only removed when they're the least recently
+        used, so call this after an upgrade (or a change to the data) if the file isn't shared
+        with engines loaded with other data.
+
+        Returns: the number of entries removed
+        '''
+        with self.lock:
+            self._checkOpen()
+            self._flush()
+            count = self.conn.execute('DELETE FROM entries WHERE version!=?',
+                                      (self.version_id,)).rowcount
+            self.conn.execute('DELETE FROM versions WHERE id!=?', (self.version_id,))
+            self.conn.commit()
+        return count
+
+    def close(self):
+        ''' Flush buffered entries and close the file.  This is called automatically at exit. '''
+        with self.lock:
+            if self.conn is None:
+                return
+            self._flush()
+            self.conn.close()
+            self.conn = None
+
+    # The number of entries for the current version
+    def __len__(self):
+        with self.lock:
+            self._checkOpen()
+            self._flush()
+            return self.conn.execute('SELECT COUNT(*) FROM entries WHERE version=?',
+                                     (self.version_id,)).fetchone()[0]
+
+    #######################################################
+    ### Private Methods                                 ###
+    #######################################################
+
+    # Raise an error for operations that need the file after close() was called
+    def _checkOpen(self):
+        if self.conn is None:
+            raise ValueError('The inflection cache %s is closed' % self.fn)
+
+    # Create the tables.  Files from earlier versions, with a single data version in a meta
+    # table, have their entries removed.
+    def _createTables(self):
+        columns = [r[1] for r in self.conn.execute('PRAGMA table_info(entries)')]
+        if columns and 'version' not in columns:
+            self.conn.execute('DROP TABLE entries')
+            self.conn.execute('DROP TABLE IF EXISTS meta')
+        self.conn.execute('CREATE TABLE IF NOT EXISTS versions (id INTEGER PRIMARY KEY, '
+                          'data_version TEXT UNIQUE)')
+        self.conn.execute('CREATE TABLE IF NOT EXISTS entries (version INTEGER, lemma TEXT, '
+                          'tag TEXT, variant INTEGER, forms TEXT, used INTEGER, '
+                          'PRIMARY KEY (version, lemma, tag, variant))')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS entries_used ON entries (used)')
+        self.conn.commit()
+
+    # Set the data version and look up (or add) its id.  Lock must be held, except in __init__.
+    def _setVersion(self, data_version):
+        self.conn.execute('INSERT OR IGNORE INTO versions (data_version) VALUES (?)',
+                          (data_version,))
+        self.conn.commit()
+        self.version_id = self.conn.execute('SELECT id FROM versions WHERE data_version=?',
+                                            (data_version,)).fetchone()[0]
+        self.data_version = data_version
+
+    # Write the pending entries to disk, update the usage of entries that were read and
+    # remove the least recently used entries if there are too many.  Lock must be held.
+    def _flush(self):
+        if self.conn is None or (not self.pending and not self.touched):
+            return
+        self.clock += 1
+        version = (self.version_id,)
+        self.conn.executemany('UPDATE entries SET used=? WHERE version=? AND lemma=? AND tag=? '
+                              'AND variant=?', [(self.clock,) + version + key
+                                                for key in self.touched])
+        self.conn.executemany('INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)',
+                              [version + key + (self._encode(forms), self.clock)
+                               for key, forms in self.pending.items()])
+        count = self.conn.execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+        if count > self.max_entries:
+            self.conn.execute('DELETE FROM entries WHERE rowid IN '
+                              '(SELECT rowid FROM entries ORDER BY used LIMIT ?)',
+                              (count - self.max_entries,))
+        self.conn.commit()
+        self.pending = {}
+        self.touched = set()
+
+    # Forms are stored the same way as in infl.csv, multiple spellings separated by /
+    @staticmethod
+    def _encode(forms):
+        if forms is None:
+            return None
+        return '/'.join(forms)
+
+    @staticmethod
+    def _decode(string):
+        if string is None:
+            return None
+        return tuple(string.split('/'))
@@ -1,12 +1,28 @@
+import gc
+import os
 import sys
+import copy
+import time
+import hashlib
 import logging
-from   copy import deepcopy
+import weakref
 # Make this usable outside of Spacy
 try:
     import spacy
 except ImportError:
     pass
 from . import InflectionRules
+from .SQLiteStore import SQLiteStore
+from .CompactStore import CompactStore
+from .FrozenStore import FrozenStore
+from .PrefixIndex import PrefixIndex
+from .OverlayOverrides import OverlayOverrides
+from .FuzzyIndex import FuzzyIndex
+from .UDTagMap import UDTagMap
+from .FileUtils import fileHash
+from . import Snapshot
+
+_missing = object()
 
 
 class Inflections(object):
@@ -16,22 +32,68 @@ class Inflections(object):
     English words from their lemma, based on the supplied treebank tag.
 
     Args:
-        infl_fn (str): filename of the AGID simplified CSV file.
-        overrides_fn (str): Optional CSV file with overrides to the AGID data.
+        infl_fn (str): filename of the AGID simplified CSV file, an SQLite database (.db)
+            created from it with SQLiteStore.create, a compact file from CompactStore.create
+            or a python module (.py) from FrozenStore.create.
+        overrides_fn (str): Optional CSV file with overrides to the AGID data.  For a database
+            from SQLiteStore.create or a module from FrozenStore.create, the overrides it was
+            built with are used if this is None.
+        snapshot_dir (str): Optional directory for a snapshot of the parsed data.  After the
+            first load, the data is loaded from the snapshot which is much faster than parsing
+            the csv files.  The snapshot is re-created if the data files or version change.
+        pos_types (set): Optional.  Only load data for these pos_types ('V', 'A' and/or 'N').
+            Lemmas and overrides for other types are skipped, which saves memory and load time.
+
+    Instances pickle as a small handle to their data files (see EngineHandle.py), not the data.
     '''
-    def __init__(self, infl_fn, overrides_fn=None):
-        self.infl_data = self._loadInflections(infl_fn)
-        if overrides_fn:
-            self.overrides = self._loadOverrides(overrides_fn)
-        if 'spacy' in sys.modules:
-            min_version = '2.0'
-            mv = min_version.split('.')
-            sv = spacy.__version__.split('.')
-            if sv[0] > mv[0] or (sv[0] == mv[0] and sv[1] >= mv[1]):
-                spacy.tokens.Token.set_extension('inflect', method=self.spacyGetInfl, force=True)
-            else:
-                logging.warning('Spacy extensions are disabled.  Spacy version is %s.  '
-                                'A minimum of %s is required', spacy.__version__, min_version)
+    # All instances in this process, for reuse when unpickling
+    instances = weakref.WeakSet()
+    # UD pos / features to Penn tag conversion, shared by all instances
+    ud_tag_map = UDTagMap()
+    # The pos_type for each treebank tag
+    tag_pos_types = {'VB':'V', 'VBD':'V', 'VBG':'V', 'VBN':'V', 'VBP':'V', 'VBZ':'V', 'MD':'V',
+                     'JJ':'A', 'JJR':'A', 'JJS':'A', 'RB':'A', 'RBR':'A', 'RBS':'A',
+                     'NN':'N', 'NNS':'N', 'NNP':'N', 'NNPS':'N'}
+
+    def __init__(self, infl_fn, overrides_fn=None, snapshot_dir=None, pos_types=None):
+        self.infl_fn      = infl_fn
+        self.overrides_fn = overrides_fn
+        self.snapshot_dir = snapshot_dir
+        # The files applied after loading, in order.  (filename, inherit_overrides) for
+        # createOverlay, (filename, priority) for loadLexicon and (filename, 'rankings') for
+        # loadRankings
+        self.overlay_fns  = ()
+        self.overlay_hashes = ()    # hash of the contents of each of the overlay_fns
+        self.pickle_data   = False
+        self.pickle_handle = None   # created when first pickled
+        self.cache = None
+        self.oov_model = None
+        self.prefix_index = None    # created on first use
+        self.known_forms  = None    # created on first use
+        self.fuzzy_index  = None    # created on first use
+        self.updates = 0            # count of changes to the data after loading
+        self.pos_types = self._checkPosTypes(pos_types)
+        self.load_times = {}        # seconds for each phase of loading (see Diagnostics.py)
+        self.infl_data, self.overrides = self._loadData(infl_fn, overrides_fn, snapshot_dir,
+                                                        self.pos_types, self.load_times)
+        st = time.perf_counter()
+        if self.setSpacyExtensions(self.spacyGetInfl, self.reinflect):
+            self.load_times['spacy'] = time.perf_counter() - st
+        self.instances.add(self)
+
+    def __copy__(self):
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        return new
+
+    def __reduce_ex__(self, protocol):
+        from . import EngineHandle  # import here to avoid a circular import
+        if self.pickle_handle is None:
+            self.pickle_handle = EngineHandle.makeHandle(self)
+        if self.pickle_data:
+            contents = EngineHandle.readContents(self.pickle_handle, protocol)
+            return (EngineHandle.restoreEngine, (self.pickle_handle, contents))
+        return (EngineHandle.restoreEngine, (self.pickle_handle,))
 
     # Get all inflections in the DB
     def getAllInflections(self, lemma, pos_type=None):
@@ -51,12 +113,17 @@ class Inflections(object):
             An empty dictionary is returned if the lemma is not found in the database.
         '''
         # Get the forms for the lemma from the main database
-        forms = deepcopy(self.infl_data.get(lemma.lower(), {}))
-        # Apply any overrides
-        overrides = deepcopy(self.overrides.get(lemma.lower(), {}))
-        forms.update(overrides)
-        if not forms:
+        key = lemma.lower()
+        base = self.infl_data.get(key)
+        overrides = self.overrides.get(key)
+        # Most words looked up aren't in the data so return as early as possible
+        if not base and not overrides:
             return {}
+        # The forms are immutable tuples so a shallow copy is enough to protect the data
+        forms = dict(base) if base else {}
+        # Apply any overrides
+        if overrides:
+            forms.update(overrides)
         # Capitalize all the inflected forms the same as the lemma
         caps_style = self._getCapsStyle(lemma)
         forms = self._applyCapsStyleToDict(forms, caps_style)
@@ -90,6 +157,8 @@ class Inflections(object):
             give the proper inflection. (past/participle form of verbs are tagged VBN and VBD and
             for pos_type = 'A' both JJx and RBx tags are returned).
 
+            If an OOV model is set (see setOOVModel), the form it predicts for the lemma is first.
+
             The capitalization style of the returned forms will be the same as the lemma.
         '''
         caps_style = self._getCapsStyle(lemma)
@@ -110,11 +179,14 @@ class Inflections(object):
             forms = {'NN':(lemma,), 'NNS':(rn[0],gn[0])}
         else:
             raise ValueError('Unrecognized pos_type = %s' % pos_type)
+        # Put the doubled / greco-latin form first if the model predicts those rules
+        if self.oov_model is not None and self.oov_model.predict(lemma, pos_type)[0] != 'R':
+            forms = {tag:f[::-1] for tag, f in forms.items()}
         forms = self._applyCapsStyleToDict(forms, caps_style)
         return forms
 
     # Get all inflections in the DB
-    def getInflection(self, lemma, tag, inflect_oov=False):
+    def getInflection(self, lemma, tag, inflect_oov=False, fuzzy=False):
         ''' Method for getting a lemma's inflection for a specific Penn Treebank tag.
 
         This is a standalone method that takes in a given lemma and returns
@@ -125,6 +197,8 @@ class Inflections(object):
             tag (str):  Penn Treebank tag.  Returned data is limited to this tag.
             inflect_oov (bool): If False only inflections from the AGID lookup are returned.
             If True, InflectionRules via getAllInflectionsOOV will be used to find inflections.
+            fuzzy (bool): If True and the lemma isn't in the data, the closest known lemma
+            (see findLemma) is used.  This is tried before the InflectionRules.
 
         Returns:
             Method returns a tuple of the inflection(s).
@@ -133,8 +207,29 @@ class Inflections(object):
         '''
         # Get the forms for the lemma from the main database
         # and use the treebank tag to find the correct return value
-        # If we don't find anything in the dictionary, use the rules
         forms = self.getAllInflections(lemma, None)
+        if forms or not (inflect_oov or fuzzy):
+            return forms.get(tag, None)
+        # If we don't find anything in the dictionary, try the closest lemma then the rules.
+        # These are the slow lookups, so their results are kept in the persistent cache, if one
+        # is attached.  The cache is read once since another thread may change it (ie.. setCache).
+        # Each type of lookup is cached separately.  The variant is a set of flags for
+        # 1: inflect_oov, 2: OOV forms ordered by the model and 4: fuzzy
+        cache = self.cache
+        variant = 1 if inflect_oov else 0
+        if inflect_oov and self.oov_model is not None:
+            variant |= 2
+        if fuzzy:
+            variant |= 4
+        if cache is not None:
+            hit, form = cache.lookup(lemma, tag, variant)
+            if hit:
+                return form
+        if fuzzy:
+            match = self.findLemma(lemma)
+            if match is not None:
+                match = self._applyCapsStyle(match, self._getCapsStyle(lemma))
+                forms = self.getAllInflections(match, None)
         if not forms and inflect_oov:
             try:
                 pos_type = self._tagToAGIDPOSType(tag)
@@ -142,8 +237,417 @@ class Inflections(object):
             except ValueError:
                 pass
         form = forms.get(tag, None)
+        # getAllInflectionsOOV's RB form is a string, not a tuple, so it isn't cached
+        if cache is not None and not isinstance(form, str):
+            cache.store(lemma, tag, variant, form)
         return form
 
+    def getInflections(self, requests, inflect_oov=False, fuzzy=False):
+        ''' Method for getting the inflections for a batch of lemmas and tags
+
+        Each distinct (lemma, tag) is only looked up once and lowercase lemmas in the data are
+        read directly, without creating their dictionary of all inflections, so this is faster
+        than calling getInflection for each.
+
+        Args:
+            requests (iterable): (lemma, tag) pairs
+            inflect_oov (bool): If True, use the inflection rules for words not in the data
+            fuzzy (bool): If True and a lemma isn't in the data, use the closest known lemma
+
+        Returns:
+            a list with the result of getInflection (a tuple of the forms or None) for each pair
+        '''
+        infl_data, overrides = self.infl_data, self.overrides
+        results = {}
+        out = []
+        for lemma, tag in requests:
+            key = (lemma, tag)
+            form = results.get(key, _missing)
+            if form is _missing:
+                # The forms in the data are lowercase, so for a lowercase lemma that's in the
+                # data they're the same as getInflection's result
+                form = _missing
+                if lemma.islower():
+                    entry = overrides.get(lemma)
+                    base  = infl_data.get(lemma)
+                    if entry or base:
+                        form = entry.get(tag) if entry else None
+                        if form is None and base:
+                            form = base.get(tag)
+                if form is _missing:
+                    form = self.getInflection(lemma, tag, inflect_oov, fuzzy)
+                results[key] = form
+            out.append(form)
+        return out
+
+    def reinflect(self, tokens, changes, form_num=0, inflect_oov=False):
+        ''' Method for rewriting a sentence (or document) with some words changed to new tags
+
+        ie.. to change the tense, pluralize the subject or make a verb agree.  The lookups for
+        all the words are done in one batch (see getInflections).  Each new word has the
+        capitalization style of the word it replaces and the whitespace is kept.  This is also
+        the spaCy extension method "reinflect" for Docs and Spans, ie.. doc._.reinflect(changes).
+
+        Args:
+            tokens (iterable): A spaCy Doc or Span, or an iterable (ie.. a list or generator) of
+                tuples of (text, lemma, tag) or (text, lemma, tag, whitespace).  If whitespace
+                isn't given, tuples are separated by a single space.
+            changes (dict): The new Penn Treebank tag for the words to change.  The keys are
+                token indices (int) to change a single word or tags (str) to change all words
+                with that tag, ie.. {'VBD':'VBZ'}.  An index has precedence over a tag.  Indices
+                are positions in tokens, so for a Span they're relative to the start of the span
+                (token.i - span.start), not the token.i of the Doc.
+            form_num (int): When more than one form is associated with the given tag,
+                use this index in the list.  The default is 0.
+            inflect_oov (bool): If True, use the inflection rules for words not in the data
+
+        Returns: the rewritten text.  Words that can't be inflected are left unchanged.
+        '''
+        index_changes = {k:v for k, v in changes.items() if isinstance(k, int)}
+        tag_changes = {k:v for k, v in changes.items() if not isinstance(k, int)}
+        # Iterables of tuples (ie.. generators) are read into a list.  Docs and Spans have text.
+        if not hasattr(tokens, 'text') and not isinstance(tokens, (list, tuple)):
+            tokens = list(tokens)
+        is_tuples = isinstance(tokens, (list, tuple)) and bool(tokens) and \
+                    isinstance(tokens[0], (list, tuple))
+        words = []      # text with whitespace for each token
+        pairs, changed = [], []
+        for i, token in enumerate(tokens):
+            if is_tuples:
+                text, tag = token[0], token[2]
+                ws = token[3] if len(token) > 3 else ' '
+            else:
+                text, tag, ws = token.text, token.tag_, token.whitespace_
+            words.append(text + ws)
+            new_tag = index_changes.get(i) if index_changes else None
+            if new_tag is None:
+                new_tag = tag_changes.get(tag)
+                if new_tag is None:
+                    continue
+            lemma = token[1] if is_tuples else token.lemma_
+            if text.islower():      # the usual case, same as _applyCapsStyle
+                lemma = lemma.lower()
+            else:
+                lemma = self._applyCapsStyle(lemma, self._getCapsStyle(text))
+            pairs.append((lemma, new_tag))
+            changed.append((i, ws))
+        for (i, ws), forms in zip(changed, self.getInflections(pairs, inflect_oov)):
+            if isinstance(forms, str):     # getAllInflectionsOOV's RB form is a string
+                forms = (forms,)
+            if forms:
+                words[i] = (forms[form_num] if form_num < len(forms) else forms[0]) + ws
+        if is_tuples and len(tokens[-1]) < 4:  # no space after the last token
+            words[-1] = words[-1][:-1]
+        return ''.join(words)
+
+    def getInflectionUD(self, lemma, pos, morph, inflect_oov=False, fuzzy=False):
+        ''' Method for getting a lemma's inflection for a UD part of speech and features
+
+        The pos and features are converted to a Penn Treebank tag (see UDTagMap.py) and then
+        this is the same as getInflection.
+
+        Args:
+            lemma (str): The lemma of the word to lookup
+            pos (str): The UD part of speech, ie.. 'VERB'
+            morph (str or dict): The UD features, ie.. 'Tense=Past|VerbForm=Part', as a string,
+            a dictionary or a spaCy MorphAnalysis (token.morph)
+            inflect_oov (bool): If True, use the inflection rules for words not in the data
+            fuzzy (bool): If True and the lemma isn't in the data, use the closest known lemma
+
+        Returns:
+            Method returns a tuple of the inflection(s), the same as getInflection.
+            None is returned if the lemma / features are not found.
+        '''
+        tag = self.ud_tag_map.toPenn(pos, morph)
+        if tag is None:
+            return None
+        return self.getInflection(lemma, tag, inflect_oov, fuzzy)
+
+    def setCache(self, cache):
+        ''' Attach a persistent cache for getInflection results
+
+        Only the lookups of lemmas that aren't in the data, with inflect_oov or fuzzy, use the
+        cache.  Lemmas in the data are faster to read from memory.  The cache's data version is set to this instance's (see dataVersion) and is updated when
+        loadLexicon, loadRankings or setOOVModel change the results.
+
+        Args:
+            cache (InflectionCache): The cache to use or None to remove the current cache.
+        '''
+        self.cache = cache
+        self._updateCacheVersion()
+
+    def dataVersion(self):
+        ''' Return a string identifying everything this instance's results depend on
+
+        This is a hash of the pyinflect version, the contents of the data and overrides files,
+        the pos_types, the files (or lexicons) applied with createOverlay, loadLexicon and
+        loadRankings and the OOV model.  It's used as the data version of an attached cache so
+        results from an engine loaded with different data are never returned.
+        '''
+        from . import __version__   # import here to avoid a circular import
+        parts = [__version__, fileHash(self.infl_fn),
+                 fileHash(self.overrides_fn) if self.overrides_fn else '',
+                 ''.join(sorted(self.pos_types)) if self.pos_types else '']
+        for (_, option), data_hash in zip(self.overlay_fns, self.overlay_hashes):
+            parts.append('%s:%s' % (option, data_hash))
+        if self.oov_model is not None:
+            if self.oov_model.fn:
+                parts.append(fileHash(self.oov_model.fn))
+            else:
+                parts.append(self._dataHash(sorted((p, sorted(suffixes.items()))
+                                                  for p, suffixes in self.oov_model.suffixes.items())))
+        return self._dataHash(parts)
+
+    def findLemma(self, word, max_distance=None):
+        ''' Find the known lemma closest to a word, ie.. "recieve" -> "receive"
+
+        The fuzzy index (see FuzzyIndex.py) is created the first time this is called.  By
+        default it finds lemmas within an edit distance of 1.  Use setFuzzyIndex to change this.
+
+        Args:
+            word (str): The word to lookup (case insensitive)
+            max_distance (int): Optional.  The largest edit distance to accept.  This can't be
+                more than the fuzzy index's max_distance.
+
+        Returns: the lowercase lemma or None if no lemma is close enough
+        '''
+        key = word.lower()
+        if self.isKnownLemma(key):
+            return key
+        if self.fuzzy_index is None:
+            self.fuzzy_index = FuzzyIndex(set(self.infl_data) | set(self.overrides))
+        matches = self.fuzzy_index.lookup(key, max_distance)
+        return matches[0][0] if matches else None
+
+    def setFuzzyIndex(self, fuzzy_index):
+        ''' Set the index used by findLemma and getInflection(fuzzy=True)
+
+        Args:
+            fuzzy_index (FuzzyIndex): The index, ie.. FuzzyIndex(lemmas, max_distance=2), or
+                None to create the default index when it's next needed.
+        '''
+        self.fuzzy_index = fuzzy_index
+
+    def setOOVModel(self, oov_model):
+        ''' Set the model used to order the forms from getAllInflectionsOOV
+
+        By default the forms from the regular rules are first.  With a model, the form from the
+        rules the model predicts for the lemma (ie.. doubled for "ban" -> "banned") is first.
+        This also applies to getInflection and the spaCy extension when inflect_oov is True.
+
+        Args:
+            oov_model (OOVModel): The model to use, ie.. OOVModel(pyinflect.OOV_MODEL_FN), or
+                None to use the default order.
+        '''
+        self.oov_model = oov_model
+        self.pickle_handle = None
+        self._updateCacheVersion()
+
+    def setPickleData(self, pickle_data):
+        ''' Set if pickling this instance includes the contents of its data files
+
+        By default an instance pickles as a small handle with the data filenames and hashes and
+        is unpickled by reusing or loading the same data on the receiving side (ie.. a Dask,
+        Spark or Ray worker).  Include the data for workers that don't have the files.  They're
+        written to the user cache directory there.  With pickle protocol 5 the data is sent as
+        PickleBuffers which can be transferred out-of-band (see pickle's buffer_callback).
+
+        Args:
+            pickle_data (bool): True to include the file contents
+        '''
+        self.pickle_data = pickle_data
+
+    def createOverlay(self, overrides_fn, inherit_overrides=True):
+        ''' Create an engine with its own overrides that shares this instance's data
+
+        The inflection data and this instance's overrides aren't copied (see OverlayOverrides)
+        so creating an overlay only costs the time to read its overrides file.  This is intended for cases where different users need different
+        overrides (ie.. British vs American spellings).  The overlay does not change the spaCy
+        "inflect" extension, which continues to use the instance it was set up with.
+
+        Args:
+            overrides_fn (str): CSV file with overrides, in the same format as overrides.csv
+            inherit_overrides (bool): If True, this instance's overrides are still used where
+                the new file doesn't override them.  If False only the new overrides are used.
+
+        Returns: a new Inflections instance
+        '''
+        st = time.perf_counter()
+        overlay = copy.copy(self)
+        overlay.cache        = None
+        overlay.prefix_index = None
+        overlay.known_forms  = None
+        overlay.fuzzy_index  = None
+        overlay.overlay_fns   = self.overlay_fns + ((overrides_fn, inherit_overrides),)
+        overlay.overlay_hashes = self.overlay_hashes + (fileHash(overrides_fn),)
+        overlay.pickle_handle = None
+        # The parent's overrides aren't copied.  The new entries are merged with the parent's
+        # entry for the same lemma and looked up in front of them.
+        overrides = self._loadOverrides(overrides_fn, self.pos_types)
+        if inherit_overrides:
+            for lemma, entry in overrides.items():
+                merged = dict(self.overrides.get(lemma) or {})
+                merged.update(entry)
+                overrides[lemma] = merged
+            overrides = OverlayOverrides(overrides, self.overrides)
+        overlay.overrides = overrides
+        overlay.load_times = dict(self.load_times, createOverlay=time.perf_counter() - st)
+        self.instances.add(overlay)
+        return overlay
+
+    def loadLexicon(self, lexicon, priority='high'):
+        ''' Merge a lexicon of extra lemmas and inflections into this instance
+
+        The lexicon is in the same format as infl.csv.  Each line is "lemma,pos_type,forms"
+        where multiple spellings of a form are separated by "/".  Verbs have 4 forms (VBD, VBN,
+        VBG and VBZ, where VBN can be "<>" if it's the same as VBD), adjectives / adverbs have 2
+        (comparative and superlative) and nouns have 1 (plural).  The entries are merged with the
+        overrides so they're used everywhere the overrides are.  If the known forms, the prefix
+        index or the fuzzy index have been created, the new forms and lemmas are added to them
+        instead of re-creating them.  An attached cache is switched to the new data version.
+
+        Args:
+            lexicon (str or iterable): Filename of the lexicon or an iterable of its lines (or of
+                lists of the fields).  Lines that are empty or start with # are skipped.
+            priority (str): Optional.  'high' for the lexicon's forms to replace the existing
+                forms for the same lemma and tag, or 'low' to only add lemmas and tags that
+                aren't already in the data.
+
+        Returns: the number of lemmas that were added or changed
+        '''
+        if priority not in ('high', 'low'):
+            raise ValueError('Unrecognized priority = %s.  Must be high or low' % priority)
+        st = time.perf_counter()
+        # Parsing creates many containers, see _loadData
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            if isinstance(lexicon, str):
+                with open(lexicon) as f:
+                    entries = self._loadLexiconLines(f)
+                fn = os.path.abspath(lexicon)
+                data_hash = fileHash(fn)
+            else:
+                entries = self._loadLexiconLines(lexicon)
+                fn = None   # can't be pickled
+                data_hash = self._dataHash(sorted(entries.items()))
+            count = self._mergeLexicon(entries, priority)
+        finally:
+            if gc_enabled:
+                gc.enable()
+        self.overlay_fns    = self.overlay_fns + ((fn, priority),)
+        self.overlay_hashes = self.overlay_hashes + (data_hash,)
+        self.pickle_handle  = None
+        self.updates += 1
+        self._updateCacheVersion()
+        self.load_times['loadLexicon'] = self.load_times.get('loadLexicon', 0.0) + \
+                                         time.perf_counter() - st
+        return count
+
+    def loadRankings(self, rankings_fn):
+        ''' Put the forms of entries with more than one in the order of a rankings file
+
+        The rankings file is created from corpus counts by FormRanking.py so the most frequent
+        form is first (ie.. bear/VBN is ('born', 'borne')).  It's in the same format as
+        overrides.csv.  Entries are only reordered, rankings that don't have the same forms as
+        the current entry are skipped.  Forms listed more than once in the entry are only kept
+        once, in the ranked position.  The reordered entries are merged with the overrides.
+        An attached cache is switched to the new data version.
+
+        Args:
+            rankings_fn (str): The rankings file
+
+        Returns: the number of entries that were reordered
+        '''
+        st = time.perf_counter()
+        overrides = dict(self.overrides)
+        count = 0
+        for lemma, entry in self._loadOverrides(rankings_fn, self.pos_types).items():
+            current = overrides.get(lemma)
+            base = self.infl_data.get(lemma) or {}
+            merged = dict(current) if current else {}
+            for tag, forms in entry.items():
+                old_forms = merged.get(tag) or base.get(tag)
+                if old_forms and old_forms != forms and len(set(forms)) == len(forms) and \
+                   set(old_forms) == set(forms):
+                    merged[tag] = forms
+                    count += 1
+            if merged != (current or {}):
+                overrides[lemma] = merged
+        self.overrides = overrides
+        self.overlay_fns    = self.overlay_fns + ((rankings_fn, 'rankings'),)
+        self.overlay_hashes = self.overlay_hashes + (fileHash(rankings_fn),)
+        self.pickle_handle  = None
+        self.updates += 1
+        self._updateCacheVersion()
+        self.load_times['loadRankings'] = time.perf_counter() - st
+        return count
+
+    def isKnownLemma(self, lemma):
+        ''' Check if a lemma is in the inflection data (case insensitive)
+
+        Args:
+            lemma (str): The lemma to lookup
+
+        Returns: True or False
+        '''
+        key = lemma.lower()
+        return key in self.infl_data or key in self.overrides
+
+    def isKnownForm(self, word):
+        ''' Check if a word is an inflected form of any lemma in the data (case insensitive)
+
+        The set of forms is created the first time this is called.  For an SQLiteStore the
+        database's bloom filter and form index are used instead.
+
+        Args:
+            word (str): The word to lookup
+
+        Returns: True or False
+        '''
+        key = word.lower()
+        if self.known_forms is None:
+            self.known_forms = self._buildKnownForms()
+        if key in self.known_forms:
+            return True
+        if isinstance(self.infl_data, SQLiteStore):
+            return self.infl_data.hasForm(key)
+        return False
+
+    def iterPrefix(self, prefix, pos_type=None, forms=False):
+        ''' Generate all lemmas starting with a prefix along with their inflections
+
+        This is a generator so matches are only looked up as they are consumed.  The prefix index
+        is built the first time this is called.
+
+        Args:
+            prefix (str): The prefix to search for (case insensitive)
+            pos_type (str): Optional.  Must be 'V', 'A' or 'N' (Verb, Adverb/Adjective, Noun)
+                Only lemmas with inflections of this type are returned.
+            forms (bool): If True, lemmas with an inflected form starting with prefix are also
+                returned (ie.. "ate" finds "eat").
+
+        Returns:
+            Generates tuples of (lemma, inflections) where inflections is the dictionary returned
+            by getAllInflections.  Lemmas are returned in sorted order, except when forms=True
+            where they are ordered by the matching lemma or form.
+        '''
+        if self.prefix_index is None:
+            self.prefix_index = PrefixIndex(self.infl_data, [self.overrides])
+        prefix = prefix.lower()
+        if forms:
+            lemmas = (lemma for _, lemma in self.prefix_index.iterForms(prefix))
+        else:
+            lemmas = self.prefix_index.iterLemmas(prefix)
+        seen = set()
+        for lemma in lemmas:
+            if lemma in seen:
+                continue
+            seen.add(lemma)
+            infls = self.getAllInflections(lemma, pos_type)
+            if infls:
+                yield lemma, infls
+
     def spacyGetInfl(self, token, tag, form_num=0, inflect_oov=False):
         ''' Spacy extension method "inflect"
 
@@ -175,31 +679,115 @@ class Inflections(object):
         else:
             return tag_form[0]
 
+    @staticmethod
+    def setSpacyExtensions(inflect, reinflect):
+        ''' Set the spaCy extension methods, if spaCy has been imported
+
+        This is called when an instance is created, with its spacyGetInfl and reinflect methods.
+
+        Args:
+            inflect (function): The Token extension method "inflect"
+            reinflect (function): The Doc and Span extension method "reinflect"
+
+        Returns: True if spaCy has been imported, even if its version is too old for extensions
+        '''
+        if 'spacy' not in sys.modules:
+            return False
+        min_version = '2.0'
+        mv = min_version.split('.')
+        sv = spacy.__version__.split('.')
+        if sv[0] > mv[0] or (sv[0] == mv[0] and sv[1] >= mv[1]):
+            spacy.tokens.Token.set_extension('inflect', method=inflect, force=True)
+            spacy.tokens.Doc.set_extension('reinflect', method=reinflect, force=True)
+            spacy.tokens.Span.set_extension('reinflect', method=reinflect, force=True)
+        else:
+            logging.warning('Spacy extensions are disabled.  Spacy version is %s.  '
+                            'A minimum of %s is required', spacy.__version__, min_version)
+        return True
+
     #######################################################
     ### Private Methods                                 ###
     #######################################################
 
+    # Load the inflections and overrides, using a snapshot of the parsed data when possible
+    # If load_times is supplied, the time for each phase is added to it
+    @classmethod
+    def _loadData(cls, infl_fn, overrides_fn, snapshot_dir, pos_types=None, load_times=None):
+        load_times = {} if load_times is None else load_times
+        # Only the fully loaded csv data is saved to a snapshot
+        use_snapshot = snapshot_dir and not infl_fn.endswith('.db') and \
+                       not FrozenStore.isFrozenFile(infl_fn) and \
+                       not CompactStore.isCompactFile(infl_fn)
+        # Garbage collection passes triggered by all the new containers are a large
+        # fraction of the load time and there's nothing to collect here.
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            if use_snapshot:
+                from . import __version__   # import here to avoid a circular import
+                options = ''.join(sorted(pos_types)) if pos_types else ''
+                st   = time.perf_counter()
+                key  = Snapshot.snapshotKey(infl_fn, overrides_fn, __version__, options)
+                data = Snapshot.loadSnapshot(snapshot_dir, key)
+                load_times['snapshot'] = time.perf_counter() - st
+                if isinstance(data, tuple) and len(data) == 2:
+                    return data
+            st = time.perf_counter()
+            infl_data = cls._loadInflections(infl_fn, pos_types)
+            load_times['_loadInflections'] = time.perf_counter() - st
+            st = time.perf_counter()
+            if overrides_fn:
+                overrides = cls._loadOverrides(overrides_fn, pos_types)
+            elif isinstance(infl_data, (SQLiteStore, FrozenStore)):
+                overrides = cls._filterPosTypes(infl_data.overrides, pos_types)
+            else:
+                overrides = {}
+            load_times['_loadOverrides'] = time.perf_counter() - st
+            if use_snapshot:
+                st = time.perf_counter()
+                Snapshot.saveSnapshot(snapshot_dir, key, (infl_data, overrides))
+                load_times['snapshot'] += time.perf_counter() - st
+            return infl_data, overrides
+        finally:
+            if gc_enabled:
+                gc.enable()
+
     # Load infl.csv file
+    # If pos_types is supplied, lines for other pos types are skipped
     @classmethod
-    def _loadInflections(cls, fn):
+    def _loadInflections(cls, fn, pos_types=None):
+        # The SQLite store reads entries from disk as needed instead of loading them all
+        if fn.endswith('.db'):
+            return SQLiteStore(fn, pos_types)
+        # The frozen store is imported from a generated module and decodes entries as needed
+        if FrozenStore.isFrozenFile(fn):
+            return FrozenStore(fn, pos_types)
+        # The compact store creates the forms from paradigm codes as they're looked up
+        if CompactStore.isCompactFile(fn):
+            return CompactStore(fn, pos_types)
         data = {}
         with open(fn) as f:
             for line in f:
                 line = line.strip()
                 x = line.split(',')
+                if pos_types and x[1] not in pos_types:
+                    continue
                 # Forms may have multiple spellings separated by /
                 forms = [tuple(f.split('/')) for f in x[2:]]
                 data = cls._loadInflLineToDict(data, x[0], x[1], forms)
         return data
 
     # Load the overrides.csv file
-    @staticmethod
-    def _loadOverrides(fn):
+    # If pos_types is supplied, overrides for tags of other pos types are skipped
+    @classmethod
+    def _loadOverrides(cls, fn, pos_types=None):
         data = {}
         with open(fn) as f:
             for line in f:
                 line = line.strip()
                 lemma, tag, forms = line.split(',')
+                if pos_types and cls._tagToAGIDPOSType(tag) not in pos_types:
+                    continue
                 forms = tuple(forms.split('/'))
                 entry = {tag:forms}
                 if lemma not in data:
@@ -208,9 +796,125 @@ class Inflections(object):
                     data[lemma].update(entry)
         return data
 
-    # Converts the Penn Treebank tag string to V, A or N
+    # Return a copy of the overrides with only the tags for pos_types
+    @classmethod
+    def _filterPosTypes(cls, overrides, pos_types=None):
+        if not pos_types:
+            return dict(overrides)
+        data = {}
+        for lemma, entry in overrides.items():
+            entry = {tag:forms for tag, forms in entry.items()
+                     if cls.tag_pos_types.get(tag) in pos_types}
+            if entry:
+                data[lemma] = entry
+        return data
+
+    # Parse the lines of a lexicon file, returning a dictionary of lemma to {tag:forms}
+    def _loadLexiconLines(self, lines):
+        num_forms = {'V':4, 'A':2, 'N':1}
+        data = {}
+        for line in lines:
+            if isinstance(line, str):
+                line = line.strip().lower()
+                if not line or line.startswith('#'):
+                    continue
+                x = line.split(',')
+            else:
+                x = [field.strip().lower() for field in line]
+            if len(x) > 1:
+                x[1] = x[1].upper()
+            if len(x) < 2 or x[1] not in num_forms:
+                raise ValueError('Invalid lexicon line = %s' % ','.join(x))
+            if self.pos_types and x[1] not in self.pos_types:
+                continue
+            forms = [tuple(f.split('/')) for f in x[2:]]
+            if len(forms) < num_forms[x[1]]:
+                raise ValueError('Invalid lexicon line = %s.  %s entries need %d forms' %
+                                 (','.join(x), x[1], num_forms[x[1]]))
+            data = self._loadInflLineToDict(data, x[0], x[1], forms)
+        return data
+
+    # Merge the lexicon entries into the overrides and update the indices.  Returns the number
+    # of lemmas added or changed.
+    def _mergeLexicon(self, entries, priority):
+        # Copy so that instances sharing the overrides (ie.. from createOverlay) aren't changed
+        overrides = dict(self.overrides)
+        # The indices include the forms of both the data and the overrides, so forms replaced
+        # by the lexicon are kept, the same as when they're created.
+        has_indices = self.known_forms is not None or self.prefix_index is not None
+        track_lemmas = has_indices or self.fuzzy_index is not None
+        new_lemmas, new_pairs = [], set()
+        count = 0
+        for lemma, entry in entries.items():
+            current = overrides.get(lemma)
+            if priority == 'low':
+                # The base data is only read when needed since this is slow for an SQLiteStore
+                base = self.infl_data.get(lemma)
+                entry = {tag:forms for tag, forms in entry.items()
+                         if not (base and tag in base) and not (current and tag in current)}
+                if not entry:
+                    continue
+            if track_lemmas and not current and lemma not in self.infl_data:
+                new_lemmas.append(lemma)
+            if has_indices:
+                for forms in entry.values():
+                    new_pairs.update((form, lemma) for form in forms)
+            merged = dict(current) if current else {}
+            merged.update(entry)
+            overrides[lemma] = merged
+            count += 1
+        self.overrides = overrides
+        if self.known_forms is not None:
+            self.known_forms.update(form for form, _ in new_pairs)
+        if self.prefix_index is not None:
+            self.prefix_index = self.prefix_index.merge(new_lemmas, new_pairs)
+        if self.fuzzy_index is not None:
+            for lemma in new_lemmas:
+                self.fuzzy_index.add(lemma)
+        return count
+
+    # Set the data version of an attached cache to this instance's
+    def _updateCacheVersion(self):
+        cache = self.cache
+        if cache is not None:
+            cache.setDataVersion(self.dataVersion())
+
+    # Hash of the repr of some data, for data versions
     @staticmethod
-    def _tagToAGIDPOSType(tag):
+    def _dataHash(data):
+        return hashlib.sha1(repr(data).encode('utf-8')).hexdigest()
+
+    # Create the set of all inflected forms.  SQLite forms are only looked up on disk.  It's
+    # a set, not a frozenset, so loadLexicon can add to it.
+    def _buildKnownForms(self):
+        known_forms = set()
+        sources = [self.overrides]
+        if not isinstance(self.infl_data, SQLiteStore):
+            sources.append(self.infl_data)
+        for data in sources:
+            for tag_forms in data.values():
+                for forms in tag_forms.values():
+                    known_forms.update(forms)
+        return known_forms
+
+    # Validate the pos_types and return them as a frozenset (or None for all types)
+    @staticmethod
+    def _checkPosTypes(pos_types):
+        if not pos_types:
+            return None
+        pos_types = frozenset(pos_types)
+        if not pos_types.issubset(['V', 'A', 'N']):
+            raise ValueError('Unrecognized pos_types =%s.  Must be V, A or N' % sorted(pos_types))
+        return pos_types
+
+    # Converts the Penn Treebank tag string to V, A or N
+    @classmethod
+    def _tagToAGIDPOSType(cls, tag):
+        pos_type = cls.tag_pos_types.get(tag)
+        if pos_type is not None:
+            return pos_type
+        if not tag:
+            raise ValueError('Unrecognized tag = %r.  The tag is empty' % tag)
         pos_type = tag[0]
         if pos_type in ['J', 'R']:
             pos_type = 'A'
@@ -0,0 +1,109 @@
+from   collections import Counter
+from . import Paradigms
+
+
+class OOVModel(object):
+    ''' Suffix based model for predicting the inflection rules an unknown lemma follows
+
+    The model is learned from infl.csv.  Each regular AGID entry is described by its paradigm
+    code (see Paradigms.py), ie.. "R" for the regular rules, "D" for doubled (ban -> banned) or
+    "G" for Greco-Latin (focus -> foci).  The code of an unknown lemma is predicted from the
+    most common code of the known lemmas with the same ending.  The endings are stored as a
+    suffix tree where an ending is only kept when its code differs from its parent's (shorter)
+    ending, so the model is small and a prediction is a few dictionary lookups.
+
+    The model file has a header line and then lines of "pos_type,suffix,code".  Use "train" and
+    "save" to create it.  It's built by DataBuilder as oov_model.csv.
+
+    Args:
+        fn (str): Optional.  The model file to load
+    '''
+    header = '#pyinflect-oov 1'
+
+    def __init__(self, fn=None):
+        self.fn = fn
+        self.suffixes = {'V':{}, 'A':{}, 'N':{}}   # pos_type -> {suffix:code}
+        self.max_suffix = 0
+        if fn is not None:
+            self._load(fn)
+
+    @classmethod
+    def train(cls, infl_fn, max_suffix=6, min_count=2, lemmas=None):
+        ''' Learn a model from the AGID data
+
+        Args:
+            infl_fn (str): filename of the AGID simplified CSV file (infl.csv)
+            max_suffix (int): Optional.  The longest ending to use
+            min_count (int): Optional.  Endings seen fewer times than this aren't used
+            lemmas (set): Optional.  Only train with these lemmas (ie.. for a held-out test)
+
+        Returns: an OOVModel
+        '''
+        counts = {'V':{}, 'A':{}, 'N':{}}   # pos_type -> {suffix:Counter(code)}
+        with open(infl_fn) as f:
+            for line in f:
+                parts = line.strip().split(',')
+                lemma, pos_type = parts[0], parts[1]
+                if lemmas is not None and lemma not in lemmas:
+                    continue
+                forms = [tuple(x.split('/')) for x in parts[2:]]
+                code = Paradigms.classify(lemma, pos_type, forms)
+                if code is None:    # irregular
+                    continue
+                for i in range(min(max_suffix, len(lemma)) + 1):
+                    suffix = lemma[len(lemma)-i:]
+                    counts[pos_type].setdefault(suffix, Counter())[code] += 1
+        model = cls()
+        model.max_suffix = max_suffix
+        for pos_type, suffix_counts in counts.items():
+            suffixes = model.suffixes[pos_type]
+            # Shorter suffixes first so each parent is decided before its children
+            for suffix in sorted(suffix_counts, key=len):
+                code_counts = suffix_counts[suffix]
+                if suffix and sum(code_counts.values()) < min_count:
+                    continue
+                code = code_counts.most_common(1)[0][0]
+                if not suffix or code != model._predictSuffix(pos_type, suffix[1:]):
+                    suffixes[suffix] = code
+        return model
+
+    def save(self, fn):
+        ''' Save the model to a file '''
+        with open(fn, 'w') as f:
+            f.write(self.header + '\n')
+            for pos_type in sorted(self.suffixes):
+                for suffix, code in sorted(self.suffixes[pos_type].items()):
+                    f.write('%s,%s,%s\n' % (pos_type, suffix, code))
+
+    def predict(self, lemma, pos_type):
+        ''' Predict the paradigm code for a lemma
+
+        Args:
+            lemma (str): The lemma
+            pos_type (str): 'V', 'A' or 'N'
+
+        Returns: the paradigm code (ie.. 'R', 'D' or 'G'), the regular rules 'R' if unknown
+        '''
+        return self._predictSuffix(pos_type, lemma.lower()[-self.max_suffix:])
+
+    #######################################################
+    ### Private Methods                                 ###
+    #######################################################
+
+    # Return the code for the longest stored ending of the suffix
+    def _predictSuffix(self, pos_type, suffix):
+        suffixes = self.suffixes.get(pos_type, {})
+        for i in range(len(suffix) + 1):
+            code = suffixes.get(suffix[i:])
+            if code is not None:
+                return code
+        return 'R'
+
+    def _load(self, fn):
+        with open(fn) as f:
+            if not f.readline().startswith(self.header):
+                raise ValueError('Not an OOV model file: %s' % fn)
+            for line in f:
+                pos_type, suffix, code = line.strip().split(',')
+                self.suffixes[pos_type][suffix] = code
+                self.max_suffix = max(self.max_suffix, len(suffix))
@@ -0,0 +1,48 @@
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+
+class OverlayOverrides(Mapping):
+    ''' The overrides of an overlay, in front of the overrides of the instance it was created from
+
+    This class is used in place of the overrides dictionary by Inflections.createOverlay so the
+    parent's overrides aren't copied and creating an overlay costs roughly the size of its own
+    override file.  The overlay's entries are already merged with the parent's entry for the
+    same lemma, so a lookup is a dictionary get in each and the parent's overrides (which may
+    be another overlay's) are only read for lemmas the overlay doesn't override.
+
+    Args:
+        own (dict): The overlay's entries of lemma to {tag:forms}
+        parent (dict): The parent instance's overrides
+    '''
+    def __init__(self, own, parent):
+        self.own    = own
+        self.parent = parent
+
+    def get(self, lemma, default=None):
+        entry = self.own.get(lemma)
+        if entry is not None:
+            return entry
+        return self.parent.get(lemma, default)
+
+    def __getitem__(self, lemma):
+        entry = self.get(lemma)
+        if entry is None:
+            raise KeyError(lemma)
+        return entry
+
+    def __contains__(self, lemma):
+        return lemma in self.own or lemma in self.parent
+
+    def __iter__(self):
+        for lemma in self.own:
+            yield lemma
+        for lemma in self.parent:
+            if lemma not in self.own:
+                yield lemma
+
+    # Only the overlay's own entries are checked, not the parent's
+    def __len__(self):
+        return len(self.parent) + sum(1 for lemma in self.own if lemma not in self.parent)
@@ -0,0 +1,68 @@
+from . import InflectionRules
+
+
+# This file contains functions for describing an AGID entry with a short paradigm code
+# instead of its explicit forms.  The code is a string of letters where each letter is a set
+# of inflection rules and gives one spelling for every form, in order.
+#   R : regular rules (buildRegVerb, buildRegAdjAdv, buildRegNoun)
+#   D : doubled rules (buildDoubledVerb, buildDoubledAdjAdv), verbs and adjectives/adverbs only
+#   G : Greco-Latin rules (buildGrecNoun), nouns only
+# For example, cancel,V,cancelled/canceled,<>,cancelling/canceling,cancels has the code "DR".
+# Entries that can't be described this way are irregular and must be stored explicitly.
+
+# The codes tried when classifying an entry, for each pos_type
+candidate_codes = {'V':['R', 'D', 'RD', 'DR'],
+                   'A':['R', 'D', 'RD', 'DR'],
+                   'N':['R', 'G', 'RG', 'GR']}
+
+rule_functions = {'V':{'R':InflectionRules.buildRegVerb, 'D':InflectionRules.buildDoubledVerb},
+                  'A':{'R':InflectionRules.buildRegAdjAdv, 'D':InflectionRules.buildDoubledAdjAdv},
+                  'N':{'R':InflectionRules.buildRegNoun, 'G':InflectionRules.buildGrecNoun}}
+
+
+def classify(lemma, pos_type, forms):
+    ''' Find the paradigm code that reproduces an AGID entry
+
+    Args:
+        lemma (str): The lemma
+        pos_type (str): 'V', 'A' or 'N'
+        forms (list): The forms as a list of tuples, in the infl.csv order
+
+    Returns: the paradigm code or None if the entry is irregular
+    '''
+    forms = list(forms)
+    for code in candidate_codes.get(pos_type, []):
+        if expand(lemma, pos_type, code) == forms:
+            return code
+    return None
+
+
+def expand(lemma, pos_type, code):
+    ''' Create the forms for a lemma from its paradigm code
+
+    Args:
+        lemma (str): The lemma
+        pos_type (str): 'V', 'A' or 'N'
+        code (str): The paradigm code
+
+    Returns: The forms as a list of tuples, in the same order and format as infl.csv
+        (for verbs the past participle is always '<>', meaning the same as past tense)
+    '''
+    functions = rule_functions[pos_type]
+    built = [functions[c](lemma) for c in code]
+    if pos_type == 'V':     # built is (3rd_singular, past, present_participle)
+        return [_unique(b[1] for b in built), ('<>',), _unique(b[2] for b in built),
+                _unique(b[0] for b in built)]
+    elif pos_type == 'A':   # built is (comparative, superlative)
+        return [_unique(b[0] for b in built), _unique(b[1] for b in built)]
+    else:                   # built is (plural,)
+        return [_unique(b[0] for b in built)]
+
+
+# Tuple of the items with duplicates removed, keeping the original order
+def _unique(items):
+    out = []
+    for item in items:
+        if item not in out:
+            out.append(item)
+    return tuple(out)
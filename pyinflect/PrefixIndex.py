@@ -0,0 +1,101 @@
+from bisect import bisect_left, bisect_right
+
+
+class PrefixIndex(object):
+    ''' Sorted-array index for finding lemmas and inflected forms by prefix
+
+    The lemmas and the inflected forms are kept in sorted lists so all entries starting with
+    a given prefix are found with a binary search and then read sequentially.  This is much
+    more compact than a trie in python and lookup cost depends on the number of matches, not
+    the size of the table.
+
+    Args:
+        infl_data (dict): dictionary of lemma to {tag:forms}, as loaded by Inflections
+        extra_data (list): Optional.  Other dictionaries of the same type to include (ie.. overrides)
+    '''
+    def __init__(self, infl_data, extra_data=()):
+        lemmas = set()
+        pairs  = set()
+        for data in [infl_data] + list(extra_data):
+            lemmas.update(data)
+            for lemma in data:
+                for forms in data[lemma].values():
+                    pairs.update((form, lemma) for form in forms)
+        self.lemmas = sorted(lemmas)
+        pairs = sorted(pairs)
+        self.forms       = [p[0] for p in pairs]
+        self.form_lemmas = [p[1] for p in pairs]
+
+    def merge(self, lemmas, pairs):
+        ''' Create a new index with more entries added
+
+        The new entries are sorted and merged into copies of the existing lists, which is linear
+        in the size of the index, so this is much faster than creating the index again.
+
+        Args:
+            lemmas (iterable): The lemmas to add
+            pairs (iterable): The (form, lemma) pairs to add
+
+        Returns: a new PrefixIndex.  This index isn't changed.
+        '''
+        index = self.__class__.__new__(self.__class__)
+        positions, new_lemmas = [], []
+        for lemma in sorted(set(lemmas)):
+            i = bisect_left(self.lemmas, lemma)
+            if i == len(self.lemmas) or self.lemmas[i] != lemma:
+                positions.append(i)
+                new_lemmas.append(lemma)
+        index.lemmas = self._insertSorted(self.lemmas, positions, new_lemmas)
+        positions, new_pairs = [], []
+        forms, form_lemmas = self.forms, self.form_lemmas
+        for form, lemma in sorted(set(pairs)):
+            # The lemmas for the same form are sorted
+            lo = bisect_left(forms, form)
+            hi = bisect_right(forms, form, lo)
+            i = bisect_left(form_lemmas, lemma, lo, hi)
+            if i == hi or form_lemmas[i] != lemma:
+                positions.append(i)
+                new_pairs.append((form, lemma))
+        index.forms       = self._insertSorted(forms, positions, [p[0] for p in new_pairs])
+        index.form_lemmas = self._insertSorted(form_lemmas, positions, [p[1] for p in new_pairs])
+        return index
+
+    def iterLemmas(self, prefix):
+        ''' Generate all lemmas starting with prefix, in sorted order
+
+        Args:
+            prefix (str): The lowercase prefix to search for
+        '''
+        for i in range(bisect_left(self.lemmas, prefix), len(self.lemmas)):
+            if not self.lemmas[i].startswith(prefix):
+                break
+            yield self.lemmas[i]
+
+    def iterForms(self, prefix):
+        ''' Generate (form, lemma) for all inflected forms starting with prefix, in sorted order
+
+        Args:
+            prefix (str): The lowercase prefix to search for
+        '''
+        for i in range(bisect_left(self.forms, prefix), len(self.forms)):
+            if not self.forms[i].startswith(prefix):
+                break
+            yield self.forms[i], self.form_lemmas[i]
+
+    #######################################################
+    ### Private Methods                                 ###
+    #######################################################
+
+    # Return a copy of a list with the values inserted before the positions (in ascending order)
+    @staticmethod
+    def _insertSorted(items, positions, values):
+        if not values:
+            return items[:]
+        out = []
+        prev = 0
+        for i, value in zip(positions, values):
+            out += items[prev:i]
+            out.append(value)
+            prev = i
+        out += items[prev:]
+        return out
@@ -0,0 +1,209 @@
+import os
+import sqlite3
+import threading
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+from . import InflectionRules
+from .BloomFilter import BloomFilter
+
+
+class SQLiteStore(Mapping):
+    ''' Read-only inflection store backed by an indexed SQLite database
+
+    This class is a drop-in replacement for the dictionary normally created by
+    Inflections._loadInflections.  It maps a lemma to a dictionary of treebank tags with a tuple
+    of their forms, but only the rows for the requested lemma are read from disk so the full table
+    is never held in memory.  Use "create" to generate the database from infl.csv/overrides.csv.
+
+    The database has the tables "inflections" (the merged AGID data) and "overrides", both with
+    the columns (lemma, tag, form_num, form, regular), indexed on lemma, form and tag.  The column
+    "regular" is 1 if the form is what the regular inflection rules would produce.  These can be
+    queried directly with "query", for example all irregular VBN forms...
+        SELECT lemma, form FROM inflections WHERE tag='VBN' AND regular=0
+
+    Bloom filters for the lemmas and forms are stored in the "meta" table so that lookups of
+    unknown words are rejected without querying the tables.  The overrides are small so they're
+    read into the "overrides" attribute when the database is opened.  Inflections uses them when
+    it's not given an overrides file.
+
+    Args:
+        fn (str): filename of the SQLite database
+        pos_types (set): Optional.  Only return data for these pos_types ('V', 'A' and/or 'N')
+    '''
+    # Treebank tags stored for each pos_type
+    pos_type_tags = {'V':('VB', 'VBD', 'VBG', 'VBN', 'VBP', 'VBZ', 'MD'),
+                     'A':('JJ', 'JJR', 'JJS', 'RB', 'RBR', 'RBS'),
+                     'N':('NN', 'NNS')}
+
+    def __init__(self, fn, pos_types=None):
+        if not os.path.exists(fn):
+            raise IOError('SQLite inflection database not found: %s' % fn)
+        self.fn   = fn
+        # SQL condition and parameters restricting the rows to the pos_types
+        self.tag_sql, self.tag_params = '', ()
+        if pos_types:
+            self.tag_params = tuple(t for p in sorted(pos_types) for t in self.pos_type_tags[p])
+            self.tag_sql = ' AND tag IN (%s)' % ','.join('?' * len(self.tag_params))
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(fn, check_same_thread=False)
+        self.lemma_bloom = self._loadBloom('lemma_bloom')
+        self.form_bloom  = self._loadBloom('form_bloom')
+        # The overrides the database was created with, for all pos_types
+        self.overrides = self._loadOverrides()
+
+    @classmethod
+    def create(cls, db_fn, infl_fn, overrides_fn=None):
+        ''' Create the SQLite database from the csv data files
+
+        Args:
+            db_fn (str): The output database filename.  Any existing file is replaced.
+            infl_fn (str): filename of the AGID simplified CSV file (infl.csv)
+            overrides_fn (str): Optional CSV file with overrides to the AGID data.
+
+        Returns: an SQLiteStore instance for the new database
+        '''
+        # Import here to avoid a circular import.  Inflections imports this module.
+        from .Inflections import Inflections
+        if os.path.exists(db_fn):
+            os.remove(db_fn)
+        conn = sqlite3.connect(db_fn)
+        tables = [('inflections', Inflections._loadInflections(infl_fn))]
+        if overrides_fn:
+            tables.append(('overrides', Inflections._loadOverrides(overrides_fn)))
+        for table, data in tables:
+            conn.execute('CREATE TABLE %s (lemma TEXT, tag TEXT, form_num INTEGER, form TEXT, '
+                         'regular INTEGER)' % table)
+            conn.executemany('INSERT INTO %s VALUES (?, ?, ?, ?, ?)' % table, cls._iterRows(data))
+            for column in ('lemma', 'form', 'tag'):
+                conn.execute('CREATE INDEX %s_%s ON %s (%s)' % (table, column, table, column))
+        # Membership filters over the main table for rejecting unknown words
+        lemmas = [r[0] for r in conn.execute('SELECT DISTINCT lemma FROM inflections')]
+        forms  = [r[0] for r in conn.execute('SELECT DISTINCT form FROM inflections')]
+        conn.execute('CREATE TABLE meta (key TEXT PRIMARY KEY, value BLOB)')
+        conn.execute('INSERT INTO meta VALUES (?, ?)',
+                     ('lemma_bloom', BloomFilter.fromItems(lemmas).toBytes()))
+        conn.execute('INSERT INTO meta VALUES (?, ?)',
+                     ('form_bloom', BloomFilter.fromItems(forms).toBytes()))
+        conn.commit()
+        conn.close()
+        return cls(db_fn)
+
+    def query(self, sql, params=()):
+        ''' Run an SQL query against the database
+
+        Args:
+            sql (str): The SQL statement
+            params (tuple): Optional parameters for the statement
+
+        Returns: a list of the result rows
+        '''
+        with self.lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    def close(self):
+        ''' Close the database connection '''
+        with self.lock:
+            self.conn.close()
+
+    def hasForm(self, form):
+        ''' Check if a (lowercase) inflected form is in the table
+
+        Args:
+            form (str): The inflected form to lookup
+
+        Returns: True or False
+        '''
+        if self.form_bloom is not None and form not in self.form_bloom:
+            return False
+        with self.lock:
+            row = self.conn.execute('SELECT 1 FROM inflections WHERE form=?%s LIMIT 1' %
+                                    self.tag_sql, (form,) + self.tag_params).fetchone()
+        return row is not None
+
+    def get(self, lemma, default=None):
+        if self.lemma_bloom is not None and lemma not in self.lemma_bloom:
+            return default
+        with self.lock:
+            rows = self.conn.execute('SELECT tag, form FROM inflections WHERE lemma=?%s '
+                                     'ORDER BY rowid' % self.tag_sql,
+                                     (lemma,) + self.tag_params).fetchall()
+        if not rows:
+            return default
+        forms = {}
+        for tag, form in rows:
+            forms.setdefault(tag, []).append(form)
+        return {tag:tuple(f) for tag, f in forms.items()}
+
+    def __getitem__(self, lemma):
+        forms = self.get(lemma)
+        if forms is None:
+            raise KeyError(lemma)
+        return forms
+
+    def __contains__(self, lemma):
+        if self.lemma_bloom is not None and lemma not in self.lemma_bloom:
+            return False
+        with self.lock:
+            row = self.conn.execute('SELECT 1 FROM inflections WHERE lemma=?%s LIMIT 1' %
+                                    self.tag_sql, (lemma,) + self.tag_params).fetchone()
+        return row is not None
+
+    def __iter__(self):
+        sql = 'SELECT DISTINCT lemma FROM inflections WHERE 1%s ORDER BY lemma' % self.tag_sql
+        for (lemma,) in self.query(sql, self.tag_params):
+            yield lemma
+
+    def __len__(self):
+        sql = 'SELECT COUNT(DISTINCT lemma) FROM inflections WHERE 1%s' % self.tag_sql
+        return self.query(sql, self.tag_params)[0][0]
+
+    #######################################################
+    ### Private Methods                                 ###
+    #######################################################
+
+    # Load a bloom filter from the meta table.  Returns None if it isn't in the database.
+    def _loadBloom(self, key):
+        try:
+            row = self.conn.execute('SELECT value FROM meta WHERE key=?', (key,)).fetchone()
+        except sqlite3.OperationalError:     # no meta table
+            return None
+        return BloomFilter.fromBytes(row[0]) if row else None
+
+    # Load the overrides table as a dictionary of lemma to {tag:forms}.  Returns an empty
+    # dictionary if the database was created without overrides.
+    def _loadOverrides(self):
+        try:
+            rows = self.conn.execute('SELECT lemma, tag, form FROM overrides ORDER BY rowid')
+        except sqlite3.OperationalError:     # no overrides table
+            return {}
+        data = {}
+        for lemma, tag, form in rows:
+            data.setdefault(lemma, {}).setdefault(tag, []).append(form)
+        return {lemma:{tag:tuple(forms) for tag, forms in entry.items()}
+                for lemma, entry in data.items()}
+
+    # Generate the database rows from the lemma -> {tag:forms} dictionary
+    @classmethod
+    def _iterRows(cls, data):
+        for lemma, tag_forms in sorted(data.items()):
+            for tag, forms in tag_forms.items():
+                regular = cls._regularForm(lemma, tag)
+                for i, form in enumerate(forms):
+                    yield (lemma, tag, i, form, int(form == regular))
+
+    # Return the form the regular inflection rules produce for the lemma / tag
+    @staticmethod
+    def _regularForm(lemma, tag):
+        if tag in ('VBZ', 'VBD', 'VBN', 'VBG'):
+            rv = InflectionRules.buildRegVerb(lemma)
+            return {'VBZ':rv[0], 'VBD':rv[1], 'VBN':rv[1], 'VBG':rv[2]}[tag]
+        elif tag in ('JJR', 'RBR'):
+            return InflectionRules.buildRegAdjAdv(lemma)[0]
+        elif tag in ('JJS', 'RBS'):
+            return InflectionRules.buildRegAdjAdv(lemma)[1]
+        elif tag == 'NNS':
+            return InflectionRules.buildRegNoun(lemma)[0]
+        else:
+            return lemma
@@ -0,0 +1,186 @@
+import os
+import sys
+import json
+import socket
+import argparse
+import socketserver
+from   http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from   urllib.parse import urlparse, parse_qs
+
+
+# A local HTTP server so that other programs (and short lived python jobs) can get inflections
+# without loading the data themselves.  The data is loaded once and requests are served over TCP
+# or a Unix socket with HTTP/1.1 keep-alive.  See Client.py for a python client.
+#
+# Endpoints...
+#   POST /inflect  {"requests":[[lemma, tag], ...], "inflect_oov":false, "fuzzy":false}
+#                  returns {"results":[[forms] or null, ...]} in the same order
+#   GET  /inflect?lemma=walk&tag=VBD[&inflect_oov=1][&fuzzy=1]
+#                  returns {"result":[forms] or null}
+#   GET  /health   returns {"status":"ok", "version":...}
+# Invalid requests (ie.. a lemma or tag that isn't a non-empty string or a bad Content-Length)
+# get a 400 response and errors from the engine a 500, both with {"error":message}.
+
+
+class RequestHandler(BaseHTTPRequestHandler):
+    ''' Handler for the inflection requests.  The engine is the server's "engine" attribute. '''
+    protocol_version = 'HTTP/1.1'   # keep-alive
+    server_version = 'pyinflect'
+
+    def setup(self):
+        BaseHTTPRequestHandler.setup(self)
+        # Small responses on a kept-alive connection are delayed by Nagle's algorithm
+        if self.connection.family in (socket.AF_INET, socket.AF_INET6):
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, True)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == '/health':
+            from . import __version__   # import here to avoid a circular import
+            return self.sendJSON(200, {'status':'ok', 'version':__version__})
+        if url.path != '/inflect':
+            return self.sendJSON(404, {'error':'Unknown path %s' % url.path})
+        query = parse_qs(url.query)
+        if 'lemma' not in query or 'tag' not in query:
+            return self.sendJSON(400, {'error':'lemma and tag are required'})
+        inflect_oov = query.get('inflect_oov', ['0'])[0].lower() in ('1', 'true')
+        fuzzy = query.get('fuzzy', ['0'])[0].lower() in ('1', 'true')
+        try:
+            form = self.server.engine.getInflection(query['lemma'][0], query['tag'][0],
+                                                    inflect_oov, fuzzy)
+        except Exception as e:
+            return self.sendError(e)
+        self.sendJSON(200, {'result':form})
+
+    def do_POST(self):
+        try:
+            body = self.readBody()
+        except ValueError as e:
+            # The end of the body isn't known so the connection can't be re-used
+            return self.sendJSON(400, {'error':'Invalid request: %s' % e}, close=True)
+        if urlparse(self.path).path != '/inflect':
+            return self.sendJSON(404, {'error':'Unknown path %s' % self.path})
+        try:
+            data = json.loads(body)
+            requests = [(lemma, tag) for lemma, tag in data['requests']]
+        except (ValueError, KeyError, TypeError) as e:
+            return self.sendJSON(400, {'error':'Invalid request: %s' % e})
+        for pair in requests:
+            if not all(isinstance(x, str) and x for x in pair):
+                return self.sendJSON(400, {'error':'Invalid request: lemma and tag must be '
+                                                   'non-empty strings, got %s' % list(pair)})
+        if len(requests) > self.server.max_batch:
+            return self.sendJSON(413, {'error':'Too many requests in the batch.  The maximum '
+                                               'is %d' % self.server.max_batch})
+        try:
+            results = self.server.engine.getInflections(requests, bool(data.get('inflect_oov')),
+                                                        bool(data.get('fuzzy')))
+        except Exception as e:
+            return self.sendError(e)
+        self.sendJSON(200, {'results':results})
+
+    def readBody(self):
+        ''' Read the request body.  Raises ValueError for an invalid Content-Length. '''
+        header = self.headers.get('Content-Length') or '0'
+        try:
+            length = int(header)
+        except ValueError:
+            length = -1
+        if length < 0:
+            raise ValueError('Invalid Content-Length = %s' % header)
+        return self.rfile.read(length) if length else b''
+
+    def sendJSON(self, code, data, close=False):
+        ''' Send a JSON response.  If close is True the connection is closed after it. '''
+        body = json.dumps(data).encode('utf-8')
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        if close:
+            self.send_header('Connection', 'close')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def sendError(self, error):
+        ''' Send a 500 response for an error from the engine, keeping the connection open '''
+        self.log_error('Error inflecting %s: %r', self.path, error)
+        self.sendJSON(500, {'error':'Inflection error: %r' % error})
+
+    def address_string(self):
+        # Unix socket clients don't have an address
+        return self.client_address[0] if isinstance(self.client_address, tuple) else 'unix'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            BaseHTTPRequestHandler.log_message(self, format, *args)
+
+
+class UnixHTTPServer(socketserver.ThreadingUnixStreamServer):
+    ''' HTTP server on a Unix socket '''
+    daemon_threads = True
+
+    def server_bind(self):
+        if os.path.exists(self.server_address):
+            os.remove(self.server_address)
+        socketserver.ThreadingUnixStreamServer.server_bind(self)
+        self.server_name, self.server_port = 'localhost', 0
+
+
+def makeServer(engine=None, host='127.0.0.1', port=8765, unix_socket=None, max_batch=10000,
+               verbose=False):
+    ''' Create the server.  Call serve_forever() on it to run it.
+
+    Args:
+        engine (Inflections): Optional.  The inflection engine.  Default is pyinflect's.
+        host (str): Optional.  The address to listen on
+        port (int): Optional.  The port to listen on.  Use 0 for any free port (see
+            server.server_address for the port used).
+        unix_socket (str): Optional.  Listen on this Unix socket instead of host and port
+        max_batch (int): Optional.  The most (lemma, tag) pairs allowed in one request
+        verbose (bool): Optional.  Log every request
+
+    Returns: the server
+    '''
+    if engine is None:
+        from . import InflectionEngine     # import here to avoid a circular import
+        engine = InflectionEngine()
+    if unix_socket:
+        server = UnixHTTPServer(unix_socket, RequestHandler)
+    else:
+        server = ThreadingHTTPServer((host, port), RequestHandler)
+    server.engine    = engine
+    server.max_batch = max_batch
+    server.verbose   = verbose
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Serve inflections over HTTP')
+    parser.add_argument('--host', default='127.0.0.1', help='Address to listen on')
+    parser.add_argument('--port', type=int, default=8765, help='Port to listen on')
+    parser.add_argument('--unix', help='Listen on this Unix socket instead of a port')
+    parser.add_argument('--infl', help='Inflection data file (default: the pyinflect infl.csv)')
+    parser.add_argument('--overrides', help='Overrides file (default: the pyinflect overrides)')
+    parser.add_argument('--max-batch', type=int, default=10000, help='Most pairs per request')
+    parser.add_argument('--verbose', action='store_true', help='Log every request')
+    args = parser.parse_args(argv)
+    engine = None
+    if args.infl or args.overrides:
+        from . import Inflections, INFL_FN, OVERRIDES_FN   # import here to avoid a circular import
+        engine = Inflections(args.infl or INFL_FN, args.overrides or OVERRIDES_FN)
+    server = makeServer(engine, args.host, args.port, args.unix, args.max_batch, args.verbose)
+    print('Serving inflections on %s' % (args.unix or 'http://%s:%d' % server.server_address[:2]))
+    sys.stdout.flush()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if args.unix and os.path.exists(args.unix):
+            os.remove(args.unix)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,123 @@
+import os
+import sys
+import glob
+import marshal
+import hashlib
+import logging
+from   .FileUtils import fileHash
+
+
+# Functions for saving and loading a snapshot of the parsed inflection tables.
+# Loading the snapshot with marshal is much faster than parsing infl.csv.  The snapshot file
+# name is a hash of the data files, the pyinflect version and the python version (the marshal
+# format is python version specific) so a snapshot is never used with the wrong data.  It
+# starts with a hash of the data filenames and options, so when a new snapshot is saved the
+# ones for earlier versions of the same files can be removed.
+
+magic = b'PYINFLSNAP1\n'
+
+
+def snapshotKey(infl_fn, overrides_fn, version, options=''):
+    ''' Create the key identifying a snapshot of the data
+
+    Args:
+        infl_fn (str): filename of infl.csv
+        overrides_fn (str): filename of the overrides file (or None)
+        version (str): the pyinflect version
+        options (str): Optional.  Any loading options that change the data (ie.. pos_types)
+
+    Returns: a string of two hex hashes, "source-contents".  The source is a hash of the file
+        names, options and python version and the contents is a hash of all the inputs.
+    '''
+    source = hashlib.sha1(('%s/%s/%d.%d/%s' % (os.path.abspath(infl_fn),
+                           os.path.abspath(overrides_fn) if overrides_fn else '',
+                           sys.version_info[0], sys.version_info[1], options)).encode('utf-8'))
+    h = hashlib.sha1()
+    h.update(('%s/%d.%d/%d/%s' % (version, sys.version_info[0], sys.version_info[1],
+                                  marshal.version, options)).encode('utf-8'))
+    h.update(fileHash(infl_fn).encode('utf-8'))
+    if overrides_fn:
+        h.update(fileHash(overrides_fn).encode('utf-8'))
+    return '%s-%s' % (source.hexdigest()[:16], h.hexdigest())
+
+
+def snapshotFilename(snapshot_dir, key):
+    ''' Return the full filename of the snapshot for the given key '''
+    return os.path.join(snapshot_dir, 'snapshot-%s.marshal' % key)
+
+
+def loadSnapshot(snapshot_dir, key):
+    ''' Load a snapshot of the data
+
+    Args:
+        snapshot_dir (str): directory containing the snapshot files
+        key (str): the key from snapshotKey
+
+    Returns: the data saved with saveSnapshot or None if the snapshot doesn't exist or is invalid.
+        An invalid (ie.. corrupted) snapshot file is removed.
+    '''
+    fn = snapshotFilename(snapshot_dir, key)
+    if not os.path.exists(fn):
+        return None
+    try:
+        with open(fn, 'rb') as f:
+            data = f.read()
+        header = magic + key.encode('utf-8')
+        if not data.startswith(header):
+            raise ValueError('invalid header')
+        return marshal.loads(data[len(header):])
+    except (ValueError, EOFError, TypeError, IOError, OSError) as e:
+        logging.warning('Removing invalid pyinflect snapshot %s: %s', fn, e)
+        try:
+            os.remove(fn)
+        except OSError:
+            pass
+        return None
+
+
+def saveSnapshot(snapshot_dir, key, data):
+    ''' Save a snapshot of the data
+
+    Errors are logged but not raised since the snapshot is only an optimization.  Snapshots
+    of earlier versions of the same files (with the same source part of the key), and from
+    pyinflect versions before the key had a source part, are removed.
+
+    Args:
+        snapshot_dir (str): directory for the snapshot files.  It's created if needed.
+        key (str): the key from snapshotKey
+        data (object): the data to save.  Must only contain types supported by marshal.
+
+    Returns: True if the snapshot was saved
+    '''
+    fn = snapshotFilename(snapshot_dir, key)
+    tmp_fn = '%s.%d.tmp' % (fn, os.getpid())
+    try:
+        if not os.path.isdir(snapshot_dir):
+            os.makedirs(snapshot_dir)
+        with open(tmp_fn, 'wb') as f:
+            f.write(magic + key.encode('utf-8'))
+            f.write(marshal.dumps(data))
+        os.replace(tmp_fn, fn)
+    except (IOError, OSError, ValueError) as e:
+        logging.warning('Unable to save pyinflect snapshot %s: %s', fn, e)
+        return False
+    _removeStale(snapshot_dir, key)
+    return True
+
+
+#######################################################
+### Private Methods                                 ###
+#######################################################
+
+# Remove the snapshots of earlier versions of the same source as key, and the ones whose key
+# has no source part (a single 40 character hash)
+def _removeStale(snapshot_dir, key):
+    source = key.split('-')[0]
+    current = snapshotFilename(snapshot_dir, key)
+    for fn in glob.glob(snapshotFilename(snapshot_dir, '*')):
+        old_key = os.path.basename(fn)[len('snapshot-'):-len('.marshal')]
+        if fn != current and (old_key.split('-')[0] == source or '-' not in old_key):
+            try:
+                os.remove(fn)
+            except OSError:
+                pass
@@ -0,0 +1,130 @@
+try:
+    from spacy.strings import hash_string
+except ImportError:
+    hash_string = None
+
+_missing = object()
+
+
+class SpacyHashIndex(object):
+    ''' Index for inflecting spaCy tokens from their integer hash ids
+
+    Reading token.text and token.lemma_ makes spaCy create a python string from its StringStore
+    for every token.  This index maps the hash of every lowercase lemma in the data to the lemma
+    and the hash of every treebank tag to the tag, so tokens can be looked up with token.lemma and
+    token.tag instead.  Results are kept by (lemma hash, tag hash) and when the token is already
+    lowercase (token.orth == token.lower) the form is returned without reading token.text.
+    Tokens whose lemma isn't in the index (ie.. capitalized lemmas for proper nouns) are passed
+    to Inflections.spacyGetInfl so the results are always the same as the "inflect" extension.
+    When the engine's data is changed (Inflections.loadLexicon or loadRankings) the lemma index
+    is re-created and the results are cleared on the next lookup.
+
+    Args:
+        inflections (Inflections): The inflection engine to use
+        vocab (spacy.vocab.Vocab): Optional.  The vocab of the loaded model, ie.. nlp.vocab.
+            Hashes are created with its StringStore.  Default is spacy.strings.hash_string which
+            gives the same values.
+        max_entries (int): Optional.  Maximum number of lookup results to keep.  When full, the
+            results are cleared.
+    '''
+    def __init__(self, inflections, vocab=None, max_entries=100000):
+        if vocab is not None:
+            self.hash_func = vocab.strings.__getitem__
+        elif hash_string is not None:
+            self.hash_func = hash_string
+        else:
+            raise ImportError('spaCy is required for SpacyHashIndex')
+        self.inflections = inflections
+        self.max_entries = max_entries
+        self.updates     = inflections.updates   # the engine's data changes the index is for
+        self.lemma_index = self._buildLemmaIndex()
+        self.tag_index   = {}   # tag hash -> tag
+        self.tag_hashes  = {}   # tag -> tag hash
+        for pos_type in ('V', 'A', 'N'):
+            for tag in inflections._posTypeToTags(pos_type):
+                self.tag_hashes[tag] = self.hash_func(tag)
+                self.tag_index[self.tag_hashes[tag]] = tag
+        self.results = {}
+
+    def getInflection(self, token, tag, form_num=0, inflect_oov=False):
+        ''' Inflect a spaCy token.  Gives the same results as token._.inflect(tag, form_num).
+
+        Args:
+            token (spacy.tokens.Token): The token to inflect
+            tag (str or int): Penn Treebank tag or its hash (ie.. token.tag)
+            form_num (int): When more than one form is associated with the given tag,
+                return this index in the list.  The default is 0.
+            inflect_oov (bool): If True, use the inflection rules for words not in the data
+
+        Returns:
+            a string for the inflection or None if the lemma / tag is not found.
+            The capitalization style of the returned form will be the same as the token.
+        '''
+        if self.updates != self.inflections.updates:
+            self.refresh()
+        if isinstance(tag, int):
+            tag_hash, tag = tag, self.tag_index.get(tag)
+            if tag is None:     # not a tag in the data
+                tag = token.vocab.strings[tag_hash]
+        else:
+            tag_hash = self.tag_hashes.get(tag)
+        lemma = self.lemma_index.get(token.lemma)
+        if lemma is None or tag not in self.tag_hashes:
+            return self.inflections.spacyGetInfl(token, tag, form_num, inflect_oov)
+        key = (token.lemma, tag_hash)
+        tag_form = self.results.get(key, _missing)
+        if tag_form is _missing:
+            tag_form = self.inflections.getAllInflections(lemma).get(tag)
+            if len(self.results) >= self.max_entries:
+                self.results.clear()
+            self.results[key] = tag_form
+        if not tag_form:
+            return None
+        form = tag_form[form_num] if form_num < len(tag_form) else tag_form[0]
+        if token.orth == token.lower:
+            return form
+        # Same steps as spacyGetInfl, the token's caps style is applied to the lemma and then
+        # the lemma's style is applied to the form
+        infl = self.inflections
+        caps_style = infl._getCapsStyle(infl._applyCapsStyle(lemma, infl._getCapsStyle(token.text)))
+        return infl._applyCapsStyle(form, caps_style)
+
+    def inflectDoc(self, doc, tag=None, form_num=0, inflect_oov=False):
+        ''' Inflect every token in a spaCy Doc (or any sequence of tokens)
+
+        Args:
+            doc (spacy.tokens.Doc): The tokens to inflect
+            tag (str or int): Optional.  Penn Treebank tag or its hash for all tokens.  If None,
+                each token is inflected with its own tag (token.tag).
+            form_num (int): When more than one form is associated with the given tag,
+                return this index in the list.  The default is 0.
+            inflect_oov (bool): If True, use the inflection rules for words not in the data
+
+        Returns: a list with the inflection (or None) for each token
+        '''
+        get = self.getInflection
+        if tag is None:
+            return [get(t, t.tag, form_num, inflect_oov) for t in doc]
+        return [get(t, tag, form_num, inflect_oov) for t in doc]
+
+    def refresh(self):
+        ''' Re-create the lemma index and clear the results for the engine's current data
+
+        This is done automatically when the engine's data is changed.
+        '''
+        self.updates     = self.inflections.updates
+        self.lemma_index = self._buildLemmaIndex()
+        self.results     = {}
+
+    #######################################################
+    ### Private Methods                                 ###
+    #######################################################
+
+    # Map the hash of each lemma to the lemma.  Lemmas are lowercase in the data so the
+    # lemma strings are shared with the data's keys.
+    def _buildLemmaIndex(self):
+        index = {}
+        for data in (self.inflections.infl_data, self.inflections.overrides):
+            for lemma in data:
+                index[self.hash_func(lemma)] = lemma
+        return index
@@ -0,0 +1,152 @@
+_missing = object()
+
+
+class UDTagMap(object):
+    ''' Class for converting Universal Dependencies pos and morphology features to Penn tags
+
+    spaCy v3 (and many other taggers) give each token a UD part of speech (token.pos_) and a set
+    of morphological features (token.morph), ie.. VERB + "Tense=Past|VerbForm=Part".  This maps
+    them to the Penn Treebank tag used by getInflection, ie.. VBN.  Each distinct pos and feature
+    string is only parsed once.  The result is kept in a table, which is pre-filled with the
+    features spaCy's English models give for each Penn tag.  Only the features that decide the
+    tag are used (VerbForm, Tense, Aspect, Mood, Number, Person, Degree, VerbType and NounType),
+    the others are ignored.
+
+    Args:
+        max_entries (int): Optional.  Maximum number of results to keep.  When full, the results
+            are cleared.  There are usually only a few hundred distinct feature sets.
+    '''
+    # The UD pos and features for each Penn tag, as given by spaCy's English models
+    penn_features = {
+        'VB'  : ('VERB',  'VerbForm=Inf'),
+        'VBD' : ('VERB',  'Tense=Past|VerbForm=Fin'),
+        'VBG' : ('VERB',  'Aspect=Prog|Tense=Pres|VerbForm=Part'),
+        'VBN' : ('VERB',  'Aspect=Perf|Tense=Past|VerbForm=Part'),
+        'VBP' : ('VERB',  'Tense=Pres|VerbForm=Fin'),
+        'VBZ' : ('VERB',  'Number=Sing|Person=3|Tense=Pres|VerbForm=Fin'),
+        'MD'  : ('AUX',   'VerbType=Mod'),
+        'JJ'  : ('ADJ',   'Degree=Pos'),
+        'JJR' : ('ADJ',   'Degree=Cmp'),
+        'JJS' : ('ADJ',   'Degree=Sup'),
+        'RB'  : ('ADV',   ''),
+        'RBR' : ('ADV',   'Degree=Cmp'),
+        'RBS' : ('ADV',   'Degree=Sup'),
+        'NN'  : ('NOUN',  'Number=Sing'),
+        'NNS' : ('NOUN',  'Number=Plur'),
+        'NNP' : ('PROPN', 'NounType=Prop|Number=Sing'),
+        'NNPS': ('PROPN', 'NounType=Prop|Number=Plur')}
+
+    def __init__(self, max_entries=100000):
+        self.max_entries = max_entries
+        self.table = {}         # (pos, feature string) -> tag
+        self.token_table = {}   # (pos hash, morph hash) -> tag, for spaCy tokens
+        self._fillTable()
+
+    def toPenn(self, pos, morph):
+        ''' Get the Penn Treebank tag for a UD pos and its features
+
+        Args:
+            pos (str): The UD part of speech, ie.. 'VERB'
+            morph (str or dict): The features as a UD string ('Tense=Past|VerbForm=Part'), a
+                dictionary ({'Tense':'Past', 'VerbForm':'Part'}) or a spaCy MorphAnalysis.
+
+        Returns: the Penn tag (ie.. 'VBN') or None if the pos isn't one that pyinflect inflects
+        '''
+        if isinstance(morph, dict):
+            morph = '|'.join('%s=%s' % kv for kv in sorted(morph.items()))
+        elif not isinstance(morph, str):
+            morph = str(morph)
+        key = (pos, morph)
+        tag = self.table.get(key, _missing)
+        if tag is _missing:
+            tag = self._resolve(pos, self._parseFeatures(morph))
+            if len(self.table) >= self.max_entries:
+                self.table.clear()
+                self._fillTable()
+            self.table[key] = tag
+        return tag
+
+    def toUD(self, tag):
+        ''' Get the UD pos and feature string for a Penn tag
+
+        Args:
+            tag (str): Penn Treebank tag
+
+        Returns: a tuple of (pos, features) or None if the tag isn't one that pyinflect inflects
+        '''
+        return self.penn_features.get(tag)
+
+    def docTags(self, doc):
+        ''' Get the Penn tag for every token in a spaCy Doc from its pos and morph
+
+        Tokens are looked up by the integer hashes of their pos and morph, so the feature
+        strings are only created and parsed once for each distinct set of features.
+
+        Args:
+            doc (spacy.tokens.Doc): The tokens (or any sequence of spaCy tokens)
+
+        Returns: a list with the Penn tag (or None) for each token
+        '''
+        token_table = self.token_table
+        tags = []
+        for token in doc:
+            morph = token.morph
+            key = (token.pos, morph.key)
+            tag = token_table.get(key, _missing)
+            if tag is _missing:
+                tag = self.toPenn(token.pos_, str(morph))
+                if len(token_table) >= self.max_entries:
+                    token_table.clear()
+                token_table[key] = tag
+            tags.append(tag)
+        return tags
+
+    #######################################################
+    ### Private Methods                                 ###
+    #######################################################
+
+    # Pre-fill the table with the features for each tag
+    def _fillTable(self):
+        for tag, (pos, morph) in self.penn_features.items():
+            self.table[(pos, morph)] = tag
+
+    # Split a UD feature string into a dictionary.  Multiple values (ie.. "Number=Plur,Sing")
+    # are kept as a single string.
+    @staticmethod
+    def _parseFeatures(morph):
+        features = {}
+        for feature in morph.split('|'):
+            name, _, value = feature.partition('=')
+            if value:
+                features[name.strip()] = value.strip()
+        return features
+
+    # Decide the Penn tag from the pos and features
+    @staticmethod
+    def _resolve(pos, features):
+        get = features.get
+        if pos in ('VERB', 'AUX'):
+            verb_form, tense = get('VerbForm'), get('Tense')
+            if get('VerbType') == 'Mod':
+                return 'MD'
+            if verb_form == 'Ger' or get('Aspect') == 'Prog':
+                return 'VBG'
+            if verb_form == 'Part':
+                return 'VBG' if tense == 'Pres' else 'VBN'
+            if tense == 'Past':
+                return 'VBD'
+            if get('Mood') == 'Imp':
+                return 'VB'
+            if tense == 'Pres' or verb_form == 'Fin':
+                if get('Person') == '3' and get('Number') == 'Sing':
+                    return 'VBZ'
+                return 'VBP'
+            return 'VB'     # Inf or no features
+        if pos in ('ADJ', 'ADV'):
+            degree = get('Degree')
+            suffix = 'R' if degree == 'Cmp' else 'S' if degree == 'Sup' else ''
+            return ('JJ' if pos == 'ADJ' else 'RB') + suffix
+        if pos in ('NOUN', 'PROPN'):
+            tag = 'NNP' if pos == 'PROPN' or get('NounType') == 'Prop' else 'NN'
+            return tag + 'S' if get('Number') == 'Plur' else tag
+        return None
@@ -1,5 +1,17 @@
 import os
+import logging
+import threading
 from .Inflections import Inflections
+from .InflectionCache import InflectionCache
+from .SQLiteStore import SQLiteStore
+from .BloomFilter import BloomFilter
+from .CompactStore import CompactStore
+from .FrozenStore import FrozenStore
+from .SpacyHashIndex import SpacyHashIndex
+from .OOVModel import OOVModel
+from .FuzzyIndex import FuzzyIndex
+from .UDTagMap import UDTagMap
+from .FileUtils import fileHash, userCacheDir
 
 __version__ = '0.5.1'
 __agid_version__ = '2016.01.19' # infl.csv came from this AGID version
@@ -7,19 +19,127 @@ __spacy_version__ = '2.1.3'     # the script for overrides.csv used this for lem
 
 INFL_FN = os.path.join(os.path.dirname(__file__), 'infl.csv')
 OVERRIDES_FN = os.path.join(os.path.dirname(__file__), 'overrides.csv')
+OOV_MODEL_FN = os.path.join(os.path.dirname(__file__), 'oov_model.csv')
+RANKINGS_FN = os.path.join(os.path.dirname(__file__), 'rankings.csv')
+FROZEN_FN = os.path.join(os.path.dirname(__file__), 'infl_frozen.py')
 
-# Instantiate on import so the user doesn't need to do anything, to hook this into spaCy
-# Note that this call also loads the data (2 csv files) which is relatively quick.
-INFLECTION_INST = Inflections(INFL_FN, OVERRIDES_FN)
+# Set the environment variable PYINFLECT_SNAPSHOT_DIR to a directory (or to 1 for the
+# default user cache directory) to load the data from a snapshot of the parsed csv files.
+SNAPSHOT_DIR = os.environ.get('PYINFLECT_SNAPSHOT_DIR') or None
+if SNAPSHOT_DIR == '1':
+    SNAPSHOT_DIR = userCacheDir()
+
+# Set the environment variable PYINFLECT_POS_TYPES to a comma separated list of pos_types
+# (ie.. "V" or "V,N") to only load the data for those types.
+POS_TYPES = [p.strip() for p in os.environ.get('PYINFLECT_POS_TYPES', '').split(',') if p.strip()]
+
+# Set the environment variable PYINFLECT_RANKINGS to 1 (or to the filename of a rankings file)
+# to order the forms of entries with more than one by corpus frequency (see FormRanking.py).
+RANKINGS = os.environ.get('PYINFLECT_RANKINGS') or None
+if RANKINGS == '1':
+    RANKINGS = RANKINGS_FN
+
+# Set the environment variable PYINFLECT_FROZEN to 1 to load the data (including the overrides)
+# from the python module built by "python3 -m pyinflect.DataBuilder --targets frozen", which is
+# much faster to import (see FrozenStore.py).  If the module hasn't been built, or was built from
+# other csv files, the csv files are used with a warning.
+FROZEN = os.environ.get('PYINFLECT_FROZEN') == '1'
+
+# The default engine is created the first time it's used, not on import, so that modules like
+# DataBuilder and Client don't load the data.  pyinflect.INFLECTION_INST also creates it.
+_engine = None
+_engine_lock = threading.Lock()
 
 def InflectionEngine():
-    return INFLECTION_INST
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = _createEngine()
+    return _engine
+
+def __getattr__(name):
+    if name == 'INFLECTION_INST':
+        return InflectionEngine()
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
 
 def getAllInflections(lemma, pos_type=None):
-    return INFLECTION_INST.getAllInflections(lemma, pos_type)
+    return InflectionEngine().getAllInflections(lemma, pos_type)
 
 def getAllInflectionsOOV(lemma, pos_type):
-    return INFLECTION_INST.getAllInflectionsOOV(lemma, pos_type)
+    return InflectionEngine().getAllInflectionsOOV(lemma, pos_type)
+
+def getInflection(lemma, tag, inflect_oov=False, fuzzy=False):
+    return InflectionEngine().getInflection(lemma, tag, inflect_oov, fuzzy)
+
+def getInflections(requests, inflect_oov=False, fuzzy=False):
+    return InflectionEngine().getInflections(requests, inflect_oov, fuzzy)
+
+def reinflect(tokens, changes, form_num=0, inflect_oov=False):
+    return InflectionEngine().reinflect(tokens, changes, form_num, inflect_oov)
+
+def getInflectionUD(lemma, pos, morph, inflect_oov=False, fuzzy=False):
+    return InflectionEngine().getInflectionUD(lemma, pos, morph, inflect_oov, fuzzy)
+
+def iterPrefix(prefix, pos_type=None, forms=False):
+    return InflectionEngine().iterPrefix(prefix, pos_type, forms)
+
+def openCache(fn, max_entries=1000000, batch_size=1000):
+    ''' Attach a persistent on-disk cache to the default inflection engine
+
+    Entries are kept for the engine's data version (see Inflections.dataVersion), which changes
+    with the pyinflect version, the data files, the pos_types and any lexicons or rankings
+    loaded, so results from differently loaded engines are never mixed up.
+
+    Args:
+        fn (str): filename of the SQLite cache file
+        max_entries (int): Optional.  Maximum number of entries to keep on disk.
+        batch_size (int): Optional.  Number of new entries to buffer before writing to disk.
+
+    Returns: the InflectionCache instance
+    '''
+    engine = InflectionEngine()
+    cache = InflectionCache(fn, engine.dataVersion(), max_entries, batch_size)
+    engine.setCache(cache)
+    return cache
+
+# Load the default engine
+def _createEngine():
+    engine = _createFrozenEngine() if FROZEN else None
+    if engine is None:
+        engine = Inflections(INFL_FN, OVERRIDES_FN, SNAPSHOT_DIR, POS_TYPES)
+    if RANKINGS:
+        engine.loadRankings(RANKINGS)
+    return engine
+
+# Load the default engine from the frozen module.  None is returned (with a warning) if it can't
+# be loaded or wasn't built from the current infl.csv and overrides.csv, so the csv files are
+# used.  Without the csv files (ie.. a zipapp with only the module) it's an error.
+def _createFrozenEngine():
+    build_cmd = 'python3 -m pyinflect.DataBuilder --targets frozen'
+    try:
+        engine = Inflections(FROZEN_FN, None, None, POS_TYPES)
+    except (ImportError, IOError, ValueError) as e:
+        if not os.path.exists(INFL_FN):
+            raise IOError('PYINFLECT_FROZEN=1 but the frozen data module %s can\'t be loaded '
+                          '(%s).  Build it with "%s"' % (FROZEN_FN, e, build_cmd))
+        logging.warning('PYINFLECT_FROZEN=1 but the frozen data module %s can\'t be loaded '
+                        '(%s).  Using the csv files.  Build it with "%s"', FROZEN_FN, e,
+                        build_cmd)
+        return None
+    if not engine.infl_data.isCurrent(INFL_FN, OVERRIDES_FN):
+        logging.warning('The frozen data module %s was built from other versions of infl.csv '
+                        'or overrides.csv.  Using the csv files.  Rebuild it with "%s"',
+                        FROZEN_FN, build_cmd)
+        return None
+    return engine
+
+# The spaCy extensions are set on import, so the user doesn't need to do anything to hook this
+# into spaCy.  The engine is created the first time they're used.
+def _spacyGetInfl(token, tag, form_num=0, inflect_oov=False):
+    return InflectionEngine().spacyGetInfl(token, tag, form_num, inflect_oov)
+
+def _spacyReinflect(tokens, changes, form_num=0, inflect_oov=False):
+    return InflectionEngine().reinflect(tokens, changes, form_num, inflect_oov)
 
-def getInflection(lemma, tag, inflect_oov=False):
-    return INFLECTION_INST.getInflection(lemma, tag, inflect_oov)
+Inflections.setSpacyExtensions(_spacyGetInfl, _spacyReinflect)
@@ -1,26 +1,21 @@
 #!/usr/bin/python3
 import sys
 sys.path.insert(0, '..')    # make '..' first in the lib search path
-
-# Create an empty file file before importing pyinflect.
-infl_fn = '../pyinflect/infl.csv'
-open(infl_fn, 'w').close()
-from pyinflect.AGIDReader import *
+from pyinflect.DataBuilder import DataBuilder
 
 
+# Convert the raw AGID file to infl.csv and rebuild the other data files that depend on it.
+# Usage: ./10_ConvertAGIDToSimpleCSV.py <path to agid infl.txt>
+# This is the same as running "python3 -m pyinflect.DataBuilder --agid <infl.txt>".
 if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print('Usage: %s <path to agid infl.txt>' % sys.argv[0])
+        sys.exit(1)
+    agid_fn = sys.argv[1]
+    out_dir = '../pyinflect'
 
-    agid_fn = '/home/bjascob/Libraries/agid-2016.01.19/infl.txt'
-
-    # Read in AGID inflection file
-    print('Loading AGID')
-    agid = AGIDReader(agid_fn)
-
-    # Remove all upper-case words
-    agid.removeProperNouns()
-
-    # Save a simplified version in csv format
-    print('Saving inflections to ', infl_fn)
-    agid.save(infl_fn)
+    print('Building data from %s in %s' % (agid_fn, out_dir))
+    builder = DataBuilder(out_dir, agid_fn)
+    builder.build(verbose=True)
     print('done')
     print()
@@ -1,17 +1,11 @@
 #!/usr/bin/python3
 import sys
 sys.path.insert(0, '..')    # make '..' first in the lib search path
+import os
 from   collections import Counter, defaultdict
 import nltk
 import spacy
 from   MiscUtils import loadNLTKCorpus, ProgressBar
-
-# Create an empty overrides file before importing pyinflect.
-# Normally the overrrides file loads when importing so it needs to be there but
-# any overrides in will be used and so will mess up this script.
-# Fix this issue by creating an empty file
-overrides_fn = '../pyinflect/overrides.csv'
-open(overrides_fn, 'w').close()
 import pyinflect
 
 
@@ -23,6 +17,9 @@ import pyinflect
 # Note that if the AGID version is changed this script should be re-run.  Additionally
 # if Spacy changes their lemmatizer or if a different lemmatizer is used consider re-running
 # this script.
+# The counts for entries with multiple forms are saved to CorpMultiInfls.txt.  These can be used
+# to order the forms by frequency with "python3 -m pyinflect.FormRanking rankings.csv
+# --multi-infls CorpMultiInfls.txt" (see FormRanking.py).
 if __name__ == '__main__':
 
     # Configuration
@@ -30,13 +27,18 @@ if __name__ == '__main__':
     corp_fns  = nltk.corpus.gutenberg.fileids()     # 18 files with 94K sentences
     max_chars = int(1e9)
     req_count = 2       # require at least the many instances in corpus for an override
-    multiples_fn = '../CorpMultiInfls.txt.txt'
+    overrides_fn = '../pyinflect/overrides.csv'
+    multiples_fn = '../CorpMultiInfls.txt'
 
     # Load Spacy
     print('Loading Spacy model')
     nlp = spacy.load('en_core_web_sm')
     print('Using spaCy version ', spacy.__version__)
 
+    # Any existing overrides would mess up this script so use an instance without them.
+    # Creating the instance also points the spaCy "inflect" extension to it.
+    engine = pyinflect.Inflections(pyinflect.INFL_FN)
+
      # Load the corpus to test with
     print('Loading corpus')
     sents = []
@@ -86,7 +88,9 @@ if __name__ == '__main__':
     # with the hightest count (or alphabetical if the count is equal).
     # Save a list of the entries with multiple words for info / debug.
     print('Sorting through entries for overrides and multiple entries')
-    overrides_f = open(overrides_fn, 'w')
+    # Write to a temporary file so the existing overrides are intact if this fails
+    overrides_tmp_fn = overrides_fn + '.tmp'
+    overrides_f = open(overrides_tmp_fn, 'w')
     multiples_f = open(multiples_fn, 'w')
     for (lemma, tag), mappings in sorted(lemma_tag_dict.items()):
         assert mappings
@@ -109,11 +113,12 @@ if __name__ == '__main__':
             continue
         # Now that we know what we want the lemma/tag to inflect to, check with pyinflect to see
         # what it's actually doing and if it's different, write an override.
-        infl_list = pyinflect.getInflection(lemma, tag)
+        infl_list = engine.getInflection(lemma, tag)
         infl = infl_list[0] if infl_list else ''    # choose form 0, the default
         if infl != best_infl_word:
             overrides_f.write('%s,%s,%s\n' % (lemma, tag, best_infl_word))
     multiples_f.close()
     overrides_f.close()
+    os.replace(overrides_tmp_fn, overrides_fn)
     print('Overrides file saved to: ', overrides_fn)
     print('Multiple entries saved to: ', multiples_fn)
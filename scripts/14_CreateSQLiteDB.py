@@ -0,0 +1,16 @@
+#!/usr/bin/python3
+import sys
+sys.path.insert(0, '..')    # make '..' first in the lib search path
+import pyinflect
+from   pyinflect import SQLiteStore
+
+
+# Create an indexed SQLite version of the inflection data.  This can be used in place of
+# infl.csv with Inflections(db_fn, overrides_fn) or queried directly with SQL.
+if __name__ == '__main__':
+    db_fn = sys.argv[1] if len(sys.argv) > 1 else '../pyinflect/infl.db'
+
+    print('Creating SQLite database from ', pyinflect.INFL_FN)
+    store = SQLiteStore.create(db_fn, pyinflect.INFL_FN, pyinflect.OVERRIDES_FN)
+    print('Saved {:,} lemmas to {}'.format(len(store), db_fn))
+    print()
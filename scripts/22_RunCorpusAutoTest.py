@@ -1,62 +1,45 @@
 #!/usr/bin/python3
 import sys
 sys.path.insert(0, '..')    # make '..' first in the lib search path
+import json
 import spacy
 import nltk
 import pyinflect
-from   MiscUtils import loadNLTKCorpus, ignoreWord
+from   pyinflect.CorpusHarness import CorpusHarness
 
 
 # Script to run through a corpus and use spacy to tag and lemmatize words.  These are then
-# reinflected back to their original form and an error is printed if that inflections differs
-# from the original word.
+# reinflected back to their original form and the errors, accuracy and speed are reported.
+# To run on any text file and save the JSON report use...
+#   python3 -m pyinflect.CorpusHarness corpus.txt --n-process 4 --out report.json
 if __name__ == '__main__':
     # Configuration
     corp_fn   = 'austen-emma.txt'   # to see available do... print(nltk.corpus.gutenberg.fileids())
-    max_chars = int(1e5)
-    print_nones = False
-    print_errs  = True
-
-    # Matching exceptions to ignore
-    ignores = ['was', 'were', 'am', 'are', "'s", "n't"]
+    n_process = 1
+    report_fn = None                # set to save the JSON report
 
     # Load Spacy
     print('Loading Spacy model')
     nlp = spacy.load('en_core_web_sm')
 
-    # Load the corpus to test with
-    print('Loading corpus')
-    sents = loadNLTKCorpus(corp_fn, max_chars)
-    print('Loaded {:,} test sentences'.format(len(sents)))
-    print()
+    # Stream the corpus paragraphs
+    text = nltk.corpus.gutenberg.raw(corp_fn)
+    paras = (p.replace('\n', ' ') for p in text.split('\n\n') if p.strip())
 
-    # Loop through the sentences
-    print('Processing sentences')
-    stats = [0]*5     # total words, getInfl calls, infl None returns, infl good, infl bad
-    for i, sent in enumerate(sents):
-        doc = nlp(sent)
-        for word in doc:
-            if len(word.tag_) < 1:
-                continue
-            stats[0] += 1
-            ptype = word.tag_[0]
-            if ptype in ['N', 'V', 'R', 'J'] and word.tag_!='RP':
-                stats[1] += 1
-                tag_to_use = word.tag_
-                infl = word._.inflect(tag_to_use)
-                if not infl:
-                    stats[2] += 1
-                    if print_nones:
-                        print('None: %s/%s %s' % (word.text, word.lemma_, word.tag_))
-                    continue
-                elif infl != word.text and not ignoreWord(word.text):
-                    stats[3] += 1
-                    if print_errs:
-                        print('Err:  %s/%s %s -> %s' % (word.text, word.lemma_, word.tag_, infl))
-                else:
-                    stats[4] += 1
+    print('Processing %s' % corp_fn)
+    harness = CorpusHarness(pyinflect.InflectionEngine())
+    report = harness.run(paras, nlp, n_process)
+    for ex in report['examples']:
+        print('%-12s %3d  %s/%s %s -> %s' % (ex['category'], ex['count'], ex['text'],
+                                             ex['lemma'], ex['tag'], ex['inflection']))
     print()
-    print('Tested over %d sentences / %d words, looked up %d inflections' % (len(sents), stats[0], stats[1]))
-    print('{:,} correct inflections'.format(stats[4]))
-    print('{:,} inflections returned None'.format(stats[2]))
-    print('{:,} errors / incorrect inflections'.format(stats[3]))
+    print('Tested over %d docs / %d words, looked up %d inflections' %
+          (report['docs'], report['tokens'], report['checked']))
+    print('{:,} correct inflections ({:.2%})'.format(report['correct'], report['accuracy']))
+    print('None rate is {:.2%}'.format(report['none_rate']))
+    print('Errors: %s' % report['errors'])
+    print('{:,.0f} tokens/sec.  Parse {:.1f} sec, inflect {:.2f} sec'.format(
+          report['tokens_per_sec'], report['times']['parse'], report['times']['inflect']))
+    if report_fn:
+        with open(report_fn, 'w') as f:
+            json.dump(report, f, indent=2)
@@ -0,0 +1,57 @@
+#!/usr/bin/python3
+import sys
+sys.path.insert(0, '..')    # make '..' first in the lib search path
+import os
+import random
+import subprocess
+import time
+
+
+# Compare load time, lookup latency and memory use (RSS) of the storage backends.
+# Each backend is run in its own sub-process so the memory numbers don't interfere.
+#   dict   : infl.csv loaded into python dictionaries (the default)
+#   sqlite : the indexed SQLite database created by 14_CreateSQLiteDB.py
+# Importing pyinflect doesn't load the default data (that's done the first time
+# InflectionEngine() is called) so the memory increase is only for the backend being measured.
+def runBackend(infl_fn, num_lookups=100000):
+    from pyinflect import Inflections, OVERRIDES_FN
+    rss_start = getRSS()
+    st = time.time()
+    infl = Inflections(infl_fn, OVERRIDES_FN)
+    load_time = time.time() - st
+    rss_load = getRSS()
+    random.seed(0)
+    lemmas = random.sample(sorted(infl.infl_data), 1000)
+    lemmas = [random.choice(lemmas) for _ in range(num_lookups)]
+    st = time.time()
+    for lemma in lemmas:
+        infl.getInflection(lemma, 'NNS')
+    lookup_time = time.time() - st
+    print('  load time     : %8.3f sec' % load_time)
+    print('  lookup latency: %8.2f usec' % (1e6 * lookup_time / num_lookups))
+    print('  RSS increase  : %8.1f MB' % (rss_load - rss_start))
+
+# Current resident memory in MB (Linux only)
+def getRSS():
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1]) / 1024.
+    return 0.0
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        runBackend(sys.argv[1])
+        sys.exit(0)
+
+    import pyinflect
+    db_fn = '../pyinflect/infl.db'
+    if not os.path.exists(db_fn):
+        print('Creating ', db_fn)
+        pyinflect.SQLiteStore.create(db_fn, pyinflect.INFL_FN, pyinflect.OVERRIDES_FN)
+
+    for name, fn in [('dict', pyinflect.INFL_FN), ('sqlite', db_fn)]:
+        print('Backend: ', name)
+        subprocess.call([sys.executable, __file__, fn])
+        print()
@@ -0,0 +1,35 @@
+#!/usr/bin/python3
+import sys
+sys.path.insert(0, '..')    # make '..' first in the lib search path
+import shutil
+import tempfile
+import time
+import pyinflect
+from   pyinflect import Inflections
+
+
+# Compare the time to create an Inflections instance by parsing the csv files vs loading
+# a snapshot of the parsed data.
+if __name__ == '__main__':
+    num_loads = 10
+    snapshot_dir = tempfile.mkdtemp()
+
+    st = time.time()
+    for _ in range(num_loads):
+        Inflections(pyinflect.INFL_FN, pyinflect.OVERRIDES_FN)
+    csv_time = (time.time() - st) / num_loads
+
+    st = time.time()
+    Inflections(pyinflect.INFL_FN, pyinflect.OVERRIDES_FN, snapshot_dir)
+    create_time = time.time() - st
+
+    st = time.time()
+    for _ in range(num_loads):
+        infl = Inflections(pyinflect.INFL_FN, pyinflect.OVERRIDES_FN, snapshot_dir)
+    snap_time = (time.time() - st) / num_loads
+    assert infl.infl_data == pyinflect.INFLECTION_INST.infl_data
+    shutil.rmtree(snapshot_dir)
+
+    print('csv load                 : %6.3f sec' % csv_time)
+    print('csv load + save snapshot : %6.3f sec' % create_time)
+    print('snapshot load            : %6.3f sec' % snap_time)
@@ -0,0 +1,46 @@
+#!/usr/bin/python3
+import sys
+sys.path.insert(0, '..')    # make '..' first in the lib search path
+import os
+import gzip
+import random
+import shutil
+import tempfile
+import time
+import tracemalloc
+import pyinflect
+from   pyinflect import Inflections, CompactStore
+
+
+# Compare the file size, load time, memory and lookup time of infl.csv vs the compact format
+if __name__ == '__main__':
+    num_loads   = 5
+    num_lookups = 100000
+    tmp_dir = tempfile.mkdtemp()
+    compact_fn = os.path.join(tmp_dir, 'infl_compact.csv')
+    CompactStore.create(compact_fn, pyinflect.INFL_FN)
+
+    random.seed(0)
+    lemmas = random.sample(sorted(pyinflect.INFLECTION_INST.infl_data), 1000)
+    lemmas = [random.choice(lemmas) for _ in range(num_lookups)]
+
+    print('%-8s %10s %10s %10s %10s %10s' % ('format', 'size(KB)', 'gzip(KB)', 'load(sec)',
+                                             'mem(MB)', 'lookup(us)'))
+    for name, fn in [('csv', pyinflect.INFL_FN), ('compact', compact_fn)]:
+        with open(fn, 'rb') as f:
+            raw = f.read()
+        st = time.time()
+        for _ in range(num_loads):
+            Inflections(fn, pyinflect.OVERRIDES_FN)
+        load_time = (time.time() - st) / num_loads
+        tracemalloc.start()
+        infl = Inflections(fn, pyinflect.OVERRIDES_FN)
+        mem = tracemalloc.get_traced_memory()[0] / 1e6
+        tracemalloc.stop()
+        st = time.time()
+        for lemma in lemmas:
+            infl.getInflection(lemma, 'NNS')
+        lookup_time = 1e6 * (time.time() - st) / num_lookups
+        print('%-8s %10d %10d %10.3f %10.1f %10.1f' % (name, len(raw) / 1024,
+              len(gzip.compress(raw)) / 1024, load_time, mem, lookup_time))
+    shutil.rmtree(tmp_dir)
@@ -0,0 +1,24 @@
+#!/usr/bin/python3
+import sys
+sys.path.insert(0, '..')    # make '..' first in the lib search path
+import time
+import tracemalloc
+import pyinflect
+from   pyinflect import Inflections
+
+
+# Compare the load time and memory use when only loading some of the pos_types
+if __name__ == '__main__':
+    num_loads = 5
+    print('%-10s %10s %10s %10s' % ('pos_types', 'lemmas', 'load(sec)', 'mem(MB)'))
+    for pos_types in [None, {'V'}, {'N'}, {'A'}, {'V', 'N'}]:
+        st = time.time()
+        for _ in range(num_loads):
+            Inflections(pyinflect.INFL_FN, pyinflect.OVERRIDES_FN, pos_types=pos_types)
+        load_time = (time.time() - st) / num_loads
+        tracemalloc.start()
+        infl = Inflections(pyinflect.INFL_FN, pyinflect.OVERRIDES_FN, pos_types=pos_types)
+        mem = tracemalloc.get_traced_memory()[0] / 1e6
+        tracemalloc.stop()
+        name = ','.join(sorted(pos_types)) if pos_types else 'all'
+        print('%-10s %10d %10.3f %10.1f' % (name, len(infl.infl_data), load_time, mem))
@@ -0,0 +1,41 @@
+#!/usr/bin/python3
+import sys
+sys.path.insert(0, '..')    # make '..' first in the lib search path
+import time
+import spacy
+import pyinflect
+from   pyinflect import SpacyHashIndex
+from   MiscUtils import loadNLTKCorpus
+
+
+# Compare the per-Doc time to re-inflect every token with its own tag using the "inflect"
+# extension (token.text / token.lemma_ strings) and with SpacyHashIndex (integer hash ids)
+if __name__ == '__main__':
+    corp_fn   = 'austen-emma.txt'   # same corpus as 22_RunCorpusAutoTest.py
+    max_chars = int(1e5)
+
+    print('Loading Spacy model')
+    nlp = spacy.load('en_core_web_sm')
+    print('Loading corpus')
+    sents = loadNLTKCorpus(corp_fn, max_chars)
+    docs  = list(nlp.pipe(sents))
+    num_tokens = sum(len(doc) for doc in docs)
+    print('Parsed {:,} docs with {:,} tokens'.format(len(docs), num_tokens))
+    print()
+
+    st = time.time()
+    index = SpacyHashIndex(pyinflect.InflectionEngine(), nlp.vocab)
+    print('Index built in %.3f sec' % (time.time() - st))
+
+    st = time.time()
+    ext_results = [[t._.inflect(t.tag_) for t in doc] for doc in docs]
+    ext_time = time.time() - st
+
+    st = time.time()
+    hash_results = [index.inflectDoc(doc) for doc in docs]
+    hash_time = time.time() - st
+
+    assert ext_results == hash_results, 'Results differ'
+    print('%-12s %12s %12s' % ('method', 'usec/doc', 'usec/token'))
+    for name, dt in [('extension', ext_time), ('hash index', hash_time)]:
+        print('%-12s %12.1f %12.2f' % (name, 1e6*dt/len(docs), 1e6*dt/num_tokens))
@@ -0,0 +1,52 @@
+#!/usr/bin/python3
+import sys
+sys.path.insert(0, '..')    # make '..' first in the lib search path
+import os
+import time
+import pickle
+import tempfile
+import subprocess
+import pyinflect
+
+
+# Compare the size and time to pickle the inflection data (what shipping the engine to
+# distributed workers used to cost) with the engine's handle and with the handle plus the
+# file contents as out-of-band protocol 5 buffers.  Unpickling is timed in a new process that
+# has imported pyinflect, like a worker would.
+def timeWorkerLoad(data, buffers):
+    with tempfile.NamedTemporaryFile(suffix='.pkl', delete=False) as f:
+        pickle.dump((data, buffers), f)
+    code = ('import sys, time, pickle; sys.path.insert(0, "..")\n'
+            'import pyinflect\n'
+            'data, buffers = pickle.load(open(%r, "rb"))\n'
+            'st = time.time()\n'
+            'pickle.loads(data, buffers=buffers)\n'
+            'print(time.time() - st)' % f.name)
+    out = subprocess.check_output([sys.executable, '-c', code], universal_newlines=True)
+    os.remove(f.name)
+    return float(out)
+
+
+if __name__ == '__main__':
+    engine = pyinflect.InflectionEngine()
+    print('%-20s %12s %12s %12s %12s' % ('method', 'size(KB)', 'buffers(KB)', 'dumps(ms)',
+                                         'loads(ms)'))
+    for name in ['data dicts', 'handle', 'handle+buffers']:
+        buffers = []
+        st = time.time()
+        if name == 'data dicts':
+            data = pickle.dumps((engine.infl_data, engine.overrides), protocol=5)
+        else:
+            engine.setPickleData(name == 'handle+buffers')
+            data = pickle.dumps(engine, protocol=5, buffer_callback=buffers.append)
+        dumps_time = time.time() - st
+        buffers = [bytes(b.raw()) for b in buffers]
+        if name == 'data dicts':
+            st = time.time()
+            pickle.loads(data)
+            loads_time = time.time() - st
+        else:
+            loads_time = timeWorkerLoad(data, buffers)
+        print('%-20s %12.1f %12.1f %12.2f %12.2f' % (name, len(data)/1e3,
+              sum(len(b) for b in buffers)/1e3, 1e3*dumps_time, 1e3*loads_time))
+    engine.setPickleData(False)
@@ -0,0 +1,45 @@
+#!/usr/bin/python3
+import sys
+sys.path.insert(0, '..')    # make '..' first in the lib search path
+import time
+import zlib
+import pyinflect
+from   pyinflect import OOVModel, Paradigms, InflectionRules
+
+
+# Held-out test of the OOV model.  The model is trained on 90% of the lemmas in infl.csv and
+# used to predict which rules the other 10% follow.  The predicted first form is correct if the
+# first letter of the predicted paradigm code matches the lemma's code (irregular lemmas are
+# skipped).  This is compared to always using the regular rules first (the default ordering)
+# and to the useDoublingMethod / useGrecoMethod heuristics.
+def heuristicCode(lemma, pos_type):
+    if pos_type == 'N':
+        return 'G' if InflectionRules.useGrecoMethod(lemma) else 'R'
+    return 'D' if InflectionRules.useDoublingMethod(lemma) else 'R'
+
+
+if __name__ == '__main__':
+    with open(pyinflect.INFL_FN) as f:
+        rows = [line.strip().split(',') for line in f]
+    train = set(r[0] for r in rows if zlib.crc32(r[0].encode('utf-8')) % 10)
+    model = OOVModel.train(pyinflect.INFL_FN, lemmas=train)
+    print('Model has %d suffixes' % sum(len(s) for s in model.suffixes.values()))
+    tests = []
+    for lemma, pos_type, *forms in rows:
+        if lemma in train:
+            continue
+        code = Paradigms.classify(lemma, pos_type, [tuple(f.split('/')) for f in forms])
+        if code is not None:
+            tests.append((lemma, pos_type, code[0]))
+    print('Testing with %d held-out regular lemmas' % len(tests))
+    print()
+    print('%-20s %10s %15s' % ('method', 'accuracy', 'usec/lemma'))
+    methods = [('regular first', lambda lemma, pos_type: 'R'),
+               ('heuristics', heuristicCode),
+               ('oov model', model.predict)]
+    for name, func in methods:
+        st = time.time()
+        codes = [func(lemma, pos_type) for lemma, pos_type, _ in tests]
+        dt = time.time() - st
+        correct = sum(1 for c, t in zip(codes, tests) if c[0] == t[2])
+        print('%-20s %10.2f%% %15.2f' % (name, 100.0*correct/len(tests), 1e6*dt/len(tests)))
@@ -0,0 +1,51 @@
+#!/usr/bin/python3
+import sys
+sys.path.insert(0, '..')    # make '..' first in the lib search path
+import time
+import random
+import tracemalloc
+import pyinflect
+from   pyinflect import FuzzyIndex
+
+
+# Benchmark the fuzzy lemma index.  Typos are made by a random substitution, deletion,
+# insertion or swap of adjacent letters in randomly chosen lemmas.  A lookup is correct if the
+# first lemma returned is the original one.
+def makeTypo(word, rand):
+    i = rand.randrange(len(word))
+    op = rand.choice(['sub', 'del', 'ins', 'swap'] if len(word) > 1 else ['sub', 'ins'])
+    letter = rand.choice('abcdefghijklmnopqrstuvwxyz')
+    if op == 'sub':
+        return word[:i] + letter + word[i+1:]
+    elif op == 'del':
+        return word[:i] + word[i+1:]
+    elif op == 'ins':
+        return word[:i] + letter + word[i:]
+    i = min(i, len(word) - 2)
+    return word[:i] + word[i+1] + word[i] + word[i+2:]
+
+
+if __name__ == '__main__':
+    num_tests = 2000
+    engine = pyinflect.InflectionEngine()
+    lemmas = sorted(set(engine.infl_data) | set(engine.overrides))
+    rand = random.Random(0)
+    tests = [(lemma, makeTypo(lemma, rand)) for lemma in rand.sample(lemmas, num_tests)]
+    print('%-12s %10s %10s %10s %12s %10s' % ('distance', 'deletes', 'build(s)', 'mem(MB)',
+                                              'usec/lookup', 'correct'))
+    for max_distance in (1, 2):
+        st = time.time()
+        index = FuzzyIndex(lemmas, max_distance)
+        build_time = time.time() - st
+        # Build again to measure the memory since tracing slows down the build
+        del index
+        tracemalloc.start()
+        index = FuzzyIndex(lemmas, max_distance)
+        mem = tracemalloc.get_traced_memory()[0] / 1e6
+        tracemalloc.stop()
+        st = time.time()
+        results = [index.lookup(typo) for _, typo in tests]
+        lookup_time = (time.time() - st) / num_tests
+        correct = sum(1 for (lemma, _), r in zip(tests, results) if r and r[0][0] == lemma)
+        print('%-12d %10d %10.2f %10.1f %12.1f %9.1f%%' % (max_distance, len(index.deletes),
+              build_time, mem, 1e6*lookup_time, 100.0*correct/num_tests))
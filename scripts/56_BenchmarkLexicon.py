@@ -0,0 +1,66 @@
+#!/usr/bin/python3
+import sys
+sys.path.insert(0, '..')    # make '..' first in the lib search path
+import os
+import time
+import shutil
+import tempfile
+import pyinflect
+from   pyinflect import Inflections
+
+
+# Benchmark loading a large user lexicon.  The lexicon is made from infl.csv with a prefix
+# added to every lemma and form so all of its lemmas are new.  Times are for merging into an
+# engine without indices and into one where the known forms, prefix and fuzzy indices have
+# already been created (and are updated instead of re-created).  The few special case lines
+# (ie.. modal verbs) with fewer forms are skipped.
+def makeLexicon(fn, prefix):
+    num_lines = 0
+    with open(pyinflect.INFL_FN) as fin, open(fn, 'w') as fout:
+        for line in fin:
+            x = line.strip().split(',')
+            if len(x) - 2 < {'V':4, 'A':2, 'N':1}[x[1]]:    # special cases (ie.. may)
+                continue
+            forms = ['/'.join(prefix + f if f != '<>' else f for f in field.split('/'))
+                     for field in x[2:]]
+            fout.write(','.join([prefix + x[0], x[1]] + forms) + '\n')
+            num_lines += 1
+    return num_lines
+
+
+if __name__ == '__main__':
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        lexicon_fn = os.path.join(tmp_dir, 'lexicon.csv')
+        num_lines = makeLexicon(lexicon_fn, 'zz')
+        print('Lexicon has %d lines' % num_lines)
+        print('%-28s %10s %12s' % ('test', 'time(s)', 'lines/sec'))
+        for priority in ('high', 'low'):
+            engine = Inflections(pyinflect.INFL_FN, pyinflect.OVERRIDES_FN)
+            st = time.time()
+            engine.loadLexicon(lexicon_fn, priority)
+            dt = time.time() - st
+            print('%-28s %10.2f %12.0f' % ('load priority=' + priority, dt, num_lines / dt))
+        # With the indices already created
+        engine = Inflections(pyinflect.INFL_FN, pyinflect.OVERRIDES_FN)
+        engine.isKnownForm('walked')
+        list(engine.iterPrefix('walk'))
+        engine.findLemma('wlak')
+        st = time.time()
+        engine.loadLexicon(lexicon_fn)
+        dt = time.time() - st
+        print('%-28s %10.2f %12.0f' % ('load with indices', dt, num_lines / dt))
+        # Re-creating the indices instead of updating them
+        st = time.time()
+        engine.known_forms, engine.prefix_index, engine.fuzzy_index = None, None, None
+        engine.isKnownForm('walked')
+        list(engine.iterPrefix('walk'))
+        engine.findLemma('wlak')
+        print('%-28s %10.2f' % ('re-create indices', time.time() - st))
+        # Loading the base data, for comparison
+        st = time.time()
+        Inflections(pyinflect.INFL_FN, pyinflect.OVERRIDES_FN)
+        dt = time.time() - st
+        print('%-28s %10.2f %12.0f' % ('load infl.csv', dt, num_lines / dt))
+    finally:
+        shutil.rmtree(tmp_dir)
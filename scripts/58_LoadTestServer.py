@@ -0,0 +1,79 @@
+#!/usr/bin/python3
+import sys
+sys.path.insert(0, '..')    # make '..' first in the lib search path
+import os
+import time
+import random
+import tempfile
+import threading
+import subprocess
+import pyinflect
+from   pyinflect.Client import Client
+
+
+# Load test the inflection server.  The server is started in a separate process (the same as
+# "python3 -m pyinflect.Server") and several client threads send requests to it.  The latency of
+# each request is recorded and the p50 / p99 latency and the requests / sec are reported for
+# different batch sizes, for single calls coalesced by the client and for a Unix socket.
+def startServer(args):
+    env = dict(os.environ, PYTHONPATH=os.path.abspath('..'))
+    proc = subprocess.Popen([sys.executable, '-m', 'pyinflect.Server'] + args, env=env,
+                            stdout=subprocess.PIPE, universal_newlines=True)
+    proc.stdout.readline()      # wait for "Serving inflections on ..."
+    return proc
+
+
+def runTest(client, pairs, num_threads, num_requests, batch_size):
+    latencies = [[] for _ in range(num_threads)]
+    def worker(n):
+        rand = random.Random(n)
+        for _ in range(num_requests):
+            if batch_size:
+                batch = rand.sample(pairs, batch_size)
+                st = time.perf_counter()
+                client.getInflections(batch)
+            else:   # single calls, coalesced by the client
+                lemma, tag = rand.choice(pairs)
+                st = time.perf_counter()
+                client.getInflection(lemma, tag)
+            latencies[n].append(time.perf_counter() - st)
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(num_threads)]
+    st = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    dt = time.perf_counter() - st
+    latencies = sorted(l for thread_latencies in latencies for l in thread_latencies)
+    p50 = latencies[len(latencies) // 2]
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    return 1000*p50, 1000*p99, len(latencies) / dt
+
+
+if __name__ == '__main__':
+    num_threads  = 8
+    num_requests = 500
+    port = 8766
+    unix_fn = os.path.join(tempfile.gettempdir(), 'pyinflect-loadtest.sock')
+    engine = pyinflect.InflectionEngine()
+    lemmas = sorted(engine.infl_data)
+    tags = ['VB', 'VBD', 'VBG', 'VBN', 'VBZ', 'NNS', 'JJR', 'RBS']
+    rand = random.Random(0)
+    pairs = [(rand.choice(lemmas), rand.choice(tags)) for _ in range(10000)]
+    procs = [startServer(['--port', str(port)]), startServer(['--unix', unix_fn])]
+    try:
+        print('%-12s %8s %10s %10s %10s %12s' % ('transport', 'batch', 'p50(ms)', 'p99(ms)',
+                                                'req/sec', 'pairs/sec'))
+        for name, address in (('tcp', 'http://127.0.0.1:%d' % port), ('unix', unix_fn)):
+            client = Client(address, pool_size=num_threads, coalesce_delay=0.001)
+            client.health()
+            for batch_size in (1, 10, 100, 1000, None):
+                num = num_requests if batch_size != 1000 else num_requests // 10
+                p50, p99, rate = runTest(client, pairs, num_threads, num, batch_size)
+                print('%-12s %8s %10.2f %10.2f %10.0f %12.0f' % (name, batch_size or 'single',
+                      p50, p99, rate, rate * (batch_size or 1)))
+            client.close()
+    finally:
+        for proc in procs:
+            proc.terminate()
+            proc.wait()
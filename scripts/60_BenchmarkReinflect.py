@@ -0,0 +1,46 @@
+#!/usr/bin/python3
+import sys
+sys.path.insert(0, '..')    # make '..' first in the lib search path
+import time
+import spacy
+import pyinflect
+from   MiscUtils import loadNLTKCorpus
+
+
+# Compare the time to rewrite every sentence of a corpus by calling the "inflect" extension for
+# each changed token and with the "reinflect" Doc extension, which does the lookups in one batch.
+# The sentences are changed from past to present tense and plural nouns are made singular.
+def rewriteTokens(doc, changes):
+    words = []
+    for t in doc:
+        new_tag = changes.get(t.tag_)
+        words.append(((t._.inflect(new_tag) or t.text) if new_tag else t.text) + t.whitespace_)
+    return ''.join(words)
+
+
+if __name__ == '__main__':
+    corp_fns  = ['austen-emma.txt', 'carroll-alice.txt', 'melville-moby_dick.txt']
+    max_chars = int(2e5)
+    changes   = {'VBD':'VBZ', 'NNS':'NN'}
+
+    print('Loading Spacy model')
+    nlp = spacy.load('en_core_web_sm')
+    pyinflect.InflectionEngine()    # make sure the extensions are set for this model
+    print('%-24s %8s %10s %14s %14s %8s' % ('corpus', 'docs', 'tokens', 'token(usec/doc)',
+                                            'batch(usec/doc)', 'speedup'))
+    for corp_fn in corp_fns:
+        sents = loadNLTKCorpus(corp_fn, max_chars)
+        docs  = list(nlp.pipe(sents))
+        num_tokens = sum(len(doc) for doc in docs)
+
+        st = time.time()
+        token_results = [rewriteTokens(doc, changes) for doc in docs]
+        token_time = time.time() - st
+
+        st = time.time()
+        batch_results = [doc._.reinflect(changes) for doc in docs]
+        batch_time = time.time() - st
+
+        assert token_results == batch_results, 'Results differ'
+        print('%-24s %8d %10d %14.1f %14.1f %7.2fx' % (corp_fn, len(docs), num_tokens,
+              1e6*token_time/len(docs), 1e6*batch_time/len(docs), token_time/batch_time))
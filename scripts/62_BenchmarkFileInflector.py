@@ -0,0 +1,57 @@
+#!/usr/bin/python3
+import sys
+sys.path.insert(0, '..')    # make '..' first in the lib search path
+import os
+import time
+import random
+import shutil
+import tempfile
+import resource
+import subprocess
+import pyinflect
+
+
+# Measure the throughput of adding inflections to a CoNLL-U file with FileInflector for different
+# numbers of processes.  The file is made from random lemmas and tags in the data, in 20 token
+# sentences.  Each run is in a new process (python3 -m pyinflect.FileInflector) so its peak
+# memory (max RSS) is measured separately, which shows it doesn't depend on the file size.
+def makeConllu(fn, num_sents):
+    engine = pyinflect.InflectionEngine()
+    lemmas = sorted(engine.infl_data)
+    tags = ['VB', 'VBD', 'VBG', 'VBN', 'VBZ', 'NN', 'NNS', 'JJ', 'JJR', 'RB', 'DT', 'IN']
+    rand = random.Random(0)
+    with open(fn, 'w') as f:
+        for n in range(num_sents):
+            f.write('# sent_id = %d\n' % n)
+            for i in range(1, 21):
+                lemma, tag = rand.choice(lemmas), rand.choice(tags)
+                text = lemma.capitalize() if i == 1 else lemma
+                f.write('%d\t%s\t%s\tX\t%s\t_\t0\tdep\t_\t_\n' % (i, text, lemma, tag))
+            f.write('\n')
+    return num_sents * 20
+
+
+def runInflector(in_fn, out_fn, n_process):
+    env = dict(os.environ, PYTHONPATH=os.path.abspath('..'))
+    st = time.time()
+    subprocess.check_call([sys.executable, '-m', 'pyinflect.FileInflector', in_fn, out_fn,
+                           '--n-process', str(n_process)], env=env, stdout=subprocess.DEVNULL)
+    return time.time() - st
+
+
+if __name__ == '__main__':
+    num_sents = 100000
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        in_fn = os.path.join(tmp_dir, 'in.conllu')
+        num_tokens = makeConllu(in_fn, num_sents)
+        print('{:,} tokens, {:.1f} MB'.format(num_tokens, os.path.getsize(in_fn) / 1e6))
+        print('%-10s %10s %14s %14s' % ('processes', 'time(s)', 'tokens/sec', 'max RSS(MB)'))
+        for n_process in (1, 2, 4):
+            out_fn = os.path.join(tmp_dir, 'out%d.conllu' % n_process)
+            dt = runInflector(in_fn, out_fn, n_process)
+            # Max RSS of the largest child process so far (KB on Linux)
+            rss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1e3
+            print('%-10d %10.2f %14.0f %14.1f' % (n_process, dt, num_tokens / dt, rss))
+    finally:
+        shutil.rmtree(tmp_dir)
@@ -0,0 +1,85 @@
+#!/usr/bin/python3
+import sys
+sys.path.insert(0, '..')    # make '..' first in the lib search path
+import os
+import glob
+import time
+import shutil
+import zipfile
+import tempfile
+import py_compile
+import subprocess
+from   pyinflect.DataBuilder import DataBuilder
+
+
+# Compare the time to import pyinflect and load the default engine and to load each data
+# format, in new processes so nothing is already loaded.  The frozen module is built in the
+# package directory (the same as "python3 -m pyinflect.DataBuilder --targets frozen") and the
+# other formats in a temporary directory.  The zipapp row imports pyinflect from a zip file with
+# compiled modules, the way it would be deployed in a zipapp or an AWS Lambda layer.
+code = '''
+import time, json
+st = time.perf_counter()
+import pyinflect
+if not %r:
+    pyinflect.InflectionEngine()    # the default engine is created on first use
+import_time = time.perf_counter() - st
+st = time.perf_counter()
+engine = pyinflect.Inflections(%r, pyinflect.OVERRIDES_FN) if %r else pyinflect.InflectionEngine()
+load_time = time.perf_counter() - st if %r else sum(engine.load_times.values())
+st = time.perf_counter()
+engine.getInflection('watch', 'VBD')
+print(json.dumps([import_time, load_time, time.perf_counter() - st]))
+'''
+
+
+def runTest(env, infl_fn=None, path=None):
+    env = dict(os.environ, PYTHONPATH=path or os.path.abspath('..'), **env)
+    args = [sys.executable, '-c', code % (infl_fn, infl_fn, infl_fn, infl_fn)]
+    st = time.perf_counter()
+    out = subprocess.check_output(args, env=env, universal_newlines=True)
+    return [time.perf_counter() - st] + eval(out)
+
+
+def makeZipapp(fn, pkg_dir):
+    with zipfile.ZipFile(fn, 'w') as zf:
+        for py_fn in glob.glob(os.path.join(pkg_dir, '*.py')):
+            # zipimport only uses a .pyc next to the source, not in __pycache__
+            pyc_fn = py_compile.compile(py_fn, os.path.join(os.path.dirname(fn), 'tmp.pyc'))
+            arc_fn = os.path.join('pyinflect', os.path.basename(py_fn))
+            zf.write(py_fn, arc_fn)
+            zf.write(pyc_fn, arc_fn + 'c')
+
+
+if __name__ == '__main__':
+    num_runs = 5
+    pkg_dir = os.path.abspath('../pyinflect')
+    DataBuilder(pkg_dir).build(['frozen'], verbose=True)
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        shutil.copy(os.path.join(pkg_dir, 'infl.csv'), tmp_dir)
+        builder = DataBuilder(tmp_dir, overrides_fn=os.path.join(pkg_dir, 'overrides.csv'))
+        builder.build(['sqlite', 'compact'])
+        zip_fn = os.path.join(tmp_dir, 'app.zip')
+        makeZipapp(zip_fn, pkg_dir)
+        snapshot_dir = os.path.join(tmp_dir, 'snapshots')
+        runTest({'PYINFLECT_SNAPSHOT_DIR':snapshot_dir})     # create the snapshot
+        tests = [('csv', {}, None, None),
+                 ('snapshot', {'PYINFLECT_SNAPSHOT_DIR':snapshot_dir}, None, None),
+                 ('frozen', {'PYINFLECT_FROZEN':'1'}, None, None),
+                 ('zipapp', {'PYINFLECT_FROZEN':'1'}, None, zip_fn),
+                 # Load these after a frozen import, which is the fastest
+                 ('compact', {'PYINFLECT_FROZEN':'1'}, os.path.join(tmp_dir, 'infl_compact.csv'),
+                  None),
+                 ('sqlite', {'PYINFLECT_FROZEN':'1'}, os.path.join(tmp_dir, 'infl.db'), None)]
+        print('Median of %d runs' % num_runs)
+        print('%-10s %12s %12s %12s %14s' % ('format', 'process(ms)', 'import(ms)', 'load(ms)',
+                                             'lookup(us)'))
+        for name, env, infl_fn, path in tests:
+            runs = sorted(runTest(env, infl_fn, path) for _ in range(num_runs))
+            process, import_time, load_time, lookup = runs[num_runs // 2]
+            import_col = '-' if infl_fn else '%.1f' % (1000 * import_time)
+            print('%-10s %12.1f %12s %12.1f %14.1f' % (name, 1000 * process, import_col,
+                  1000 * load_time, 1e6 * lookup))
+    finally:
+        shutil.rmtree(tmp_dir)
@@ -1,5 +1,6 @@
 import sys
 import nltk
+from   pyinflect.CorpusHarness import ignoreWord
 
 
 # load sentences from the nltk corpus
@@ -14,13 +15,6 @@ def loadNLTKCorpus(corp_fn, max_chars=int(1e12)):
     sents = sents[1:-1] # clip the first and last
     return sents
 
-# Instances were matching the original word to the returned inflection should
-# be ignored.
-def ignoreWord(word):
-    if word.lower() in ['was', 'were', 'am', 'are', "'s", "n't", "ma'am", "'ve"]:
-        return True
-    return False
-
 # Simple progress bar
 class ProgressBar(object):
     def __init__(self, end_val, bar_len=20):
@@ -0,0 +1,32 @@
+#!/usr/bin/python3
+import sys
+sys.path.insert(0, '..')    # make '..' first in the lib search path
+import unittest
+import pyinflect
+from   pyinflect import BloomFilter
+
+
+class BloomFilterTests(unittest.TestCase):
+    def testMembership(self):
+        lemmas = list(pyinflect.INFLECTION_INST.infl_data)
+        bloom = BloomFilter.fromItems(lemmas, error_rate=0.01)
+        self.assertTrue(all(lemma in bloom for lemma in lemmas))  # never a false negative
+        false_pos = sum(1 for lemma in lemmas if 'xx' + lemma in bloom)
+        self.assertLess(false_pos / float(len(lemmas)), 0.02)
+        # Serialization round trip
+        bloom2 = BloomFilter.fromBytes(bloom.toBytes())
+        self.assertEqual(bloom2.bits, bloom.bits)
+        self.assertTrue('watch' in bloom2)
+
+    def testKnownWords(self):
+        infl = pyinflect.InflectionEngine()
+        self.assertTrue(infl.isKnownLemma('Watch'))
+        self.assertFalse(infl.isKnownLemma('watched'))
+        self.assertTrue(infl.isKnownForm('watched'))
+        self.assertTrue(infl.isKnownForm('AWAKED'))
+        self.assertFalse(infl.isKnownForm('xxwatched'))
+
+
+if __name__ == '__main__':
+    # run all methods that start with 'test'
+    unittest.main()
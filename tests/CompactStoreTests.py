@@ -0,0 +1,81 @@
+#!/usr/bin/python3
+import sys
+sys.path.insert(0, '..')    # make '..' first in the lib search path
+import os
+import shutil
+import tempfile
+import unittest
+import pyinflect
+from   pyinflect import Inflections, CompactStore
+from   pyinflect import Paradigms
+from   pyinflect.AGIDReader import AGIDReader
+
+
+class CompactStoreTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.mkdtemp()
+        cls.compact_fn = os.path.join(cls.tmp_dir, 'infl_compact.csv')
+        CompactStore.create(cls.compact_fn, pyinflect.INFL_FN)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmp_dir)
+
+    def testParadigms(self):
+        self.assertEqual(Paradigms.classify('watch', 'V', [('watched',), ('<>',), ('watching',), ('watches',)]), 'R')
+        self.assertEqual(Paradigms.classify('cancel', 'V', [('cancelled', 'canceled'), ('<>',),
+                         ('cancelling', 'canceling'), ('cancels',)]), 'DR')
+        self.assertEqual(Paradigms.classify('abacus', 'N', [('abacuses', 'abaci')]), 'RG')
+        self.assertEqual(Paradigms.classify('aardwolf', 'N', [('aardwolves',)]), None)
+        self.assertEqual(Paradigms.expand('big', 'A', 'D'), [('bigger',), ('biggest',)])
+
+    def testSuffixEncoding(self):
+        self.assertEqual(CompactStore.encodeForm('aardwolf', 'aardwolves'), '1ves')
+        self.assertEqual(CompactStore.encodeForm('sheep', 'sheep'), '0')
+        self.assertEqual(CompactStore.encodeForm('be', 'was'), '2was')
+        self.assertEqual(CompactStore.encodeForm('abide', '<>'), '<>')
+        for lemma, form in [('aardwolf', 'aardwolves'), ('sheep', 'sheep'), ('be', 'was'),
+                            ('kHz', 'kHzes'), ('criterion', 'criteria')]:
+            self.assertEqual(CompactStore.decodeForm(lemma, CompactStore.encodeForm(lemma, form)), form)
+        # Unencoded forms (version 1 files) are returned as is
+        self.assertEqual(CompactStore.decodeForm('aardwolf', 'aardwolves'), 'aardwolves')
+
+    def testAGIDReaderSave(self):
+        agid_fn = os.path.join(self.tmp_dir, 'infl.txt')
+        with open(agid_fn, 'w') as f:
+            f.write('aah V: aahed | aahing | aahs\n')
+            f.write('aardwolf N: aardwolves\n')
+            f.write('abide V: abode, abided | abode, abided, abidden | abiding | abides\n')
+        out_fn = os.path.join(self.tmp_dir, 'agid_compact.csv')
+        AGIDReader(agid_fn).save(out_fn, compact=True)
+        with open(out_fn) as f:
+            self.assertEqual(f.read().splitlines(), [CompactStore.header, 'aah,V,=R',
+                'aardwolf,N,1ves', 'abide,V,3ode/0d,3ode/0d/1den,1ing,0s'])
+        store = CompactStore(out_fn)
+        self.assertEqual(store['abide']['VBN'], ('abode', 'abided', 'abidden'))
+        self.assertEqual(store['aardwolf'], {'NN': ('aardwolf',), 'NNS': ('aardwolves',)})
+
+    # Every lemma in the table must give exactly the same result as the csv data
+    def testFullTableEquivalence(self):
+        store = CompactStore(self.compact_fn)
+        infl_data = pyinflect.INFLECTION_INST.infl_data
+        self.assertEqual(len(store), len(infl_data))
+        for lemma, tag_forms in infl_data.items():
+            self.assertEqual(store[lemma], tag_forms, lemma)
+
+    def testEngine(self):
+        infl = Inflections(self.compact_fn, pyinflect.OVERRIDES_FN)
+        for lemma in ['watch', 'Be', 'AWAKE', 'squirrel', 'only', 'can', 'aardwolf', 'xxtest']:
+            self.assertEqual(infl.getAllInflections(lemma), pyinflect.getAllInflections(lemma))
+        self.assertEqual(infl.getInflection('xxban', 'VBG', inflect_oov=True), ('xxbaning', 'xxbanning'))
+        # The regular entries take much less space than the explicit forms
+        with open(self.compact_fn) as f:
+            lines = f.readlines()[1:]
+        num_coded = sum(1 for line in lines if ',=' in line)
+        self.assertGreater(num_coded, 0.9 * len(lines))
+
+
+if __name__ == '__main__':
+    # run all methods that start with 'test'
+    unittest.main()
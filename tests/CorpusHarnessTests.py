@@ -0,0 +1,52 @@
+#!/usr/bin/python3
+import sys
+sys.path.insert(0, '..')    # make '..' first in the lib search path
+import os
+import json
+import shutil
+import tempfile
+import unittest
+from   pyinflect.CorpusHarness import CorpusHarness, iterParagraphs
+
+
+class CorpusHarnessTests(unittest.TestCase):
+    def testCheckToken(self):
+        harness = CorpusHarness()
+        self.assertEqual(harness.checkToken('Walked', 'walk', 'VBD'), ('correct', 'Walked'))
+        self.assertEqual(harness.checkToken('were', 'be', 'VBD'), ('correct', 'was'))
+        self.assertEqual(harness.checkToken('learnt', 'learn', 'VBD'), ('alt_form', 'learned'))
+        self.assertEqual(harness.checkToken('walked', 'walk', 'VBG'), ('wrong_form', 'walking'))
+        self.assertEqual(harness.checkToken('xxfooed', 'xxfoo', 'VBD'), ('none_unknown', None))
+        self.assertEqual(harness.checkToken('walk', 'walk', 'JJR'), ('none_tag', None))
+        harness = CorpusHarness(inflect_oov=True)
+        self.assertEqual(harness.checkToken('xxfooed', 'xxfoo', 'VBD'), ('correct', 'xxfooed'))
+
+    def testReport(self):
+        harness = CorpusHarness()
+        for text, lemma, tag in [('The', 'the', 'DT'), ('dogs', 'dog', 'NNS'),
+                                 ('learnt', 'learn', 'VBD'), ('xxfoos', 'xxfoo', 'NNS')]:
+            harness.addToken(text, lemma, tag)
+        report = json.loads(json.dumps(harness.report()))
+        self.assertEqual(report['tokens'], 4)
+        self.assertEqual(report['checked'], 3)
+        self.assertEqual(report['correct'], 1)
+        self.assertAlmostEqual(report['none_rate'], 1.0/3)
+        self.assertEqual(report['errors'], {'alt_form':1, 'none_unknown':1})
+        self.assertEqual(report['errors_by_tag'], {'VBD':1, 'NNS':1})
+        self.assertEqual(len(report['examples']), 2)
+
+    def testIterParagraphs(self):
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            fn = os.path.join(tmp_dir, 'corpus.txt')
+            with open(fn, 'w') as f:
+                f.write('First line\nof one.\n\n\nSecond.\n\nThird\n')
+            self.assertEqual(list(iterParagraphs(fn)), ['First line of one.', 'Second.', 'Third'])
+            self.assertEqual(list(iterParagraphs(fn, max_chars=5)), ['First line of one.'])
+        finally:
+            shutil.rmtree(tmp_dir)
+
+
+if __name__ == '__main__':
+    # run all methods that start with 'test'
+    unittest.main()
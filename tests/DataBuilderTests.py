@@ -0,0 +1,128 @@
+#!/usr/bin/python3
+import sys
+sys.path.insert(0, '..')    # make '..' first in the lib search path
+import os
+import shutil
+import tempfile
+import subprocess
+import unittest
+import pyinflect
+from   pyinflect import Inflections
+from   pyinflect.DataBuilder import DataBuilder
+
+
+# A few lines in the format of the raw AGID infl.txt file
+AGID_LINES = ['aah V: aahed | aahing | aahs',
+              'aardwolf N: aardwolves',
+              'Aaron N: Aarons',
+              'abide V: abode, abided | abode, abided, abidden | abiding | abides',
+              'big A: bigger | biggest']
+
+
+class DataBuilderTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.agid_fn = os.path.join(self.tmp_dir, 'infl.txt')
+        self.writeAGID(AGID_LINES)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def writeAGID(self, lines):
+        with open(self.agid_fn, 'w') as f:
+            f.write('\n'.join(lines) + '\n')
+
+    def testBuild(self):
+        builder = DataBuilder(self.tmp_dir, self.agid_fn)
+        self.assertEqual(builder.build(), [('csv', 'built'), ('sqlite', 'built'),
+                                           ('compact', 'built'), ('oov', 'built'),
+                                           ('frozen', 'built')])
+        with open(os.path.join(self.tmp_dir, 'infl.csv')) as f:
+            self.assertEqual(f.read().splitlines(),
+                ['aah,V,aahed,<>,aahing,aahs', 'aardwolf,N,aardwolves',
+                 'abide,V,abode/abided,abode/abided/abidden,abiding,abides', 'big,A,bigger,biggest'])
+        for fn in ['infl.csv', 'infl.db', 'infl_compact.csv', 'infl_frozen.py']:
+            infl = Inflections(os.path.join(self.tmp_dir, fn))
+            self.assertEqual(infl.getInflection('aardwolf', 'NNS'), ('aardwolves',))
+            self.assertEqual(infl.getInflection('big', 'JJS'), ('biggest',))
+
+    def testIncremental(self):
+        self.assertEqual(DataBuilder(self.tmp_dir, self.agid_fn).build(),
+                         [('csv', 'built'), ('sqlite', 'built'), ('compact', 'built'),
+                          ('oov', 'built'), ('frozen', 'built')])
+        # Unchanged inputs (with a new builder instance, so the manifest is re-read)
+        self.assertEqual(DataBuilder(self.tmp_dir, self.agid_fn).build(),
+                         [('csv', 'skipped'), ('sqlite', 'skipped'), ('compact', 'skipped'),
+                          ('oov', 'skipped'), ('frozen', 'skipped')])
+        self.assertEqual(DataBuilder(self.tmp_dir, self.agid_fn).build(force=True),
+                         [('csv', 'built'), ('sqlite', 'built'), ('compact', 'built'),
+                          ('oov', 'built'), ('frozen', 'built')])
+        # Changing the input rebuilds everything downstream
+        self.writeAGID(AGID_LINES + ['bird N: birds'])
+        self.assertEqual(DataBuilder(self.tmp_dir, self.agid_fn).build(),
+                         [('csv', 'built'), ('sqlite', 'built'), ('compact', 'built'),
+                          ('oov', 'built'), ('frozen', 'built')])
+        # A damaged output is rebuilt
+        with open(os.path.join(self.tmp_dir, 'infl.db'), 'ab') as f:
+            f.write(b'x')
+        self.assertEqual(DataBuilder(self.tmp_dir, self.agid_fn).build(),
+                         [('csv', 'skipped'), ('sqlite', 'built'), ('compact', 'skipped'),
+                          ('oov', 'skipped'), ('frozen', 'skipped')])
+
+    def testRankings(self):
+        corpus_fn = os.path.join(self.tmp_dir, 'corpus.txt')
+        with open(corpus_fn, 'w') as f:
+            f.write('He abided by it.  They abided.  She abode there.\n')
+        builder = DataBuilder(self.tmp_dir, self.agid_fn, corpus_fns=[corpus_fn])
+        self.assertEqual(builder.build(['csv', 'rankings']), [('csv', 'built'),
+                                                              ('rankings', 'built')])
+        with open(os.path.join(self.tmp_dir, 'rankings.csv')) as f:
+            self.assertEqual(f.read().splitlines(), ['abide,VBD,abided/abode',
+                                                     'abide,VBN,abided/abode/abidden'])
+        self.assertEqual(builder.build(['rankings']), [('rankings', 'skipped')])
+        with open(corpus_fn, 'a') as f:
+            f.write('abode abode\n')
+        self.assertEqual(builder.build(['rankings']), [('rankings', 'built')])
+
+    def testUnknownTargets(self):
+        builder = DataBuilder(self.tmp_dir, self.agid_fn)
+        self.assertRaises(ValueError, builder.build, ['sqlite', 'frozn'])
+        # rankings is only available with corpus files
+        self.assertRaises(ValueError, builder.build, ['rankings'])
+        self.assertFalse(os.path.exists(os.path.join(self.tmp_dir, 'infl.db')))
+        # csv is only available with the AGID file
+        builder.build(['csv'])
+        self.assertRaises(ValueError, DataBuilder(self.tmp_dir).build, ['csv'])
+        out = subprocess.run([sys.executable, '-m', 'pyinflect.DataBuilder', '--out-dir',
+                              self.tmp_dir, '--targets', 'csv,frozen'], cwd='..',
+                             stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                             universal_newlines=True)
+        self.assertNotEqual(out.returncode, 0)
+        self.assertIn('csv', out.stderr)
+        self.assertFalse(os.path.exists(os.path.join(self.tmp_dir, 'infl_frozen.py')))
+
+    def testBuildWithoutData(self):
+        # Build from infl.txt into an empty directory with a copy of the package that has no
+        # data files, so importing pyinflect must not load them
+        pkg_dir = os.path.join(self.tmp_dir, 'lib', 'pyinflect')
+        shutil.copytree(os.path.dirname(os.path.abspath(pyinflect.__file__)), pkg_dir,
+                        ignore=shutil.ignore_patterns('*.csv', '*.db', 'infl_frozen.py*',
+                                                      '__pycache__', '*.json'))
+        out_dir = os.path.join(self.tmp_dir, 'out')
+        os.mkdir(out_dir)
+        env = dict(os.environ, PYTHONPATH=os.path.dirname(pkg_dir))
+        for name in ('PYINFLECT_FROZEN', 'PYINFLECT_RANKINGS', 'PYINFLECT_SNAPSHOT_DIR'):
+            env.pop(name, None)
+        out = subprocess.run([sys.executable, '-m', 'pyinflect.DataBuilder', '--agid',
+                              self.agid_fn, '--out-dir', out_dir], env=env, cwd=self.tmp_dir,
+                             stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                             universal_newlines=True)
+        self.assertEqual(out.returncode, 0, out.stderr)
+        self.assertFalse(os.path.exists(os.path.join(pkg_dir, 'infl.csv')))
+        infl = Inflections(os.path.join(out_dir, 'infl.csv'))
+        self.assertEqual(infl.getInflection('aardwolf', 'NNS'), ('aardwolves',))
+
+
+if __name__ == '__main__':
+    # run all methods that start with 'test'
+    unittest.main()
@@ -0,0 +1,116 @@
+#!/usr/bin/python3
+import sys
+sys.path.insert(0, '..')    # make '..' first in the lib search path
+import io
+import os
+import json
+import time
+import shutil
+import tempfile
+import unittest
+import contextlib
+from   unittest import mock
+import pyinflect
+from   pyinflect import Diagnostics, Inflections, InflectionCache
+
+
+class DiagnosticsTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.mkdtemp()
+        cls.overrides_fn = os.path.join(cls.tmp_dir, 'overrides.csv')
+        with open(cls.overrides_fn, 'w') as f:
+            f.write('learn,VBD,learnt\n')
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmp_dir)
+
+    def testDeepSize(self):
+        forms = ('walked',)
+        data = {'walk':{'VBD':forms, 'VBN':forms}}
+        size = Diagnostics.deepSize(data)
+        self.assertEqual(size, sum(sys.getsizeof(x) for x in (data, 'walk', data['walk'], 'VBD',
+                                                              'VBN', forms, 'walked')))
+        # Objects in seen aren't counted again
+        seen = set()
+        Diagnostics.deepSize(forms, seen)
+        self.assertEqual(Diagnostics.deepSize(data, seen), size - sys.getsizeof(forms) -
+                         sys.getsizeof('walked'))
+
+    def testDataStats(self):
+        engine = Inflections(pyinflect.INFL_FN, pyinflect.OVERRIDES_FN)
+        stats = Diagnostics.dataStats(engine)
+        self.assertEqual(stats['store'], 'dict')
+        self.assertEqual(stats['lemmas']['infl_data'], len(engine.infl_data))
+        self.assertEqual(stats['tags']['VBD'], sum(1 for data in (engine.infl_data,
+                         engine.overrides) for entry in data.values() if 'VBD' in entry))
+        self.assertEqual(stats['tuples']['references'], sum(stats['tags'].values()))
+        # VBN shares the VBD tuple when they're the same, ie.. walked
+        self.assertGreater(stats['tuples']['shared'], 0)
+        self.assertGreaterEqual(stats['tuples']['objects'], stats['tuples']['values'])
+        self.assertEqual(stats['bytes']['total'],
+                         stats['bytes']['infl_data'] + stats['bytes']['overrides'])
+
+    def testLoadTimes(self):
+        engine = Inflections(pyinflect.INFL_FN, pyinflect.OVERRIDES_FN, pos_types=['V'])
+        self.assertEqual(sorted(Diagnostics.loadTimes(engine)),
+                         ['_loadInflections', '_loadOverrides'])
+        overlay = engine.createOverlay(self.overrides_fn)
+        overlay.loadLexicon(['blorf,V,blorfed,<>,blorfing,blorfs'])
+        self.assertEqual(sorted(Diagnostics.loadTimes(overlay)),
+                         ['_loadInflections', '_loadOverrides', 'createOverlay', 'loadLexicon'])
+        self.assertNotIn('createOverlay', engine.load_times)
+
+    def testCacheStats(self):
+        engine = Inflections(pyinflect.INFL_FN, pyinflect.OVERRIDES_FN, pos_types=['A'])
+        stats = Diagnostics.cacheStats(engine)
+        self.assertIsNone(stats['cache'])
+        self.assertEqual(stats['indices'], {'known_forms':None, 'prefix_index':None,
+                                            'fuzzy_index':None})
+        cache = InflectionCache(os.path.join(self.tmp_dir, 'cache.sqlite'), 'test', 100)
+        engine.setCache(cache)
+        engine.getInflection('xxhappy', 'JJR', inflect_oov=True)
+        engine.isKnownForm('happier')
+        stats = Diagnostics.cacheStats(engine)
+        self.assertEqual(stats['cache'], {'entries':1, 'max_entries':100, 'pending':0})
+        self.assertGreater(stats['indices']['known_forms'], 0)
+        cache.close()
+
+    def testLatencyWithCache(self):
+        # The attached cache isn't used or filled by the timed lookups
+        engine = Inflections(pyinflect.INFL_FN, pyinflect.OVERRIDES_FN, pos_types=['V'])
+        cache = InflectionCache(os.path.join(self.tmp_dir, 'latency.sqlite'), 'test')
+        engine.setCache(cache)
+        engine.getInflection('xxwalk', 'VBD', inflect_oov=True)
+        # The engine's cache stays attached during the timing, for other threads
+        timer = time.perf_counter_ns
+        def checkedTimer():
+            self.assertIs(engine.cache, cache)
+            return timer()
+        with mock.patch.object(time, 'perf_counter_ns', checkedTimer):
+            latency = Diagnostics.lookupLatency(engine, 100)
+        self.assertEqual(sorted(latency), ['hit', 'miss'])
+        self.assertIs(engine.cache, cache)
+        self.assertEqual(len(cache), 1)
+        cache.close()
+
+    def testReport(self):
+        rep = Diagnostics.report(num_lookups=200)
+        for name in ('hit', 'miss'):
+            stats = rep['latency_us'][name]
+            self.assertLessEqual(stats['p50'], stats['p99'])
+            self.assertLessEqual(stats['p99'], stats['max'])
+        self.assertIn('Lookup latency', Diagnostics.formatReport(rep))
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            Diagnostics.main(['--json', '--lookups', '0'])
+        rep = json.loads(out.getvalue())
+        self.assertIsNone(rep['latency_us'])
+        self.assertEqual(rep['data']['store'],
+                         type(pyinflect.InflectionEngine().infl_data).__name__)
+
+
+if __name__ == '__main__':
+    # run all methods that start with 'test'
+    unittest.main()
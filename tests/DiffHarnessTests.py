@@ -0,0 +1,86 @@
+#!/usr/bin/python3
+import sys
+sys.path.insert(0, '..')    # make '..' first in the lib search path
+import os
+import json
+import shutil
+import tempfile
+import unittest
+import subprocess
+import pyinflect
+from   pyinflect import Inflections, CompactStore
+from   pyinflect.DiffHarness import DiffHarness, loadRevision
+
+
+class DiffHarnessTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.mkdtemp()
+        cls.compact_fn = os.path.join(cls.tmp_dir, 'infl_compact.csv')
+        CompactStore.create(cls.compact_fn, pyinflect.INFL_FN)
+        cls.reference = Inflections(pyinflect.INFL_FN, pyinflect.OVERRIDES_FN)
+        cls.lemmas = sorted(cls.reference.infl_data)[::500]
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmp_dir)
+
+    def testEquivalent(self):
+        candidate = Inflections(self.compact_fn, pyinflect.OVERRIDES_FN)
+        report = DiffHarness(self.reference, candidate).run(self.lemmas, n_process=2)
+        self.assertTrue(report['equivalent'])
+        self.assertEqual(report['lemmas'], len(self.lemmas))
+        self.assertEqual(report['calls']['getInflection'], len(self.lemmas) * 3 * 17 * 2)
+        self.assertGreater(report['speed']['getInflection']['candidate_per_sec'], 0)
+
+    def testDiffs(self):
+        overrides_fn = os.path.join(self.tmp_dir, 'british.csv')
+        with open(overrides_fn, 'w') as f:
+            f.write('learn,VBD,learnt\n')
+        candidate = self.reference.createOverlay(overrides_fn)
+        report = DiffHarness(self.reference, candidate, max_diffs=3).run(['learn', 'walk'])
+        report = json.loads(json.dumps(report))
+        self.assertFalse(report['equivalent'])
+        # VBD for 3 caps styles, inflect_oov on and off and getAllInflections for None and V
+        self.assertEqual(report['num_diffs'], {'getInflection':6, 'getAllInflections':6})
+        self.assertEqual(len(report['diffs']), 3)
+        self.assertEqual(report['diffs'][0], {'method':'getInflection',
+                         'args':['learn', 'VBD', False], 'reference':['learned', 'learnt'],
+                         'candidate':['learnt']})
+
+    def testRevision(self):
+        # A reference from a pinned revision finds changes to the lookup code, not just the data
+        pkg_dir = os.path.join(self.tmp_dir, 'repo', 'pyinflect')
+        shutil.copytree(os.path.dirname(os.path.abspath(pyinflect.__file__)), pkg_dir,
+                        ignore=shutil.ignore_patterns('infl_frozen.py*', '*.db', '__pycache__',
+                                                      '*.json', 'infl_compact.csv'))
+        def git(*args):
+            subprocess.run(('git', '-c', 'user.name=test', '-c', 'user.email=test@test') + args,
+                           cwd=pkg_dir, check=True, stdout=subprocess.PIPE)
+        git('init', '-q')
+        git('add', '.')
+        git('commit', '-q', '-m', 'current')
+        fn = os.path.join(pkg_dir, 'Inflections.py')
+        with open(fn) as f:
+            code = f.read()
+        self.assertIn("'RB':lemma,", code)
+        with open(fn, 'w') as f:
+            f.write(code.replace("'RB':lemma,", "'RB':(lemma,),"))
+        git('commit', '-q', '-a', '-m', 'RB as a tuple')
+        out_dir = os.path.join(self.tmp_dir, 'revisions')
+        lemmas = ['fast', 'walk']
+        for rev, equivalent in (('HEAD~1', True), ('HEAD', False)):
+            package = loadRevision(rev, out_dir, pkg_dir)
+            self.assertNotEqual(package.__name__, 'pyinflect')
+            reference = package.Inflections(package.INFL_FN, package.OVERRIDES_FN)
+            report = DiffHarness(reference, self.reference).run(lemmas, n_process=2)
+            self.assertEqual(report['equivalent'], equivalent)
+        # getAllInflectionsOOV for A, in the 3 caps styles, for both lemmas
+        self.assertEqual(report['num_diffs'], {'getAllInflectionsOOV':6})
+        self.assertEqual(report['diffs'][0]['reference']['RB'], ('fast',))
+        self.assertRaises(ValueError, loadRevision, 'xxnorevision', out_dir, pkg_dir)
+
+
+if __name__ == '__main__':
+    # run all methods that start with 'test'
+    unittest.main()
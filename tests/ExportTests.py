@@ -0,0 +1,90 @@
+#!/usr/bin/python3
+import sys
+sys.path.insert(0, '..')    # make '..' first in the lib search path
+import os
+import csv
+import json
+import shutil
+import tempfile
+import unittest
+import pyinflect
+from   pyinflect import Export
+
+
+class ExportTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = pyinflect.InflectionEngine()
+        cls.rows = list(Export.iterParadigms(cls.engine, pos_type='V'))
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def testRows(self):
+        rows = [r for r in self.rows if r[0] == 'be']
+        self.assertIn(('be', 'V', 'VBD', 0, 'was', 'agid'), rows)
+        self.assertIn(('be', 'V', 'VBD', 1, 'were', 'agid'), rows)
+        self.assertTrue(all(r[1] == 'V' for r in self.rows))
+        lemmas = [r[0] for r in self.rows]
+        self.assertEqual(lemmas, sorted(lemmas))
+        # The rows should match getAllInflections
+        for lemma in ('be', 'travel', 'walk'):
+            forms = {}
+            for l, pt, tag, i, form, source in self.rows:
+                if l == lemma:
+                    forms.setdefault(tag, []).append(form)
+            expected = self.engine.getAllInflections(lemma, 'V')
+            self.assertEqual(forms, {t:list(f) for t, f in expected.items()})
+
+    def testOverrideSource(self):
+        rows = [r for r in self.rows if r[0] == 'travel']
+        self.assertIn(('travel', 'V', 'VBD', 0, 'travelled', 'override'), rows)
+        self.assertTrue(all(r[5] == 'agid' for r in self.rows if r[0] == 'walk'))
+
+    def testVocab(self):
+        rows = list(Export.iterParadigms(self.engine, 'V', ['Xqzvbn', 'walk', '', 'xqzvbn']))
+        oov = [r for r in rows if r[5] == 'oov']
+        self.assertIn(('xqzvbn', 'V', 'VBD', 0, 'xqzvbned', 'oov'), oov)
+        self.assertTrue(all(r[0] == 'xqzvbn' for r in oov))
+        self.assertEqual(len(oov), len(set(oov)))
+        self.assertEqual(len(rows), len(self.rows) + len(oov))
+        # Only repeats of the previous word are skipped, so memory use doesn't grow with the vocab
+        rows = list(Export.iterParadigms(self.engine, 'V', ['xqzvbn', 'xqzvbnx', 'xqzvbn']))
+        self.assertEqual(len(rows), len(self.rows) + 3 * len(oov))
+
+    def testJSONL(self):
+        fn = os.path.join(self.tmp_dir, 'paradigms.jsonl')
+        self.assertEqual(Export.export(fn, iter(self.rows[:1000])), 1000)
+        with open(fn) as f:
+            data = [json.loads(line) for line in f]
+        self.assertEqual(data, [dict(zip(Export.columns, r)) for r in self.rows[:1000]])
+
+    def testCSV(self):
+        fn = os.path.join(self.tmp_dir, 'paradigms.csv')
+        self.assertEqual(Export.export(fn, iter(self.rows[:1000])), 1000)
+        with open(fn, newline='') as f:
+            data = list(csv.reader(f))
+        self.assertEqual(tuple(data[0]), Export.columns)
+        self.assertEqual(data[1:], [[str(x) for x in r] for r in self.rows[:1000]])
+
+    def testFormat(self):
+        fn = os.path.join(self.tmp_dir, 'paradigms.txt')
+        self.assertRaises(ValueError, Export.export, fn, self.rows[:10])
+        self.assertEqual(Export.export(fn, self.rows[:10], 'csv'), 10)
+
+    @unittest.skipIf(Export.pyarrow is None, 'pyarrow is not installed')
+    def testParquet(self):
+        import pyarrow.parquet
+        fn = os.path.join(self.tmp_dir, 'paradigms.parquet')
+        self.assertEqual(Export.writeParquet(fn, self.rows[:1000], chunk_size=300), 1000)
+        table = pyarrow.parquet.read_table(fn)
+        self.assertEqual(table.column_names, list(Export.columns))
+        self.assertEqual([tuple(r.values()) for r in table.to_pylist()], self.rows[:1000])
+
+
+if __name__ == '__main__':
+    # run all methods that start with 'test'
+    unittest.main()
@@ -0,0 +1,109 @@
+#!/usr/bin/python3
+import sys
+sys.path.insert(0, '..')    # make '..' first in the lib search path
+import os
+import shutil
+import tempfile
+import unittest
+import pyinflect
+from   pyinflect.FileInflector import FileInflector
+
+
+conllu = '''# sent_id = 1
+# text = The Geese weren't walking.
+1\tThe\tthe\tDET\tDT\tDefinite=Def\t2\tdet\t_\t_
+2\tGeese\tgoose\tNOUN\tNNS\tNumber=Plur\t4\tnsubj\t_\t_
+3-4\tweren't\t_\t_\t_\t_\t_\t_\t_\t_
+3\twere\tbe\tAUX\tVBD\tMood=Ind\t5\taux\t_\t_
+4\tn't\tnot\tPART\tRB\t_\t5\tadvmod\t_\t_
+5\tWALKING\twalk\tVERB\tVBG\tVerbForm=Ger\t0\troot\t_\tSpaceAfter=No
+5.1\tgone\tgo\tVERB\tVBN\t_\t_\t_\t_\t_
+6\t.\t.\tPUNCT\t.\t_\t5\tpunct\t_\t_
+
+'''
+
+
+class FileInflectorTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def testConllu(self):
+        lines = FileInflector().inflectLines(conllu.splitlines(True))
+        self.assertEqual(lines[0], '# sent_id = 1\n')
+        self.assertEqual(lines[2], conllu.splitlines(True)[2])     # DT isn't inflected
+        self.assertTrue(lines[3].endswith('\tInflection=Geese\n'))
+        self.assertEqual(lines[4], conllu.splitlines(True)[4])
+        self.assertTrue(lines[5].endswith('\tInflection=was\n'))
+        self.assertTrue(lines[7].endswith('\tSpaceAfter=No|Inflection=WALKING\n'))
+        self.assertEqual(lines[8], conllu.splitlines(True)[8])
+        self.assertEqual(lines[9], conllu.splitlines(True)[9])
+        lines = FileInflector(tag='VBZ').inflectLines(conllu.splitlines(True))
+        self.assertTrue(lines[7].endswith('\tSpaceAfter=No|Inflection=WALKS\n'))
+        self.assertTrue(lines[2].endswith('\t_\n'))
+
+    def testTSV(self):
+        lines = ['walk\twalk\tVBD\r\n', 'xqzvbn\txqzvbn\tVBD\n', '\n', 'be\tbe\tVBD']
+        inflector = FileInflector(fmt='tsv')
+        self.assertEqual(inflector.inflectLines(lines), ['walk\twalk\tVBD\twalked\r\n',
+                         'xqzvbn\txqzvbn\tVBD\t\n', '\n', 'be\tbe\tVBD\twas'])
+        inflector = FileInflector(fmt='tsv', lemma_col=0, tag_col=2, form_num=1, inflect_oov=True)
+        self.assertEqual(inflector.inflectLines(lines[1:]), ['xqzvbn\txqzvbn\tVBD\txqzvbnned\n',
+                         '\n', 'be\tbe\tVBD\twere'])
+        self.assertEqual(inflector.inflectLines(['xxfast\txxfast\tRB\n']),
+                         ['xxfast\txxfast\tRB\txxfast\n'])
+        self.assertRaises(ValueError, FileInflector, fmt='csv')
+
+    def testNoTag(self):
+        # Tokens without a tag get an empty column, including with the rules for OOV words
+        lines = ['flurbify\tflurbify\t\n', 'walk\twalk\t_\n', 'walk\twalk\tVBD\n']
+        for inflect_oov in (False, True):
+            inflector = FileInflector(fmt='tsv', inflect_oov=inflect_oov)
+            self.assertEqual(inflector.inflectLines(lines), ['flurbify\tflurbify\t\t\n',
+                             'walk\twalk\t_\t\n', 'walk\twalk\tVBD\twalked\n'])
+        line = '1\tflurbify\tflurbify\tVERB\t_\t_\t0\troot\t_\t_\n'
+        self.assertEqual(FileInflector(inflect_oov=True).inflectLines([line]), [line])
+        self.assertEqual(pyinflect.getInflection('flurbify', '', inflect_oov=True), None)
+        # Tokens without a lemma aren't inflected either
+        lines = ['_\t_\tVBD\n', 'walk\t\tVBD\n']
+        self.assertEqual(FileInflector(fmt='tsv', inflect_oov=True).inflectLines(lines),
+                         ['_\t_\tVBD\t\n', 'walk\t\tVBD\t\n'])
+        line = '1\t_\t_\tPUNCT\tNN\t_\t0\troot\t_\t_\n'
+        self.assertEqual(FileInflector(inflect_oov=True).inflectLines([line]), [line])
+
+    def testRerun(self):
+        # Processing a file again replaces the Inflection instead of adding another one
+        lines = FileInflector().inflectLines(conllu.splitlines(True))
+        self.assertEqual(FileInflector().inflectLines(lines), lines)
+        lines = FileInflector(tag='VBZ').inflectLines(lines)
+        self.assertTrue(lines[7].endswith('\tSpaceAfter=No|Inflection=WALKS\n'))
+        line = '1\twalk\twalk\tVERB\tVBD\t_\t0\troot\t_\tInflection=walks|MyInflection=x\n'
+        self.assertEqual(FileInflector().inflectLines([line]),
+                         [line.replace('Inflection=walks|MyInflection=x',
+                                       'MyInflection=x|Inflection=walked')])
+
+    def testRun(self):
+        in_fn = os.path.join(self.tmp_dir, 'in.conllu')
+        with open(in_fn, 'w') as f:
+            for i in range(200):
+                f.write(conllu.replace('sent_id = 1', 'sent_id = %d' % i))
+        inflector = FileInflector(batch_size=7)
+        out_fn = os.path.join(self.tmp_dir, 'out1.conllu')
+        self.assertEqual(inflector.run(in_fn, out_fn), 200 * 11)
+        with open(out_fn) as f:
+            expected = f.read()
+        self.assertEqual(expected.count('Inflection='), 200 * 4)
+        chunks = inflector._splitFile(in_fn, 1000)
+        self.assertGreater(len(chunks), 10)
+        out_fn = os.path.join(self.tmp_dir, 'out2.conllu')
+        self.assertEqual(inflector.run(in_fn, out_fn, n_process=2, chunk_size=1000), 200 * 11)
+        with open(out_fn) as f:
+            self.assertEqual(f.read(), expected)
+        self.assertEqual(sorted(os.listdir(self.tmp_dir)), ['in.conllu', 'out1.conllu', 'out2.conllu'])
+
+
+if __name__ == '__main__':
+    # run all methods that start with 'test'
+    unittest.main()
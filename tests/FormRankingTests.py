@@ -0,0 +1,98 @@
+#!/usr/bin/python3
+import sys
+sys.path.insert(0, '..')    # make '..' first in the lib search path
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+import pyinflect
+from   pyinflect import Inflections, FormRanking
+
+
+class FormRankingTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.mkdtemp()
+        cls.text_fn = os.path.join(cls.tmp_dir, 'corpus.txt')
+        with open(cls.text_fn, 'w') as f:
+            for i in range(50):
+                f.write('I dreamt that I was dreaming.  She dreamt, he dreamed.\n')
+                f.write("They've learnt it.  It's spelt that way.\n")
+        cls.engine = Inflections(pyinflect.INFL_FN, pyinflect.OVERRIDES_FN)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmp_dir)
+
+    def testCountWords(self):
+        counts = FormRanking.countWords([self.text_fn])
+        self.assertEqual(counts['dreamt'], 100)
+        self.assertEqual(counts['dreamed'], 50)
+        self.assertEqual(counts["they've"], 50)
+        # Counting in chunks with several processes gives the same counts
+        parallel = FormRanking.countWords([self.text_fn, self.text_fn], n_process=2,
+                                          chunk_size=500)
+        self.assertEqual(parallel, counts + counts)
+
+    def testConllu(self):
+        fn = os.path.join(self.tmp_dir, 'corpus.conllu')
+        with open(fn, 'w') as f:
+            f.write('# text = She dreamed\n1\tShe\tshe\tPRON\tPRP\t_\t2\tnsubj\t_\t_\n'
+                    '2\tdreamed\tdream\tVERB\tVBD\t_\t0\troot\t_\t_\n\n')
+        counts = FormRanking.countWords([fn])
+        self.assertEqual(counts, {('she', 'PRP', 'she'):1, ('dream', 'VBD', 'dreamed'):1})
+        # Tagged counts are used in preference to the word counts
+        counts.update(FormRanking.countWords([self.text_fn]))
+        rankings = FormRanking.rankForms(counts, self.engine)
+        self.assertNotIn(('dream', 'VBD'), rankings)
+        self.assertEqual(rankings[('dream', 'VBN')], ('dreamt', 'dreamed'))
+
+    def testReadMultiInfls(self):
+        fn = os.path.join(self.tmp_dir, 'CorpMultiInfls.txt')
+        with open(fn, 'w') as f:
+            f.write("  dream/VBD -> [('dreamt', 3), ('dreamed', 1)]\n"
+                    "  be/VBD -> [('were', 9), ('was', 2)]\n")
+        counts = FormRanking.readMultiInfls(fn)
+        self.assertEqual(counts[('dream', 'VBD', 'dreamt')], 3)
+        rankings = FormRanking.rankForms(counts, self.engine)
+        # "be" isn't ranked since its forms depend on the person
+        self.assertEqual(rankings, {('dream', 'VBD'):('dreamt', 'dreamed')})
+
+    def testRepeatedForms(self):
+        # cleave/VBD is ('cleaved', 'clove', 'cleaved', 'cleft').  The repeat is ranked once.
+        counts = {('cleave', 'VBD', 'cleaved'):1, ('cleave', 'VBD', 'clove'):1}
+        self.assertEqual(FormRanking.rankForms(counts, self.engine), {})
+        counts[('cleave', 'VBD', 'cleft')] = 2
+        rankings = FormRanking.rankForms(counts, self.engine)
+        self.assertEqual(rankings, {('cleave', 'VBD'):('cleft', 'cleaved', 'clove')})
+        fn = os.path.join(self.tmp_dir, 'cleave.csv')
+        FormRanking.save(fn, rankings)
+        engine = Inflections(pyinflect.INFL_FN, pyinflect.OVERRIDES_FN)
+        self.assertEqual(engine.loadRankings(fn), 1)
+        self.assertEqual(engine.getInflection('cleave', 'VBD'), ('cleft', 'cleaved', 'clove'))
+        # The included file
+        self.assertEqual(engine.loadRankings(pyinflect.RANKINGS_FN), 1)
+        self.assertEqual(engine.getInflection('cleave', 'VBD'), ('cleaved', 'cleft', 'clove'))
+
+    def testLoadRankings(self):
+        rankings = FormRanking.rankForms(FormRanking.countWords([self.text_fn]), self.engine)
+        self.assertEqual(rankings[('dream', 'VBD')], ('dreamt', 'dreamed'))
+        fn = os.path.join(self.tmp_dir, 'rankings.csv')
+        FormRanking.save(fn, rankings)
+        with open(fn, 'a') as f:
+            f.write('dream,VBG,dreamings/dreaming\n')    # not the same forms so it's skipped
+        engine = Inflections(pyinflect.INFL_FN, pyinflect.OVERRIDES_FN)
+        self.assertEqual(engine.loadRankings(fn), len(rankings))
+        self.assertEqual(engine.getInflection('Dream', 'VBD'), ('Dreamt', 'Dreamed'))
+        self.assertEqual(engine.getInflection('dream', 'VBG'), ('dreaming',))
+        self.assertEqual(engine.getInflections([('dream', 'VBN')]), [('dreamt', 'dreamed')])
+        self.assertEqual(self.engine.getInflection('dream', 'VBD'), ('dreamed', 'dreamt'))
+        # The rankings are part of the pickle handle
+        handle = pickle.loads(pickle.dumps(engine)).pickle_handle
+        self.assertEqual(handle[3][-1][2], 'rankings')
+
+
+if __name__ == '__main__':
+    # run all methods that start with 'test'
+    unittest.main()
@@ -0,0 +1,125 @@
+#!/usr/bin/python3
+import sys
+sys.path.insert(0, '..')    # make '..' first in the lib search path
+import os
+import pickle
+import random
+import shutil
+import tempfile
+import unittest
+import subprocess
+import importlib.util
+import pyinflect
+from   pyinflect import Inflections, FrozenStore
+
+
+class FrozenStoreTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.mkdtemp()
+        cls.frozen_fn = os.path.join(cls.tmp_dir, 'infl_frozen.py')
+        overrides = Inflections._loadOverrides(pyinflect.OVERRIDES_FN)
+        FrozenStore.create(cls.frozen_fn, pyinflect.INFL_FN, overrides)
+        cls.csv = Inflections(pyinflect.INFL_FN, pyinflect.OVERRIDES_FN)
+        cls.frozen = Inflections(cls.frozen_fn)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmp_dir)
+
+    def testCompiled(self):
+        self.assertTrue(os.path.exists(importlib.util.cache_from_source(self.frozen_fn)))
+        self.assertIsInstance(self.frozen.infl_data, FrozenStore)
+
+    def testSameAsCSV(self):
+        self.assertEqual(len(self.frozen.infl_data), len(self.csv.infl_data))
+        self.assertEqual(sorted(self.frozen.infl_data), sorted(self.csv.infl_data))
+        # The overrides are included in the module
+        self.assertEqual(self.frozen.overrides, self.csv.overrides)
+        lemmas = random.Random(0).sample(sorted(self.csv.infl_data), 2000)
+        for lemma in lemmas + ['be', 'can', 'only', 'wit', 'methinks', 'learn']:
+            self.assertEqual(self.frozen.getAllInflections(lemma),
+                             self.csv.getAllInflections(lemma))
+        self.assertEqual(self.frozen.getInflection('Abide', 'VBD'), ('Abode', 'Abided'))
+        self.assertIsNone(self.frozen.getInflection('xqzvbn', 'VBD'))
+        self.assertNotIn('xqzvbn', self.frozen.infl_data)
+        self.assertNotIn('zzzzzz', self.frozen.infl_data)
+
+    def testOverridesFile(self):
+        fn = os.path.join(self.tmp_dir, 'overrides.csv')
+        with open(fn, 'w') as f:
+            f.write('learn,VBD,learnt\n')
+        infl = Inflections(self.frozen_fn, fn)
+        self.assertEqual(infl.overrides, {'learn':{'VBD':('learnt',)}})
+        self.assertEqual(infl.getInflection('travel', 'VBD'), ('traveled', 'travelled'))
+
+    def testPosTypes(self):
+        csv = Inflections(pyinflect.INFL_FN, pyinflect.OVERRIDES_FN, pos_types=['V'])
+        infl = Inflections(self.frozen_fn, pos_types=['V'])
+        self.assertEqual(len(infl.infl_data), len(csv.infl_data))
+        self.assertEqual(infl.overrides, csv.overrides)
+        self.assertNotIn('aardwolf', infl.infl_data)
+        self.assertEqual(infl.getAllInflections('watch'), csv.getAllInflections('watch'))
+
+    def testPickle(self):
+        # No snapshot is made for a frozen module
+        snapshot_dir = os.path.join(self.tmp_dir, 'snapshots')
+        infl = Inflections(self.frozen_fn, snapshot_dir=snapshot_dir)
+        self.assertFalse(os.path.exists(snapshot_dir))
+        self.assertIs(pickle.loads(pickle.dumps(infl)).infl_data, infl.infl_data)
+
+    def testIsCurrent(self):
+        infl_fn = os.path.join(self.tmp_dir, 'infl.csv')
+        overrides_fn = os.path.join(self.tmp_dir, 'current_overrides.csv')
+        shutil.copy(pyinflect.INFL_FN, infl_fn)
+        shutil.copy(pyinflect.OVERRIDES_FN, overrides_fn)
+        frozen_fn = os.path.join(self.tmp_dir, 'current_frozen.py')
+        FrozenStore.create(frozen_fn, infl_fn, Inflections._loadOverrides(overrides_fn),
+                           overrides_fn=overrides_fn)
+        store = FrozenStore(frozen_fn)
+        self.assertTrue(store.isCurrent(infl_fn, overrides_fn))
+        # Files that don't exist aren't checked
+        self.assertTrue(store.isCurrent(infl_fn + '.missing', None))
+        with open(overrides_fn, 'a') as f:
+            f.write('walk,VBD,walkt\n')
+        self.assertFalse(store.isCurrent(infl_fn, overrides_fn))
+        self.assertFalse(self.frozen.infl_data.isCurrent(pyinflect.INFL_FN, pyinflect.OVERRIDES_FN))
+
+    def testDefaultEngine(self):
+        # With PYINFLECT_FROZEN=1 the csv files are used, with a warning, if the module is
+        # missing or out of date, and it's an error if there are no csv files either
+        pkg_dir = os.path.join(self.tmp_dir, 'lib', 'pyinflect')
+        shutil.copytree(os.path.dirname(os.path.abspath(pyinflect.__file__)), pkg_dir,
+                        ignore=shutil.ignore_patterns('infl_frozen.py*', '*.db', '__pycache__',
+                                                      '*.json', 'infl_compact.csv'))
+        env = dict(os.environ, PYTHONPATH=os.path.dirname(pkg_dir), PYINFLECT_FROZEN='1')
+        for name in ('PYINFLECT_RANKINGS', 'PYINFLECT_SNAPSHOT_DIR', 'PYINFLECT_POS_TYPES'):
+            env.pop(name, None)
+        def run(*args):
+            return subprocess.run([sys.executable] + list(args), env=env, cwd=self.tmp_dir,
+                                  stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                  universal_newlines=True)
+        code = ('import pyinflect; engine = pyinflect.InflectionEngine(); '
+                'print(type(engine.infl_data).__name__, engine.getInflection("walk", "VBD"))')
+        out = run('-c', code)
+        self.assertEqual(out.stdout, "dict ('walked',)\n", out.stderr)
+        self.assertIn('DataBuilder --targets frozen', out.stderr)
+        self.assertEqual(run('-m', 'pyinflect.DataBuilder', '--targets', 'frozen').returncode, 0)
+        out = run('-c', code)
+        self.assertEqual(out.stdout, "FrozenStore ('walked',)\n", out.stderr)
+        self.assertEqual(out.stderr, '')
+        with open(os.path.join(pkg_dir, 'overrides.csv'), 'a') as f:
+            f.write('walk,VBD,walkt\n')
+        out = run('-c', code)
+        self.assertEqual(out.stdout, "dict ('walkt',)\n", out.stderr)
+        self.assertIn('other versions of infl.csv or overrides.csv', out.stderr)
+        os.remove(os.path.join(pkg_dir, 'infl_frozen.py'))
+        os.remove(os.path.join(pkg_dir, 'infl.csv'))
+        out = run('-c', code)
+        self.assertNotEqual(out.returncode, 0)
+        self.assertIn('DataBuilder --targets frozen', out.stderr)
+
+
+if __name__ == '__main__':
+    # run all methods that start with 'test'
+    unittest.main()
@@ -0,0 +1,46 @@
+#!/usr/bin/python3
+import sys
+sys.path.insert(0, '..')    # make '..' first in the lib search path
+import unittest
+import pyinflect
+from   pyinflect import Inflections, FuzzyIndex
+from   pyinflect.FuzzyIndex import editDistance
+
+
+class FuzzyIndexTests(unittest.TestCase):
+    def testEditDistance(self):
+        self.assertEqual(editDistance('recieve', 'receive'), 1)
+        self.assertEqual(editDistance('kitten', 'sitting'), 3)
+        self.assertEqual(editDistance('', 'abc'), 3)
+        self.assertEqual(editDistance('abc', 'abc'), 0)
+        self.assertEqual(editDistance('ca', 'abc'), 3)
+        self.assertEqual(editDistance('kitten', 'sitting', 2), 2)
+        self.assertEqual(editDistance('kitten', 'sitting', 4), 3)
+
+    def testLookup(self):
+        index = FuzzyIndex(['the', 'eth', 'tea', 'receive', 'relieve', 'government', 'cat'])
+        self.assertEqual(index.lookup('teh'), [('the', 1), ('eth', 1), ('tea', 1)])
+        self.assertEqual(index.lookup('recieve'), [('receive', 1), ('relieve', 1)])
+        self.assertEqual(index.lookup('goverment'), [('government', 1)])
+        self.assertEqual(index.lookup('cat'), [('cat', 0)])
+        self.assertEqual(index.lookup('dgo'), [])
+        index = FuzzyIndex(['government', 'cat'], max_distance=2)
+        self.assertEqual(index.lookup('govrment'), [('government', 2)])
+        self.assertEqual(index.lookup('govrment', max_distance=1), [])
+        self.assertEqual(index.lookup('cta'), [('cat', 1)])
+
+    def testEngine(self):
+        infl = Inflections(pyinflect.INFL_FN, pyinflect.OVERRIDES_FN)
+        self.assertEqual(infl.findLemma('recieve'), 'receive')
+        self.assertEqual(infl.findLemma('Walk'), 'walk')
+        self.assertEqual(infl.findLemma('xqzvbn'), None)
+        self.assertEqual(infl.getInflection('recieve', 'VBD'), None)
+        self.assertEqual(infl.getInflection('recieve', 'VBD', fuzzy=True), ('received',))
+        self.assertEqual(infl.getInflection('Beleive', 'VBZ', fuzzy=True), ('Believes',))
+        self.assertEqual(infl.getInflection('xqzvbn', 'VBD', fuzzy=True), None)
+        self.assertEqual(infl.getInflection('xqzvbn', 'VBD', True, True), ('xqzvbned', 'xqzvbnned'))
+
+
+if __name__ == '__main__':
+    # run all methods that start with 'test'
+    unittest.main()
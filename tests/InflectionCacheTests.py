@@ -0,0 +1,145 @@
+#!/usr/bin/python3
+import sys
+sys.path.insert(0, '..')    # make '..' first in the lib search path
+import os
+import shutil
+import tempfile
+import unittest
+import pyinflect
+from   pyinflect import Inflections, InflectionCache
+
+
+class InflectionCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cache_fn = os.path.join(self.tmp_dir, 'cache.sqlite')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def testStoreAndLookup(self):
+        cache = InflectionCache(self.cache_fn, 'v1', batch_size=2)
+        self.assertEqual(cache.lookup('watch', 'VBD', False), (False, None))
+        cache.store('watch', 'VBD', False, ('watched',))
+        cache.store('xxwatch', 'VBD', False, None)
+        self.assertEqual(cache.lookup('watch', 'VBD', False), (True, ('watched',)))
+        self.assertEqual(cache.lookup('watch', 'VBD', True),  (False, None))
+        self.assertEqual(cache.lookup('xxwatch', 'VBD', False), (True, None))
+        cache.close()
+        # Re-open and verify the data persisted
+        cache = InflectionCache(self.cache_fn, 'v1')
+        self.assertEqual(cache.lookup('watch', 'VBD', False), (True, ('watched',)))
+        self.assertEqual(len(cache), 2)
+        cache.close()
+
+    def testVersionInvalidation(self):
+        cache = InflectionCache(self.cache_fn, 'v1')
+        cache.store('be', 'VBD', False, ('was', 'were'))
+        cache.close()
+        cache = InflectionCache(self.cache_fn, 'v2')
+        self.assertEqual(cache.lookup('be', 'VBD', False), (False, None))
+        self.assertEqual(len(cache), 0)
+        cache.close()
+
+    def testSharedVersions(self):
+        # Entries for other versions are kept, so engines with different data can share a file
+        cache = InflectionCache(self.cache_fn, 'v1')
+        cache.store('be', 'VBD', 0, ('was', 'were'))
+        cache.setDataVersion('v2')
+        self.assertEqual(cache.lookup('be', 'VBD', 0), (False, None))
+        cache.store('be', 'VBD', 0, ('were',))
+        cache.close()
+        cache = InflectionCache(self.cache_fn, 'v1')
+        self.assertEqual(cache.lookup('be', 'VBD', 0), (True, ('was', 'were')))
+        cache.setDataVersion('v2')
+        self.assertEqual(cache.lookup('be', 'VBD', 0), (True, ('were',)))
+        self.assertEqual(len(cache), 1)
+        cache.close()
+
+    def testPurge(self):
+        cache = InflectionCache(self.cache_fn, 'v1')
+        cache.store('be', 'VBD', 0, ('was', 'were'))
+        cache.store('go', 'VBD', 0, ('went',))
+        cache.setDataVersion('v2')
+        cache.store('be', 'VBD', 0, ('were',))
+        self.assertEqual(cache.purge(), 2)
+        self.assertEqual(cache.lookup('be', 'VBD', 0), (True, ('were',)))
+        self.assertEqual(cache.conn.execute('SELECT COUNT(*) FROM entries').fetchone()[0], 1)
+        self.assertEqual(cache.conn.execute('SELECT data_version FROM versions').fetchall(),
+                         [('v2',)])
+        cache.close()
+        cache = InflectionCache(self.cache_fn, 'v1')
+        self.assertEqual(len(cache), 0)
+        cache.close()
+
+    def testEviction(self):
+        cache = InflectionCache(self.cache_fn, 'v1', max_entries=2, batch_size=1)
+        cache.store('a', 'NN', False, ('a',))
+        cache.store('b', 'NN', False, ('b',))
+        cache.lookup('a', 'NN', False)      # 'b' is now the least recently used
+        cache.store('c', 'NN', False, ('c',))
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.lookup('a', 'NN', False), (True, ('a',)))
+        self.assertEqual(cache.lookup('b', 'NN', False), (False, None))
+        self.assertEqual(cache.lookup('c', 'NN', False), (True, ('c',)))
+        cache.close()
+
+    def testClosed(self):
+        cache = InflectionCache(self.cache_fn, 'v1')
+        cache.store('watch', 'VBD', 0, ('watched',))
+        cache.close()
+        cache.close()       # closing twice is fine
+        # Lookups miss and stores are dropped, but operations on the file are an error
+        self.assertEqual(cache.lookup('watch', 'VBD', 0), (False, None))
+        cache.store('walk', 'VBD', 0, ('walked',))
+        self.assertEqual(cache.pending, {})
+        self.assertRaises(ValueError, len, cache)
+        self.assertRaises(ValueError, cache.clear)
+
+    def testEngineCache(self):
+        infl = Inflections(pyinflect.INFL_FN, pyinflect.OVERRIDES_FN)
+        infl.setCache(InflectionCache(self.cache_fn, 'v1'))
+        self.assertEqual(infl.getInflection('Watch', 'VBD'), ('Watched',))
+        self.assertEqual(infl.getInflection('xxban', 'VBG', inflect_oov=True), ('xxbaning', 'xxbanning'))
+        self.assertEqual(infl.getInflection('xxban', 'VBG'), None)
+        self.assertEqual(infl.getInflection('Watchh', 'VBD', fuzzy=True), ('Watched',))
+        # Only the lookups of lemmas that aren't in the data, with inflect_oov or fuzzy, are cached
+        self.assertEqual(infl.cache.lookup('Watch', 'VBD', 0), (False, None))
+        self.assertEqual(infl.cache.lookup('xxban', 'VBG', 1), (True, ('xxbaning', 'xxbanning')))
+        self.assertEqual(infl.cache.lookup('xxban', 'VBG', 0), (False, None))
+        self.assertEqual(infl.cache.lookup('Watchh', 'VBD', 4), (True, ('Watched',)))
+        # The rules give the RB form as a string, which isn't cached
+        self.assertEqual(infl.getInflection('xxfast', 'RB', inflect_oov=True), 'xxfast')
+        self.assertEqual(infl.cache.lookup('xxfast', 'RB', 1), (False, None))
+        # A result stored in the cache is returned for the same lookup
+        infl.cache.store('xxban', 'VBD', 1, ('xxbanned',))
+        self.assertEqual(infl.getInflection('xxban', 'VBD', inflect_oov=True), ('xxbanned',))
+        infl.cache.close()
+
+    def testEngineDataVersion(self):
+        infl = Inflections(pyinflect.INFL_FN, pyinflect.OVERRIDES_FN)
+        infl.setCache(InflectionCache(self.cache_fn, 'v1'))
+        self.assertEqual(infl.cache.data_version, infl.dataVersion())
+        oov_forms = infl.getInflection('zorble', 'VBD', inflect_oov=True)
+        self.assertEqual(infl.cache.lookup('zorble', 'VBD', 1), (True, oov_forms))
+        # A lexicon changes the version without removing the entries for the old one
+        infl.loadLexicon(['zorble,V,zorbled,<>,zorbling,zorbles'])
+        self.assertEqual(infl.cache.data_version, infl.dataVersion())
+        self.assertEqual(infl.cache.lookup('zorble', 'VBD', 1), (False, None))
+        self.assertEqual(infl.getInflection('zorble', 'VBD', inflect_oov=True), ('zorbled',))
+        infl.cache.close()
+        # A later run without the lexicon gets the entries from the first run, but not one with
+        # other pos_types
+        infl = Inflections(pyinflect.INFL_FN, pyinflect.OVERRIDES_FN)
+        infl.setCache(InflectionCache(self.cache_fn, 'v1'))
+        self.assertEqual(len(infl.cache), 1)
+        self.assertEqual(infl.cache.lookup('zorble', 'VBD', 1), (True, oov_forms))
+        infl.cache.close()
+        infl = Inflections(pyinflect.INFL_FN, pyinflect.OVERRIDES_FN, pos_types=['A'])
+        infl.setCache(InflectionCache(self.cache_fn, 'v1'))
+        self.assertEqual(infl.cache.lookup('zorble', 'VBD', 1), (False, None))
+        infl.cache.close()
+
+if __name__ == '__main__':
+    # run all methods that start with 'test'
+    unittest.main()
@@ -0,0 +1,117 @@
+#!/usr/bin/python3
+import sys
+sys.path.insert(0, '..')    # make '..' first in the lib search path
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+import pyinflect
+from   pyinflect import Inflections, FuzzyIndex
+
+
+class LexiconTests(unittest.TestCase):
+    lines = ['# medical terms',
+             'Blorf,V,blorfed,<>,blorfing,blorfs',
+             'blorf,N,blorfs',
+             'glorpus,N,glorpi/glorpuses',
+             'walk,V,walkt,walkt,walking,walks',
+             '',
+             'snazzly,A,snazzlier,snazzliest']
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.engine = Inflections(pyinflect.INFL_FN, pyinflect.OVERRIDES_FN)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def writeLexicon(self, lines):
+        fn = os.path.join(self.tmp_dir, 'lexicon.csv')
+        with open(fn, 'w') as f:
+            f.write('\n'.join(lines) + '\n')
+        return fn
+
+    def testLoadFile(self):
+        engine = self.engine
+        self.assertEqual(engine.getInflection('blorf', 'VBD'), None)
+        self.assertEqual(engine.loadLexicon(self.writeLexicon(self.lines)), 4)
+        self.assertEqual(engine.getInflection('Blorf', 'VBD'), ('Blorfed',))
+        self.assertEqual(engine.getInflection('blorf', 'VBN'), ('blorfed',))
+        self.assertEqual(engine.getInflection('blorf', 'NNS'), ('blorfs',))
+        self.assertEqual(engine.getInflection('glorpus', 'NNS'), ('glorpi', 'glorpuses'))
+        self.assertEqual(engine.getInflection('walk', 'VBD'), ('walkt',))
+        self.assertEqual(engine.getInflection('snazzly', 'JJS'), ('snazzliest',))
+        self.assertTrue(engine.isKnownLemma('blorf'))
+        # The default engine isn't changed
+        self.assertEqual(pyinflect.getInflection('walk', 'VBD'), ('walked',))
+
+    def testLowPriority(self):
+        engine = self.engine
+        self.assertEqual(engine.loadLexicon(self.lines, priority='low'), 3)
+        self.assertEqual(engine.getInflection('walk', 'VBD'), ('walked',))
+        self.assertEqual(engine.getInflection('blorf', 'VBD'), ('blorfed',))
+        # travel is in the overrides
+        engine.loadLexicon(['travel,V,traveled,<>,traveling,travels'], 'low')
+        self.assertEqual(engine.getInflection('travel', 'VBD'), ('travelled',))
+        self.assertEqual(engine.loadLexicon(['travel,V,traveled,<>,traveling,travels']), 1)
+        self.assertEqual(engine.getInflection('travel', 'VBD'), ('traveled',))
+
+    def testFields(self):
+        engine = self.engine
+        engine.loadLexicon([('Blorf', 'V', 'blorfed', '<>', 'blorfing', 'blorfs')])
+        self.assertEqual(engine.getInflection('blorf', 'VBG'), ('blorfing',))
+        self.assertRaises(ValueError, engine.loadLexicon, ['blorf,V,blorfed'])
+        self.assertRaises(ValueError, engine.loadLexicon, ['blorf,X,blorfed'])
+        self.assertRaises(ValueError, engine.loadLexicon, ['blorf,N,blorfs'], 'medium')
+
+    def testIndices(self):
+        engine = self.engine
+        engine.setFuzzyIndex(FuzzyIndex(set(engine.infl_data) | set(engine.overrides)))
+        self.assertFalse(engine.isKnownForm('blorfed'))
+        self.assertEqual(list(engine.iterPrefix('blorf')), [])
+        self.assertEqual(engine.findLemma('blorft'), None)
+        engine.loadLexicon(self.lines, 'low')
+        self.assertIsNotNone(engine.known_forms)
+        self.assertIsNotNone(engine.prefix_index)
+        self.assertTrue(engine.isKnownForm('blorfed'))
+        self.assertEqual([lemma for lemma, _ in engine.iterPrefix('blorf')], ['blorf'])
+        self.assertEqual([l for l, _ in engine.iterPrefix('blorfed', forms=True)], ['blorf'])
+        self.assertEqual(engine.findLemma('blorft'), 'blorf')
+        # The indices are the same as when they're created
+        engine.loadLexicon(self.lines)
+        known_forms, prefix_index = engine.known_forms, engine.prefix_index
+        engine.known_forms, engine.prefix_index = None, None
+        self.assertTrue(engine.isKnownForm('walkt'))
+        self.assertEqual(engine.known_forms, known_forms)
+        list(engine.iterPrefix('walk'))     # re-create the prefix index
+        self.assertEqual(prefix_index.forms, engine.prefix_index.forms)
+        self.assertEqual(prefix_index.form_lemmas, engine.prefix_index.form_lemmas)
+        self.assertEqual(prefix_index.lemmas, engine.prefix_index.lemmas)
+
+    def testOverlay(self):
+        engine = self.engine
+        overlay = engine.createOverlay(pyinflect.OVERRIDES_FN)
+        overlay.loadLexicon(self.lines)
+        self.assertEqual(overlay.getInflection('walk', 'VBD'), ('walkt',))
+        self.assertEqual(engine.getInflection('walk', 'VBD'), ('walked',))
+        self.assertEqual(engine.getInflection('blorf', 'VBD'), None)
+
+    def testPickle(self):
+        engine = self.engine
+        engine.loadLexicon(self.writeLexicon(self.lines))
+        data = pickle.dumps(engine)
+        self.assertLess(len(data), 2000)
+        engine.overlay_fns = ()     # so the unpickled instance isn't reused
+        engine.pickle_handle = None
+        new = pickle.loads(data)
+        self.assertIsNot(new, engine)
+        self.assertEqual(new.getInflection('blorf', 'VBD'), ('blorfed',))
+        self.assertEqual(new.getInflection('walk', 'VBD'), ('walkt',))
+        engine.loadLexicon(self.lines)
+        self.assertRaises(pickle.PicklingError, pickle.dumps, engine)
+
+
+if __name__ == '__main__':
+    # run all methods that start with 'test'
+    unittest.main()
@@ -0,0 +1,64 @@
+#!/usr/bin/python3
+import sys
+sys.path.insert(0, '..')    # make '..' first in the lib search path
+import os
+import shutil
+import tempfile
+import unittest
+import pyinflect
+from   pyinflect import Inflections, OOVModel
+
+
+class OOVModelTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.model = OOVModel(pyinflect.OOV_MODEL_FN)
+
+    def testPredict(self):
+        self.assertEqual(self.model.predict('xxblog', 'V'), 'D')
+        self.assertEqual(self.model.predict('xxwalk', 'V'), 'R')
+        self.assertEqual(self.model.predict('xxcactus', 'N')[0], 'G')
+        self.assertEqual(self.model.predict('xxdog', 'N'), 'R')
+        self.assertEqual(self.model.predict('Xxblog', 'V'), 'D')
+        self.assertEqual(self.model.predict('xxblog', 'X'), 'R')
+
+    def testTrainSave(self):
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            infl_fn = os.path.join(tmp_dir, 'infl.csv')
+            with open(infl_fn, 'w') as f:
+                f.write('ban,V,banned,<>,banning,bans\n')
+                f.write('plan,V,planned,<>,planning,plans\n')
+                f.write('scan,V,scanned,<>,scanning,scans\n')
+                f.write('lean,V,leaned,<>,leaning,leans\n')
+                f.write('walk,V,walked,<>,walking,walks\n')
+                f.write('go,V,went,gone,going,goes\n')
+            model = OOVModel.train(infl_fn, min_count=1)
+            self.assertEqual(model.suffixes['V'], {'':'D', 'k':'R', 'ean':'R'})
+            model_fn = os.path.join(tmp_dir, 'oov_model.csv')
+            model.save(model_fn)
+            loaded = OOVModel(model_fn)
+            self.assertEqual(loaded.suffixes, model.suffixes)
+            self.assertEqual(loaded.predict('xxcan', 'V'), 'D')
+            self.assertEqual(loaded.predict('xxmean', 'V'), 'R')
+            self.assertRaises(ValueError, OOVModel, infl_fn)
+        finally:
+            shutil.rmtree(tmp_dir)
+
+    def testEngineOrder(self):
+        infl = Inflections(pyinflect.INFL_FN)
+        self.assertEqual(infl.getInflection('xxblog', 'VBD', inflect_oov=True),
+                         ('xxbloged', 'xxblogged'))
+        infl.setOOVModel(self.model)
+        self.assertEqual(infl.getInflection('Xxblog', 'VBD', inflect_oov=True),
+                         ('Xxblogged', 'Xxbloged'))
+        self.assertEqual(infl.getInflection('xxwalk', 'VBD', inflect_oov=True),
+                         ('xxwalked', 'xxwalkked'))
+        self.assertEqual(infl.getAllInflectionsOOV('xxcactus', 'N')['NNS'][0], 'xxcacti')
+        # Known lemmas aren't changed
+        self.assertEqual(infl.getInflection('walk', 'VBD', inflect_oov=True), ('walked',))
+
+
+if __name__ == '__main__':
+    # run all methods that start with 'test'
+    unittest.main()
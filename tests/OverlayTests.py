@@ -0,0 +1,74 @@
+#!/usr/bin/python3
+import sys
+sys.path.insert(0, '..')    # make '..' first in the lib search path
+import os
+import shutil
+import tempfile
+import unittest
+import pyinflect
+from   pyinflect import Inflections
+from   pyinflect.OverlayOverrides import OverlayOverrides
+
+
+class OverlayTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.mkdtemp()
+        cls.overrides_fn = os.path.join(cls.tmp_dir, 'british.csv')
+        with open(cls.overrides_fn, 'w') as f:
+            f.write('learn,VBD,learnt\n')
+            f.write('learn,VBN,learnt\n')
+            f.write('awake,VBD,awoke\n')
+            f.write('xxwidget,NNS,xxwidgeten\n')
+        cls.base = Inflections(pyinflect.INFL_FN, pyinflect.OVERRIDES_FN)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmp_dir)
+
+    def testOverlay(self):
+        overlay = self.base.createOverlay(self.overrides_fn)
+        self.assertTrue(overlay.infl_data is self.base.infl_data)
+        self.assertEqual(overlay.getInflection('Learn', 'VBD'), ('Learnt',))
+        self.assertEqual(overlay.getInflection('learn', 'VBN'), ('learnt',))
+        self.assertEqual(overlay.getInflection('learn', 'VBG'), ('learning',))
+        self.assertEqual(overlay.getInflection('xxwidget', 'NNS'), ('xxwidgeten',))
+        # Base overrides are inherited and merged with the overlay's for the same lemma
+        self.assertEqual(overlay.getInflection('awake', 'VBN'), ('awaked',))
+        self.assertEqual(overlay.getInflection('awake', 'VBD'), ('awoke',))
+        # The base instance is unchanged
+        self.assertEqual(self.base.getInflection('learn', 'VBD'), ('learned', 'learnt'))
+        self.assertEqual(self.base.getInflection('xxwidget', 'NNS'), None)
+        self.assertEqual(self.base.getInflection('awake', 'VBD'), ('awoke', 'awaked'))
+
+    def testSharedOverrides(self):
+        # The overlay's overrides are in front of the base's, which aren't copied
+        base = Inflections(pyinflect.INFL_FN, pyinflect.OVERRIDES_FN)
+        base.loadLexicon(['xxgadget,N,xxgadgets', 'walk,V,walkt,<>,walking,walks'])
+        overlay = base.createOverlay(self.overrides_fn)
+        self.assertIsInstance(overlay.overrides, OverlayOverrides)
+        self.assertIs(overlay.overrides.parent, base.overrides)
+        self.assertEqual(len(overlay.overrides.own), 3)
+        self.assertEqual(overlay.getInflection('xxgadget', 'NNS'), ('xxgadgets',))
+        self.assertEqual(overlay.getInflection('walk', 'VBD'), ('walkt',))
+        self.assertEqual(overlay.getInflection('learn', 'VBD'), ('learnt',))
+        self.assertTrue(overlay.isKnownLemma('xxwidget') and overlay.isKnownLemma('xxgadget'))
+        self.assertEqual(len(overlay.overrides), len(base.overrides) + 2)
+        self.assertEqual(set(overlay.overrides), set(base.overrides) | {'learn', 'xxwidget'})
+        # An overlay of an overlay, and a lexicon loaded into an overlay
+        overlay2 = overlay.createOverlay(self.overrides_fn)
+        self.assertEqual(overlay2.getInflection('walk', 'VBD'), ('walkt',))
+        overlay2.loadLexicon(['xxsprocket,N,xxsprockets'])
+        self.assertEqual(overlay2.getInflection('xxsprocket', 'NNS'), ('xxsprockets',))
+        self.assertEqual(overlay2.getInflection('xxwidget', 'NNS'), ('xxwidgeten',))
+        self.assertEqual(overlay.getInflection('xxsprocket', 'NNS'), None)
+
+    def testNoInherit(self):
+        overlay = self.base.createOverlay(self.overrides_fn, inherit_overrides=False)
+        self.assertEqual(overlay.getInflection('awake', 'VBN'), ('awoken', 'awaked', 'awoke'))
+        self.assertEqual(overlay.getInflection('learn', 'VBD'), ('learnt',))
+
+
+if __name__ == '__main__':
+    # run all methods that start with 'test'
+    unittest.main()
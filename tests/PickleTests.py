@@ -0,0 +1,92 @@
+#!/usr/bin/python3
+import sys
+sys.path.insert(0, '..')    # make '..' first in the lib search path
+import os
+import pickle
+import shutil
+import tempfile
+import subprocess
+import unittest
+import pyinflect
+from   pyinflect import Inflections
+
+
+class PickleTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    # Unpickle in a new python process, with the user cache directory in tmp_dir
+    def unpickleInWorker(self, data, buffers=None):
+        data_fn = os.path.join(self.tmp_dir, 'engine.pkl')
+        with open(data_fn, 'wb') as f:
+            pickle.dump((data, buffers), f)
+        code = ('import sys, pickle; sys.path.insert(0, %r); import pyinflect\n'
+                'data, buffers = pickle.load(open(%r, "rb"))\n'
+                'engine = pickle.loads(data, buffers=buffers)\n'
+                'print(engine.getInflection("learn", "VBD"), engine is pyinflect.InflectionEngine())'
+                % (os.path.dirname(os.path.dirname(os.path.abspath(pyinflect.__file__))), data_fn))
+        env = dict(os.environ, XDG_CACHE_HOME=self.tmp_dir)
+        env.pop('PYINFLECT_POS_TYPES', None)
+        out = subprocess.run([sys.executable, '-c', code], env=env, stdout=subprocess.PIPE,
+                             stderr=subprocess.PIPE, universal_newlines=True)
+        return out.returncode, out.stdout.strip(), out.stderr
+
+    def testHandle(self):
+        engine = pyinflect.InflectionEngine()
+        data = pickle.dumps(engine)
+        self.assertLess(len(data), 1000)
+        # An existing instance loaded from the same data is reused
+        num_instances = len(Inflections.instances)
+        self.assertEqual(pickle.loads(data).pickle_handle, engine.pickle_handle)
+        self.assertEqual(len(Inflections.instances), num_instances)
+        # A worker that imported pyinflect reuses its default instance
+        returncode, out, _ = self.unpickleInWorker(data)
+        self.assertEqual(returncode, 0)
+        self.assertEqual(out, "('learned', 'learnt') True")
+
+    def testOverlay(self):
+        overrides_fn = os.path.join(self.tmp_dir, 'british.csv')
+        with open(overrides_fn, 'w') as f:
+            f.write('learn,VBD,learnt\n')
+        overlay = pyinflect.InflectionEngine().createOverlay(overrides_fn)
+        data = pickle.dumps(overlay)
+        self.assertTrue(pickle.loads(data) is overlay)
+        returncode, out, _ = self.unpickleInWorker(data)
+        self.assertEqual(out, "('learnt',) False")
+
+    def testOOVModel(self):
+        engine = Inflections(pyinflect.INFL_FN, pyinflect.OVERRIDES_FN)
+        engine.setOOVModel(pyinflect.OOVModel(pyinflect.OOV_MODEL_FN))
+        restored = pickle.loads(pickle.dumps(engine))
+        self.assertEqual(restored.getInflection('xxblog', 'VBD', True), ('xxblogged', 'xxbloged'))
+        engine.setOOVModel(pyinflect.OOVModel())
+        self.assertRaises(pickle.PicklingError, pickle.dumps, engine)
+
+    def testMissingFiles(self):
+        infl_fn = os.path.join(self.tmp_dir, 'infl.csv')
+        shutil.copy(pyinflect.INFL_FN, infl_fn)
+        engine = Inflections(infl_fn, pos_types={'V'})
+        handle_data = pickle.dumps(engine)
+        engine.setPickleData(True)
+        buffers = []
+        data = pickle.dumps(engine, protocol=5, buffer_callback=buffers.append)
+        self.assertLess(len(data), 1000)
+        self.assertEqual(len(buffers), 1)
+        buffers = [bytes(b.raw()) for b in buffers]
+        os.remove(infl_fn)
+        returncode, _, err = self.unpickleInWorker(handle_data)
+        self.assertNotEqual(returncode, 0)
+        self.assertIn('not available', err)
+        returncode, out, err = self.unpickleInWorker(data, buffers)
+        self.assertEqual(out, "('learned', 'learnt') False")
+        # The data was written to the worker's cache directory
+        self.assertTrue(any(fn.startswith('data-') for fn in
+                            os.listdir(os.path.join(self.tmp_dir, 'pyinflect'))))
+
+
+if __name__ == '__main__':
+    # run all methods that start with 'test'
+    unittest.main()
@@ -0,0 +1,49 @@
+#!/usr/bin/python3
+import sys
+sys.path.insert(0, '..')    # make '..' first in the lib search path
+import os
+import shutil
+import tempfile
+import unittest
+import pyinflect
+from   pyinflect import Inflections, SQLiteStore, CompactStore
+
+
+class PosTypesTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.mkdtemp()
+        cls.db_fn = os.path.join(cls.tmp_dir, 'infl.db')
+        cls.compact_fn = os.path.join(cls.tmp_dir, 'infl_compact.csv')
+        SQLiteStore.create(cls.db_fn, pyinflect.INFL_FN)
+        CompactStore.create(cls.compact_fn, pyinflect.INFL_FN)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmp_dir)
+
+    def testVerbsOnly(self):
+        for fn in [pyinflect.INFL_FN, self.db_fn, self.compact_fn]:
+            infl = Inflections(fn, pyinflect.OVERRIDES_FN, pos_types={'V'})
+            self.assertEqual(infl.getAllInflections('watch'), pyinflect.getAllInflections('watch', 'V'))
+            self.assertEqual(infl.getInflection('watch', 'NNS'), None)
+            self.assertEqual(infl.getInflection('aardwolf', 'NNS'), None)
+            self.assertFalse('aardwolf' in infl.infl_data)
+            self.assertEqual(infl.getInflection('awake', 'VBN'), ('awaked',))    # override
+            self.assertEqual(infl.getInflection('be', 'VBD'), ('was', 'were'))
+        self.assertEqual(Inflections(self.db_fn, pos_types={'V'}).infl_data.hasForm('aardwolves'), False)
+
+    def testNounsOnly(self):
+        infl = Inflections(pyinflect.INFL_FN, pyinflect.OVERRIDES_FN, pos_types=['N'])
+        self.assertEqual(infl.getInflection('aardwolf', 'NNS'), ('aardwolves',))
+        self.assertEqual(infl.getInflection('axis', 'NNS'), ('axes',))   # override
+        self.assertEqual(infl.getInflection('awake', 'VBN'), None)
+        self.assertFalse([l for l, tags in infl.overrides.items() if any(t[0] != 'N' for t in tags)])
+
+    def testInvalid(self):
+        self.assertRaises(ValueError, Inflections, pyinflect.INFL_FN, None, None, {'X'})
+
+
+if __name__ == '__main__':
+    # run all methods that start with 'test'
+    unittest.main()
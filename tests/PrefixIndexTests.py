@@ -0,0 +1,46 @@
+#!/usr/bin/python3
+import sys
+sys.path.insert(0, '..')    # make '..' first in the lib search path
+import unittest
+from   itertools import islice
+import pyinflect
+from   pyinflect.PrefixIndex import PrefixIndex
+
+
+class PrefixIndexTests(unittest.TestCase):
+    def testLemmaPrefix(self):
+        lemmas = [lemma for lemma, _ in pyinflect.iterPrefix('watc')]
+        self.assertEqual(lemmas[:3], ['watch', 'watchability', 'watchable'])
+        self.assertTrue(all(l.startswith('watc') for l in lemmas))
+        self.assertEqual(list(pyinflect.iterPrefix('xxwatc')), [])
+
+    def testPosType(self):
+        lemma, infls = next(pyinflect.iterPrefix('Watch', pos_type='V'))
+        self.assertEqual(lemma, 'watch')
+        self.assertEqual(infls, pyinflect.getAllInflections('watch', 'V'))
+        for lemma, infls in islice(pyinflect.iterPrefix('w', pos_type='A'), 100):
+            self.assertTrue(infls)
+            self.assertTrue(all(tag[0] in 'JR' for tag in infls))
+
+    def testFormPrefix(self):
+        lemmas = [lemma for lemma, _ in pyinflect.iterPrefix('ate', forms=True)]
+        self.assertEqual(lemmas[:2], ['ate', 'eat'])
+        self.assertEqual(len(lemmas), len(set(lemmas)))
+
+    def testMerge(self):
+        data = {'walk':{'VBD':('walked',)}, 'eat':{'VBD':('ate',)}}
+        index = PrefixIndex(data)
+        merged = index.merge(['zorble', 'eat', 'blorf'], [('ate', 'eat'), ('ate', 'at'),
+                             ('zorbled', 'zorble'), ('blorfed', 'blorf'), ('ate', 'eat')])
+        data.update({'zorble':{'VBD':('zorbled',)}, 'blorf':{'VBD':('blorfed',)},
+                     'at':{'VBD':('ate',)}})
+        expected = PrefixIndex(data)
+        self.assertEqual(merged.lemmas, ['blorf', 'eat', 'walk', 'zorble'])
+        self.assertEqual(merged.forms, expected.forms)
+        self.assertEqual(merged.form_lemmas, expected.form_lemmas)
+        self.assertEqual(index.forms, ['ate', 'walked'])   # unchanged
+
+
+if __name__ == '__main__':
+    # run all methods that start with 'test'
+    unittest.main()
@@ -0,0 +1,64 @@
+#!/usr/bin/python3
+import sys
+sys.path.insert(0, '..')    # make '..' first in the lib search path
+import unittest
+import pyinflect
+try:
+    import spacy
+except ImportError:
+    spacy = None
+
+
+class ReinflectTests(unittest.TestCase):
+    tokens = [('The', 'the', 'DT'), ('Geese', 'goose', 'NNS'), ('WALKED', 'walk', 'VBD'),
+              ('to', 'to', 'IN'), ('the', 'the', 'DT'), ('pond', 'pond', 'NN'),
+              ('.', '.', '.')]
+
+    def testTags(self):
+        self.assertEqual(pyinflect.reinflect(self.tokens, {'VBD':'VBZ'}),
+                         'The Geese WALKS to the pond .')
+        self.assertEqual(pyinflect.reinflect(self.tokens, {'NNS':'NN', 'NN':'NNS'}),
+                         'The Goose WALKED to the ponds .')
+        self.assertEqual(pyinflect.reinflect(self.tokens, {}), 'The Geese WALKED to the pond .')
+
+    def testIterable(self):
+        self.assertEqual(pyinflect.reinflect(iter(self.tokens), {'VBD':'VBZ'}),
+                         'The Geese WALKS to the pond .')
+        self.assertEqual(pyinflect.reinflect((list(t) for t in self.tokens), {5:'NNS'}),
+                         'The Geese WALKED to the ponds .')
+        self.assertEqual(pyinflect.reinflect(iter([]), {'VBD':'VBZ'}), '')
+
+    def testIndices(self):
+        self.assertEqual(pyinflect.reinflect(self.tokens, {2:'VBG', 'VBD':'VBZ', 5:'NNS'}),
+                         'The Geese WALKING to the ponds .')
+        # Words that can't be inflected are unchanged
+        self.assertEqual(pyinflect.reinflect(self.tokens, {0:'VBZ', 3:'NNS'}),
+                         'The Geese WALKED to the pond .')
+
+    def testWhitespace(self):
+        tokens = [('I', '-PRON-', 'PRP', ' '), ('was', 'be', 'VBD', ''), ("n't", 'not', 'RB', ' '),
+                  ('sitting', 'sit', 'VBG', ''), ('.', '.', '.', '\n')]
+        self.assertEqual(pyinflect.reinflect(tokens, {'VBG':'VBN', 1:'VBZ'}), "I isn't sat.\n")
+        self.assertEqual(pyinflect.reinflect(tokens, {1:'VBD'}, form_num=1), "I weren't sitting.\n")
+
+    def testOOV(self):
+        tokens = [('They', 'they', 'PRP'), ('xqzvbn', 'xqzvbn', 'VBP')]
+        self.assertEqual(pyinflect.reinflect(tokens, {'VBP':'VBD'}), 'They xqzvbn')
+        self.assertEqual(pyinflect.reinflect(tokens, {'VBP':'VBD'}, inflect_oov=True),
+                         'They xqzvbned')
+
+    @unittest.skipIf(spacy is None, 'spaCy is not installed')
+    def testDoc(self):
+        nlp = spacy.load('en_core_web_sm')
+        doc = nlp('The Geese WALKED to the pond.  They swam.')
+        self.assertEqual(doc._.reinflect({'VBD':'VBZ'}),
+                         'The Geese WALKS to the pond.  They swims.')
+        self.assertEqual(doc[:3]._.reinflect({'NNS':'NN'}), 'The Goose WALKED ')
+        expected = ''.join((t._.inflect('VBG') if t.tag_ == 'VBD' else t.text) + t.whitespace_
+                           for t in doc)
+        self.assertEqual(pyinflect.reinflect(doc, {'VBD':'VBG'}), expected)
+
+
+if __name__ == '__main__':
+    # run all methods that start with 'test'
+    unittest.main()
@@ -0,0 +1,63 @@
+#!/usr/bin/python3
+import sys
+sys.path.insert(0, '..')    # make '..' first in the lib search path
+import os
+import shutil
+import tempfile
+import unittest
+import pyinflect
+from   pyinflect import Inflections, SQLiteStore
+
+
+class SQLiteStoreTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.mkdtemp()
+        cls.db_fn = os.path.join(cls.tmp_dir, 'infl.db')
+        cls.store = SQLiteStore.create(cls.db_fn, pyinflect.INFL_FN, pyinflect.OVERRIDES_FN)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmp_dir)
+
+    def testSameAsDict(self):
+        infl_data = pyinflect.INFLECTION_INST.infl_data
+        self.assertEqual(len(self.store), len(infl_data))
+        for lemma in ['watch', 'be', 'awake', 'squirrel', 'only', 'can', 'aardwolf']:
+            self.assertEqual(self.store[lemma], infl_data[lemma])
+        self.assertEqual(self.store.get('xxwatch', {}), {})
+        self.assertTrue('watch' in self.store)
+        self.assertFalse('xxwatch' in self.store)
+        self.assertTrue(self.store.hasForm('watched'))
+        self.assertFalse(self.store.hasForm('xxwatched'))
+
+    def testEngine(self):
+        infl = Inflections(self.db_fn, pyinflect.OVERRIDES_FN)
+        self.assertEqual(infl.getAllInflections('Watch', 'V'),
+            {'VB': ('Watch',), 'VBP': ('Watch',), 'VBD': ('Watched',), 'VBN': ('Watched',),
+             'VBG': ('Watching',), 'VBZ': ('Watches',)})
+        self.assertEqual(infl.getInflection('awake', 'VBN'), ('awaked',))   # from overrides
+        self.assertEqual(infl.getInflection('xxban', 'VBG'), None)
+        self.assertEqual(infl.getInflection('xxban', 'VBG', inflect_oov=True), ('xxbaning', 'xxbanning'))
+
+    def testDatabaseOverrides(self):
+        # Without an overrides file, the overrides stored in the database are used
+        csv_infl = Inflections(pyinflect.INFL_FN, pyinflect.OVERRIDES_FN)
+        infl = Inflections(self.db_fn)
+        self.assertEqual(infl.overrides, csv_infl.overrides)
+        self.assertEqual(infl.getInflection('awake', 'VBN'), ('awaked',))
+        self.assertEqual(infl.getInflection('cleave', 'VBD'), csv_infl.getInflection('cleave', 'VBD'))
+        infl = Inflections(self.db_fn, pos_types=['A'])
+        self.assertEqual(infl.getInflection('awake', 'VBN'), None)
+
+    def testQuery(self):
+        rows = self.store.query("SELECT form FROM inflections WHERE lemma='eat' AND tag=? "
+                                "AND regular=0", ('VBN',))
+        self.assertEqual(rows, [('eaten',)])
+        rows = self.store.query("SELECT form FROM overrides WHERE lemma='awake'")
+        self.assertEqual(rows, [('awaked',)])
+
+
+if __name__ == '__main__':
+    # run all methods that start with 'test'
+    unittest.main()
@@ -0,0 +1,144 @@
+#!/usr/bin/python3
+import sys
+sys.path.insert(0, '..')    # make '..' first in the lib search path
+import os
+import shutil
+import tempfile
+import threading
+import subprocess
+import unittest
+import http.client
+import pyinflect
+from   pyinflect import Server
+from   pyinflect.Client import Client
+
+
+class ServerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.mkdtemp()
+        cls.server = Server.makeServer(port=0)
+        cls.unix_fn = os.path.join(cls.tmp_dir, 'pyinflect.sock')
+        cls.unix_server = Server.makeServer(unix_socket=cls.unix_fn, max_batch=5)
+        for server in (cls.server, cls.unix_server):
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+        cls.client = Client('http://127.0.0.1:%d' % cls.server.server_address[1])
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.client.close()
+        for server in (cls.server, cls.unix_server):
+            server.shutdown()
+            server.server_close()
+        shutil.rmtree(cls.tmp_dir)
+
+    def testGetInflections(self):
+        requests = [('walk', 'VBD'), ('Be', 'VBD'), ('walk', 'VBD'), ('xqzvbn', 'VBD'),
+                    ('walk', 'XX')]
+        expected = [('walked',), ('Was', 'Were'), ('walked',), None, None]
+        self.assertEqual(pyinflect.getInflections(requests), expected)
+        self.assertEqual(self.client.getInflections(requests), expected)
+        self.assertEqual(self.client.getInflections(requests, inflect_oov=True)[3],
+                         ('xqzvbned', 'xqzvbnned'))
+        self.assertEqual(self.client.getInflections([('recieve', 'VBD')], fuzzy=True),
+                         [('received',)])
+        self.assertEqual(self.client.getInflections([]), [])
+
+    def testGet(self):
+        self.assertEqual(self.client.request('GET', '/inflect?lemma=Walk&tag=VBZ'),
+                         {'result':['Walks']})
+        self.assertEqual(self.client.request('GET', '/inflect?lemma=recieve&tag=VBD'),
+                         {'result':None})
+        self.assertEqual(self.client.request('GET', '/inflect?lemma=recieve&tag=VBD&fuzzy=1'),
+                         {'result':['received']})
+        self.assertEqual(self.client.health()['version'], pyinflect.__version__)
+
+    def testErrors(self):
+        self.assertRaises(IOError, self.client.request, 'GET', '/inflect?lemma=walk')
+        self.assertRaises(IOError, self.client.request, 'GET', '/missing')
+        self.assertRaises(IOError, self.client.request, 'POST', '/inflect', {'requests':[1]})
+        self.assertRaises(IOError, self.client.request, 'POST', '/missing', {})
+        # Lemmas and tags must be non-empty strings
+        self.assertRaises(IOError, self.client.getInflections, [(1, 'VBD')])
+        self.assertRaises(IOError, self.client.getInflections, [('flurb', '')], True)
+        self.assertRaises(IOError, self.client.getInflections, [('walk', None)])
+        # The connection is still usable
+        self.assertEqual(self.client.getInflections([('walk', 'VBG')]), [('walking',)])
+
+    def testContentLength(self):
+        # A bad Content-Length gets a 400 on any path and the connection is closed
+        for path in ('/inflect', '/missing'):
+            for length in ('abc', '-5'):
+                conn = http.client.HTTPConnection('127.0.0.1', self.server.server_address[1],
+                                                  timeout=10)
+                try:
+                    conn.putrequest('POST', path)
+                    conn.putheader('Content-Length', length)
+                    conn.endheaders()
+                    response = conn.getresponse()
+                    self.assertEqual(response.status, 400)
+                    self.assertIn('Content-Length', response.read().decode('utf-8'))
+                    self.assertTrue(response.will_close)
+                finally:
+                    conn.close()
+        self.assertEqual(self.client.getInflections([('walk', 'VBG')]), [('walking',)])
+
+    def testEngineErrors(self):
+        class BrokenEngine(object):
+            def getInflection(self, *args):
+                raise RuntimeError('broken')
+            getInflections = getInflection
+        server = Server.makeServer(BrokenEngine(), port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        client = Client('http://127.0.0.1:%d' % server.server_address[1])
+        try:
+            with self.assertRaises(IOError) as cm:
+                client.getInflections([('walk', 'VBD')])
+            self.assertIn('500', str(cm.exception))
+            self.assertRaises(IOError, client.request, 'GET', '/inflect?lemma=walk&tag=VBD')
+            self.assertEqual(client.health()['status'], 'ok')
+        finally:
+            client.close()
+            server.shutdown()
+            server.server_close()
+
+    def testClientImport(self):
+        # Importing the client doesn't load the inflection data
+        code = ('import sys; sys.path.insert(0, %r); import pyinflect.Client, pyinflect\n'
+                'print(pyinflect._engine is None, len(pyinflect.Inflections.instances))'
+                % os.path.dirname(os.path.dirname(os.path.abspath(pyinflect.__file__))))
+        out = subprocess.run([sys.executable, '-c', code], stdout=subprocess.PIPE,
+                             universal_newlines=True)
+        self.assertEqual(out.stdout.strip(), 'True 0')
+
+    def testUnixSocket(self):
+        client = Client('unix:' + self.unix_fn, max_batch=5)
+        requests = [('walk', 'VBD')] * 12
+        self.assertEqual(client.getInflections(requests), [('walked',)] * 12)
+        client.close()
+        client = Client(self.unix_fn, max_batch=10)
+        self.assertRaises(IOError, client.getInflections, requests)
+        client.close()
+
+    def testCoalesce(self):
+        client = Client('http://127.0.0.1:%d' % self.server.server_address[1],
+                        coalesce_delay=0.05)
+        lemmas = ['walk', 'run', 'be', 'sit', 'swim', 'eat', 'xqzvbn', 'see']
+        results = {}
+        def worker(lemma):
+            results[lemma] = client.getInflection(lemma, 'VBD')
+        threads = [threading.Thread(target=worker, args=(lemma,)) for lemma in lemmas]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for lemma in lemmas:
+            self.assertEqual(results[lemma], pyinflect.getInflection(lemma, 'VBD'))
+        self.assertEqual(client.getInflection('xqzvbn', 'VBD', inflect_oov=True),
+                         ('xqzvbned', 'xqzvbnned'))
+        client.close()
+
+
+if __name__ == '__main__':
+    # run all methods that start with 'test'
+    unittest.main()
@@ -0,0 +1,77 @@
+#!/usr/bin/python3
+import sys
+sys.path.insert(0, '..')    # make '..' first in the lib search path
+import os
+import glob
+import shutil
+import tempfile
+import unittest
+import pyinflect
+from   pyinflect import Inflections
+from   pyinflect import Snapshot
+
+
+class SnapshotTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.snapshot_dir = os.path.join(self.tmp_dir, 'snapshots')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def getSnapshots(self):
+        return glob.glob(os.path.join(self.snapshot_dir, 'snapshot-*'))
+
+    def testSnapshot(self):
+        infl = Inflections(pyinflect.INFL_FN, pyinflect.OVERRIDES_FN, self.snapshot_dir)
+        self.assertEqual(len(self.getSnapshots()), 1)
+        infl2 = Inflections(pyinflect.INFL_FN, pyinflect.OVERRIDES_FN, self.snapshot_dir)
+        csv = Inflections(pyinflect.INFL_FN, pyinflect.OVERRIDES_FN)
+        self.assertEqual(infl2.infl_data, csv.infl_data)
+        self.assertEqual(infl2.overrides, csv.overrides)
+        self.assertEqual(infl2.getInflection('awake', 'VBN'), ('awaked',))
+        # Different overrides use a different snapshot
+        Inflections(pyinflect.INFL_FN, None, self.snapshot_dir)
+        self.assertEqual(len(self.getSnapshots()), 2)
+
+    def testRemoveStale(self):
+        # Saving a snapshot removes the ones for earlier versions of the same files
+        overrides_fn = os.path.join(self.tmp_dir, 'overrides.csv')
+        shutil.copy(pyinflect.OVERRIDES_FN, overrides_fn)
+        Inflections(pyinflect.INFL_FN, overrides_fn, self.snapshot_dir)
+        Inflections(pyinflect.INFL_FN, pyinflect.OVERRIDES_FN, self.snapshot_dir)
+        legacy_fn = Snapshot.snapshotFilename(self.snapshot_dir, 'a' * 40)
+        with open(legacy_fn, 'wb') as f:
+            f.write(Snapshot.magic)
+        self.assertEqual(len(self.getSnapshots()), 3)
+        with open(overrides_fn, 'a') as f:
+            f.write('walk,VBD,walkt\n')
+        infl = Inflections(pyinflect.INFL_FN, overrides_fn, self.snapshot_dir)
+        key = Snapshot.snapshotKey(pyinflect.INFL_FN, overrides_fn, pyinflect.__version__)
+        other_key = Snapshot.snapshotKey(pyinflect.INFL_FN, pyinflect.OVERRIDES_FN,
+                                         pyinflect.__version__)
+        self.assertEqual(sorted(self.getSnapshots()),
+                         sorted(Snapshot.snapshotFilename(self.snapshot_dir, k)
+                                for k in (key, other_key)))
+        self.assertEqual(infl.getInflection('walk', 'VBD'), ('walkt',))
+
+    def testCorruption(self):
+        Inflections(pyinflect.INFL_FN, pyinflect.OVERRIDES_FN, self.snapshot_dir)
+        fn = self.getSnapshots()[0]
+        with open(fn, 'r+b') as f:
+            f.truncate(1000)
+        infl = Inflections(pyinflect.INFL_FN, pyinflect.OVERRIDES_FN, self.snapshot_dir)
+        self.assertEqual(infl.getInflection('watch', 'VBD'), ('watched',))
+        # The snapshot is re-created
+        key = Snapshot.snapshotKey(pyinflect.INFL_FN, pyinflect.OVERRIDES_FN, pyinflect.__version__)
+        self.assertEqual(Snapshot.loadSnapshot(self.snapshot_dir, key)[1], infl.overrides)
+
+    def testVersionMismatch(self):
+        Inflections(pyinflect.INFL_FN, pyinflect.OVERRIDES_FN, self.snapshot_dir)
+        key = Snapshot.snapshotKey(pyinflect.INFL_FN, pyinflect.OVERRIDES_FN, '0.0.0')
+        self.assertEqual(Snapshot.loadSnapshot(self.snapshot_dir, key), None)
+
+
+if __name__ == '__main__':
+    # run all methods that start with 'test'
+    unittest.main()
@@ -0,0 +1,52 @@
+#!/usr/bin/python3
+import sys
+sys.path.insert(0, '..')    # make '..' first in the lib search path
+import unittest
+import spacy
+import pyinflect
+from   pyinflect import SpacyHashIndex
+
+
+class SpacyHashIndexTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.nlp = spacy.load('en_core_web_sm')
+        cls.index = SpacyHashIndex(pyinflect.InflectionEngine(), cls.nlp.vocab)
+
+    def testSameAsExtension(self):
+        sents = ['I seem to be eating.', 'BRAd Is Sitting on the GEESE.',
+                 'The Octopi were swimming faster than the boats.']
+        tags = ['VB', 'VBD', 'VBG', 'VBN', 'VBZ', 'NN', 'NNS', 'JJR', 'RBS', 'PRP']
+        for sent in sents:
+            doc = self.nlp(sent)
+            for token in doc:
+                for tag in tags:
+                    for form_num in (0, 1):
+                        self.assertEqual(self.index.getInflection(token, tag, form_num),
+                                         token._.inflect(tag, form_num))
+
+    def testInflectDoc(self):
+        doc = self.nlp('The men were Walking quickly.')
+        self.assertEqual(self.index.inflectDoc(doc, 'VBZ')[3], 'Walks')
+        self.assertEqual(self.index.inflectDoc(doc, 'VBZ'),
+                         [t._.inflect('VBZ') for t in doc])
+        self.assertEqual(self.index.inflectDoc(doc),
+                         [t._.inflect(t.tag_) for t in doc])
+
+    def testDataChanges(self):
+        # The index follows lexicons loaded after it was created
+        engine = pyinflect.Inflections(pyinflect.INFL_FN, pyinflect.OVERRIDES_FN)
+        index = SpacyHashIndex(engine, self.nlp.vocab)
+        doc = self.nlp('I zorble and walk.')
+        self.assertEqual(index.getInflection(doc[3], 'VBD'), 'walked')
+        engine.loadLexicon(['zorble,V,zorbled,<>,zorbling,zorbles', 'walk,V,walkt,<>,walking,walks'])
+        self.assertEqual(index.getInflection(doc[1], 'VBD'), engine.spacyGetInfl(doc[1], 'VBD'))
+        self.assertEqual(index.getInflection(doc[3], 'VBD'), 'walkt')
+        # Creating the engine set the extensions to it, so put back the default engine's
+        default = pyinflect.InflectionEngine()
+        pyinflect.Inflections.setSpacyExtensions(default.spacyGetInfl, default.reinflect)
+
+
+if __name__ == '__main__':
+    # run all methods that start with 'test'
+    unittest.main()
@@ -0,0 +1,74 @@
+#!/usr/bin/python3
+import sys
+sys.path.insert(0, '..')    # make '..' first in the lib search path
+import unittest
+import pyinflect
+from   pyinflect import UDTagMap
+try:
+    import spacy
+except ImportError:
+    spacy = None
+
+
+class UDTagMapTests(unittest.TestCase):
+    def testToPenn(self):
+        tag_map = UDTagMap()
+        self.assertEqual(tag_map.toPenn('VERB', 'Tense=Past|VerbForm=Part'), 'VBN')
+        self.assertEqual(tag_map.toPenn('VERB', 'VerbForm=Ger'), 'VBG')
+        self.assertEqual(tag_map.toPenn('VERB', 'Mood=Ind|Tense=Past|VerbForm=Fin'), 'VBD')
+        self.assertEqual(tag_map.toPenn('AUX', 'Mood=Ind|Number=Sing|Person=3|Tense=Pres|'
+                                        'VerbForm=Fin'), 'VBZ')
+        self.assertEqual(tag_map.toPenn('VERB', 'Mood=Ind|Tense=Pres|VerbForm=Fin'), 'VBP')
+        self.assertEqual(tag_map.toPenn('VERB', 'Mood=Imp|VerbForm=Fin'), 'VB')
+        self.assertEqual(tag_map.toPenn('VERB', ''), 'VB')
+        self.assertEqual(tag_map.toPenn('AUX', 'VerbForm=Fin|VerbType=Mod'), 'MD')
+        self.assertEqual(tag_map.toPenn('ADJ', 'Degree=Sup'), 'JJS')
+        self.assertEqual(tag_map.toPenn('ADV', ''), 'RB')
+        self.assertEqual(tag_map.toPenn('ADV', 'Degree=Cmp'), 'RBR')
+        self.assertEqual(tag_map.toPenn('NOUN', 'Number=Plur'), 'NNS')
+        self.assertEqual(tag_map.toPenn('PROPN', 'Number=Plur'), 'NNPS')
+        self.assertEqual(tag_map.toPenn('PROPN', ''), 'NNP')
+        self.assertEqual(tag_map.toPenn('DET', 'Definite=Def'), None)
+        self.assertEqual(tag_map.toPenn('VERB', {'VerbForm':'Part', 'Tense':'Past'}), 'VBN')
+        # Results are memoized
+        self.assertIn(('VERB', 'VerbForm=Ger'), tag_map.table)
+
+    def testRoundTrip(self):
+        tag_map = UDTagMap()
+        for tag in pyinflect.Inflections.tag_pos_types:
+            pos, morph = tag_map.toUD(tag)
+            self.assertEqual(tag_map._resolve(pos, tag_map._parseFeatures(morph)), tag)
+        self.assertEqual(tag_map.toUD('DT'), None)
+
+    def testMaxEntries(self):
+        tag_map = UDTagMap(max_entries=20)
+        for i in range(50):
+            self.assertEqual(tag_map.toPenn('NOUN', 'Number=Plur|Foo=%d' % i), 'NNS')
+        self.assertLessEqual(len(tag_map.table), 20)
+        self.assertEqual(tag_map.table[('VERB', 'VerbForm=Inf')], 'VB')
+
+    def testGetInflectionUD(self):
+        self.assertEqual(pyinflect.getInflectionUD('be', 'AUX', 'Tense=Past|VerbForm=Part'),
+                         ('been',))
+        self.assertEqual(pyinflect.getInflectionUD('Sit', 'VERB', 'Aspect=Prog|Tense=Pres|'
+                                                   'VerbForm=Part')[0], 'Sitting')
+        self.assertEqual(pyinflect.getInflectionUD('goose', 'NOUN', 'Number=Plur')[0], 'geese')
+        self.assertEqual(pyinflect.getInflectionUD('goose', 'DET', ''), None)
+        self.assertEqual(pyinflect.getInflectionUD('xqzvbn', 'VERB', 'VerbForm=Ger', True),
+                         ('xqzvbning', 'xqzvbnning'))
+
+    @unittest.skipIf(spacy is None, 'spaCy is not installed')
+    def testDocTags(self):
+        nlp = spacy.load('en_core_web_sm')
+        doc = nlp('The geese were swimming faster than the boats.')
+        tag_map = UDTagMap()
+        tags = tag_map.docTags(doc)
+        self.assertEqual(tags, [tag_map.toPenn(t.pos_, t.morph) for t in doc])
+        self.assertEqual(tags[1], 'NNS')
+        self.assertEqual(tags[3], 'VBG')
+        self.assertEqual(tag_map.docTags(doc), tags)
+
+
+if __name__ == '__main__':
+    # run all methods that start with 'test'
+    unittest.main()